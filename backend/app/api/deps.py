@@ -1,41 +1,93 @@
+import secrets
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.config import settings
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.models.employee import Employee
 from app.schemas.auth import TokenData
+from app.core.principal_cache import Principal, principal_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> Employee:
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def _decode_token(token: str) -> TokenData:
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         emp_id: str = payload.get("sub")
         if emp_id is None:
-            raise credentials_exception
-        token_data = TokenData(emp_id=emp_id)
+            raise _credentials_exception()
+        return TokenData(emp_id=emp_id, version=payload.get("ver", 0))
     except JWTError:
-        raise credentials_exception
-    
-    user = db.query(Employee).filter(Employee.emp_id == token_data.emp_id).first()
+        raise _credentials_exception()
+
+def _cache_principal(token_data: TokenData, user: Employee) -> Principal:
     if user is None:
-        raise credentials_exception
-    return user
+        raise _credentials_exception()
+    principal = Principal.from_employee(user)
+    principal_cache.set(token_data.version, principal)
+    return principal
+
+def _ensure_active(principal: Principal) -> Principal:
+    if not principal.is_active:
+        raise _credentials_exception()
+    return principal
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> Principal:
+    token_data = _decode_token(token)
 
-def get_current_admin(current_user: Employee = Depends(get_current_user)) -> Employee:
+    # Fast path: no DB round-trip when the principal is already cached
+    principal = principal_cache.get(token_data.emp_id, token_data.version)
+    if principal is None:
+        user = db.query(Employee).filter(Employee.emp_id == token_data.emp_id).first()
+        principal = _cache_principal(token_data, user)
+    return _ensure_active(principal)
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    token_data = _decode_token(token)
+
+    principal = principal_cache.get(token_data.emp_id, token_data.version)
+    if principal is None:
+        user = (await db.execute(
+            select(Employee).where(Employee.emp_id == token_data.emp_id)
+        )).scalar_one_or_none()
+        principal = _cache_principal(token_data, user)
+    return _ensure_active(principal)
+
+def _ensure_admin(current_user: Principal) -> Principal:
     if current_user.role not in ["admin", "hr"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
-    return current_user
\ No newline at end of file
+    return current_user
+
+def get_current_admin(current_user: Principal = Depends(get_current_user)) -> Principal:
+    return _ensure_admin(current_user)
+
+async def get_current_admin_async(current_user: Principal = Depends(get_current_user_async)) -> Principal:
+    return _ensure_admin(current_user)
+
+def get_metrics_scraper(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> None:
+    """Accept the static METRICS_TOKEN, which does not expire like a login token, or an Admin/HR token"""
+    if settings.METRICS_TOKEN and secrets.compare_digest(token.encode(), settings.METRICS_TOKEN.encode()):
+        return
+    _ensure_admin(get_current_user(token, db))
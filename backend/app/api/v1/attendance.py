@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.schemas.attendance import AttendanceCheckIn, AttendanceCheckOut, AttendanceResponse
+from app.api.deps import get_current_user
+from app.core.principal_cache import Principal
+from app.services import attendance as attendance_service
+
+router = APIRouter(prefix="/attendance", tags=["Attendance"])
+
+def _ensure_can_act_for(current_user: Principal, emp_id: str) -> None:
+    if current_user.role not in ["admin", "hr"] and current_user.emp_id != emp_id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+
+def _recorded_time(current_user: Principal, requested):
+    """Only Admin/HR may record a time other than now, e.g. to correct a missed punch"""
+    return requested if current_user.role in ["admin", "hr"] else None
+
+@router.post("/check-in", response_model=AttendanceResponse)
+def check_in(
+    data: AttendanceCheckIn,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """Check in for today (employees check in themselves, Admin/HR anyone)"""
+    _ensure_can_act_for(current_user, data.emp_id)
+    try:
+        return attendance_service.check_in(db, data.emp_id, _recorded_time(current_user, data.check_in_time))
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Employee not found")
+
+@router.post("/check-out", response_model=AttendanceResponse)
+def check_out(
+    data: AttendanceCheckOut,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """Check out of today's (or last night's) shift and record work/extra hours"""
+    _ensure_can_act_for(current_user, data.emp_id)
+    record = attendance_service.check_out(db, data.emp_id, _recorded_time(current_user, data.check_out_time))
+    if record is None:
+        raise HTTPException(status_code=400, detail="Not checked in today")
+    return record
\ No newline at end of file
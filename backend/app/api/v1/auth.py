@@ -5,7 +5,8 @@ from datetime import timedelta
 from app.database import get_db
 from app.models.employee import Employee
 from app.schemas.auth import Token, LoginRequest
-from app.core.security import verify_password, create_access_token
+from app.core.security import verify_and_update_password, create_access_token
+from app.core.principal_cache import token_version
 from app.config import settings
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -16,16 +17,24 @@ def login(
     db: Session = Depends(get_db)
 ):
     user = db.query(Employee).filter(Employee.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.password_hash):
+    verified, new_hash = False, None
+    if user:
+        verified, new_hash = verify_and_update_password(form_data.password, user.password_hash)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Transparently upgrade hashes created with an outdated cost factor
+    if new_hash:
+        user.password_hash = new_hash
+        db.commit()
+    
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.emp_id}, expires_delta=access_token_expires
+        data={"sub": user.emp_id, "ver": token_version(user)}, expires_delta=access_token_expires
     )
     
     return {
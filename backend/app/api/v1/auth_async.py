@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import timedelta
+from app.database import get_async_db
+from app.models.employee import Employee
+from app.schemas.auth import Token
+from app.core.security import averify_and_update_password, create_access_token
+from app.core.principal_cache import token_version
+from app.config import settings
+
+router = APIRouter(prefix="/auth", tags=["Authentication"])
+
+@router.post("/login", response_model=Token)
+async def login(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db)
+):
+    user = (await db.execute(
+        select(Employee).where(Employee.email == form_data.username)
+    )).scalar_one_or_none()
+    verified, new_hash = False, None
+    if user:
+        verified, new_hash = await averify_and_update_password(form_data.password, user.password_hash)
+    if not verified:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    # Transparently upgrade hashes created with an outdated cost factor
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
+        await db.refresh(user)
+    
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(
+        data={"sub": user.emp_id, "ver": token_version(user)}, expires_delta=access_token_expires
+    )
+    
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "role": user.role
+    }
\ No newline at end of file
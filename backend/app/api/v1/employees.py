@@ -1,22 +1,111 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, File, Header, HTTPException, Query, UploadFile, status
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional, Tuple, Union
 from app.database import get_db
-from app.models.employee import Employee, WorkingSchedule, EmployeeStatusTracker
+from app.models.employee import Employee, WorkingSchedule, EmployeeStatusTracker, RoleEnum
 from app.models.timeoff import TimeOffBalance
-from app.schemas.employee import EmployeeCreate, EmployeeResponse, EmployeeWithTempPassword
+from app.schemas.employee import (
+    EmployeeCreate,
+    EmployeeResponse,
+    EmployeePage,
+    EmployeeWithTempPassword,
+    EmployeeProfile,
+    EmployeeSearchResult,
+    DirectoryEntry,
+    DirectorySearchResult,
+    BulkOnboardingResult
+)
 from app.core.security import get_password_hash, generate_temp_password
 from app.core.utils import generate_employee_id
 from app.api.deps import get_current_user, get_current_admin
+from app.core.principal_cache import Principal
+from app.core.response_cache import (
+    employee_response_cache,
+    etag_matches,
+    json_response,
+    make_etag,
+    not_modified,
+    serialize
+)
+from app.core.fast_json import FastJSONResponse, dumps
+from app.core.search_index import employee_search_index
+from app.services.hierarchy import link_employees
+from app.services.profiles import load_profiles
+from app.services import search as search_service
+from app.services.onboarding import (
+    default_schedule,
+    default_timeoff_balance,
+    default_status,
+    iter_upload_rows,
+    onboard_employees
+)
 from datetime import datetime, date
 
 router = APIRouter(prefix="/employees", tags=["Employees"])
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 50
+
+EMPLOYEE_RESPONSE_COLUMNS = [getattr(Employee, field) for field in EmployeeResponse.model_fields]
+DIRECTORY_COLUMNS = [getattr(Employee, field) for field in DirectoryEntry.model_fields]
+
+def listing_scope(current_user: Principal) -> str:
+    """Who a listing is rendered for: Admin/HR share one view, everyone else sees only themselves"""
+    return "all" if current_user.role in ["admin", "hr"] else current_user.emp_id
+
+def employee_listing_criteria(current_user: Principal, **filters) -> list:
+    if current_user.role in ["admin", "hr"]:
+        criteria = [Employee.is_active == True]
+    else:
+        criteria = [Employee.emp_id == current_user.emp_id]
+
+    # department, location, manager_id, role, company_code
+    for column, value in filters.items():
+        if value is not None:
+            criteria.append(getattr(Employee, column) == value)
+    return criteria
+
+def listing_window(columns: list, current_user: Principal, cursor: Optional[str], limit: int, **filters):
+    """The rows of one keyset page, plus one to tell whether there is a next page"""
+    stmt = select(*columns).where(*employee_listing_criteria(current_user, **filters))
+
+    # Keyset pagination on the primary key
+    if cursor is not None:
+        stmt = stmt.where(Employee.emp_id > cursor)
+    return stmt.order_by(Employee.emp_id).limit(limit + 1)
+
+def employee_listing_statement(current_user: Principal, cursor: Optional[str], limit: int, **filters):
+    """Keyset-paginated listing that only selects the columns EmployeeResponse needs"""
+    return listing_window(EMPLOYEE_RESPONSE_COLUMNS, current_user, cursor, limit, **filters)
+
+def listing_version_statement(current_user: Principal, cursor: Optional[str], limit: int, **filters):
+    """Latest change, row count and last emp_id of one page's window; any write to the page changes one of them"""
+    # Same index range as the page itself, so a 304 costs no more than the page would
+    window = listing_window(
+        [Employee.emp_id, Employee.updated_at], current_user, cursor, limit, **filters
+    ).subquery("page_window")
+    return select(func.max(window.c.updated_at), func.count(), func.max(window.c.emp_id))
+
+def listing_etag(current_user: Principal, cursor: Optional[str], limit: int, filters: dict, version) -> Tuple[str, tuple]:
+    """ETag and response cache key of one listing page"""
+    key = ("list", listing_scope(current_user), cursor, limit, tuple(sorted(filters.items())))
+    return make_etag(*key, *version), key
+
+def employee_page(rows: list, limit: int) -> dict:
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1].emp_id
+    return {"items": rows, "next_cursor": next_cursor}
+
 @router.post("/register", response_model=EmployeeWithTempPassword)
 def register_employee(
     employee_data: EmployeeCreate,
     db: Session = Depends(get_db),
-    current_admin: Employee = Depends(get_current_admin)
+    current_admin: Principal = Depends(get_current_admin)
 ):
     """Only Admin/HR can register new employees"""
     
@@ -55,37 +144,20 @@ def register_employee(
     db.add(new_employee)
     db.flush()
     
+    # Add to the reporting hierarchy
+    link_employees(db, [emp_id])
+    
     # Create working schedule
-    schedule = WorkingSchedule(
-        emp_id=emp_id,
-        total_working_hours=8,
-        break_time_hours=1,
-        working_days_per_month=22,
-        effective_from=employee_data.date_of_joining
-    )
-    db.add(schedule)
+    db.add(WorkingSchedule(**default_schedule(emp_id, employee_data.date_of_joining)))
     
     # Create time off balance
-    current_year = datetime.now().year
-    balance = TimeOffBalance(
-        emp_id=emp_id,
-        year=current_year,
-        paid_time_off_total=12.0,
-        sick_leave_total=7.0,
-        paid_time_off_available=12.0,
-        sick_leave_available=7.0
-    )
-    db.add(balance)
+    db.add(TimeOffBalance(**default_timeoff_balance(emp_id, datetime.now().year)))
     
     # Create status tracker
-    status_tracker = EmployeeStatusTracker(
-        emp_id=emp_id,
-        current_status="absent",
-        status_indicator="yellow"
-    )
-    db.add(status_tracker)
+    db.add(EmployeeStatusTracker(**default_status(emp_id)))
     
     db.commit()
+    employee_search_index.changed([emp_id])
     db.refresh(new_employee)
     
     return {
@@ -93,31 +165,126 @@ def register_employee(
         "temporary_password": temp_password
     }
 
-@router.get("/", response_model=List[EmployeeResponse])
+@router.post("/bulk", response_model=BulkOnboardingResult)
+def bulk_register_employees(
+    file: UploadFile = File(..., description="CSV with a header row, or JSONL with one employee per line"),
+    format: Optional[str] = Query(None, pattern="^(csv|jsonl)$"),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Only Admin/HR can onboard employees in bulk. Rows that fail are reported, not fatal."""
+    if format is None:
+        filename = (file.filename or "").lower()
+        if filename.endswith(".csv") or file.content_type == "text/csv":
+            format = "csv"
+        elif filename.endswith((".jsonl", ".ndjson")) or file.content_type in ("application/x-ndjson", "application/jsonl"):
+            format = "jsonl"
+        else:
+            raise HTTPException(status_code=400, detail="Could not detect upload format, pass ?format=csv or ?format=jsonl")
+    
+    return onboard_employees(db, iter_upload_rows(file.file, format))
+
+@router.get("/", response_model=EmployeePage)
 def get_all_employees(
+    cursor: Optional[str] = Query(None, description="emp_id of the last row on the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    department: Optional[str] = None,
+    location: Optional[str] = None,
+    manager_id: Optional[str] = None,
+    role: Optional[RoleEnum] = None,
+    company_code: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
-    current_user: Employee = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """Get all employees (Admin/HR see all, employees see only themselves)"""
-    if current_user.role in ["admin", "hr"]:
-        employees = db.query(Employee).filter(Employee.is_active == True).all()
-    else:
-        employees = [current_user]
+    filters = {
+        "department": department,
+        "location": location,
+        "manager_id": manager_id,
+        "role": role,
+        "company_code": company_code
+    }
+    version = db.execute(listing_version_statement(current_user, cursor, limit, **filters)).one()
+    etag, key = listing_etag(current_user, cursor, limit, filters, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
     
-    return employees
+    body = employee_response_cache.get(key, etag)
+    if body is None:
+        stmt = employee_listing_statement(current_user, cursor, limit, **filters)
+        body = dumps(employee_page(db.execute(stmt).all(), limit))
+        employee_response_cache.set(key, etag, body)
+    return json_response(body, etag)
+
+@router.get("/search", response_model=List[Union[EmployeeSearchResult, DirectorySearchResult]])
+def search_employees(
+    q: str = Query(..., min_length=2, max_length=100, description="Words or word prefixes of a name, email, department, location, skill or certification; small typos are tolerated"),
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """Search the employee directory, best matches first (Admin/HR get full records, others directory entries)"""
+    columns = EMPLOYEE_RESPONSE_COLUMNS if current_user.role in ["admin", "hr"] else DIRECTORY_COLUMNS
+    ranked = search_service.search_employees(db, q, limit)
+    rows = {
+        row.emp_id: row
+        for row in db.execute(
+            select(*columns)
+            .where(Employee.emp_id.in_([emp_id for emp_id, _ in ranked]), Employee.is_active == True)
+        )
+    }
+    return FastJSONResponse([
+        {**rows[emp_id]._asdict(), "score": round(score, 4)}
+        for emp_id, score in ranked
+        if emp_id in rows
+    ])
+
+@router.post("/profiles", response_model=List[EmployeeProfile])
+def get_employee_profiles(
+    emp_ids: List[str] = Body(..., max_length=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Full profiles for many employees in a fixed number of queries (Admin/HR only)"""
+    return load_profiles(db, emp_ids)
+
+@router.get("/{emp_id}/profile", response_model=EmployeeProfile)
+def get_employee_profile(
+    emp_id: str,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """Employee with personal info, bank details, salary, schedule, status and this year's balance"""
+    if current_user.role not in ["admin", "hr"] and current_user.emp_id != emp_id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    profiles = load_profiles(db, [emp_id])
+    if not profiles:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    return profiles[0]
 
 @router.get("/{emp_id}", response_model=EmployeeResponse)
 def get_employee(
     emp_id: str,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
-    current_user: Employee = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """Get employee details"""
     if current_user.role not in ["admin", "hr"] and current_user.emp_id != emp_id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    employee = db.query(Employee).filter(Employee.emp_id == emp_id).first()
-    if not employee:
+    updated_at = db.execute(select(Employee.updated_at).where(Employee.emp_id == emp_id)).first()
+    if not updated_at:
         raise HTTPException(status_code=404, detail="Employee not found")
+    etag, key = make_etag("employee", emp_id, *updated_at), ("employee", emp_id)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
     
-    return employee
+    body = employee_response_cache.get(key, etag)
+    if body is None:
+        employee = db.execute(select(*EMPLOYEE_RESPONSE_COLUMNS).where(Employee.emp_id == emp_id)).one()
+        body = serialize(EmployeeResponse, employee)
+        employee_response_cache.set(key, etag, body)
+    return json_response(body, etag)
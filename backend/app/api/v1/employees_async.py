@@ -0,0 +1,156 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.database import get_async_db
+from app.models.employee import Employee, WorkingSchedule, EmployeeStatusTracker, RoleEnum
+from app.models.timeoff import TimeOffBalance
+from app.schemas.employee import EmployeeCreate, EmployeeResponse, EmployeePage, EmployeeWithTempPassword
+from app.core.security import aget_password_hash, generate_temp_password
+from app.core.utils import agenerate_employee_id
+from app.api.deps import get_current_user_async, get_current_admin_async
+from app.api.v1.employees import (
+    DEFAULT_PAGE_SIZE,
+    EMPLOYEE_RESPONSE_COLUMNS,
+    MAX_PAGE_SIZE,
+    employee_listing_statement,
+    employee_page,
+    listing_etag,
+    listing_version_statement
+)
+from app.core.principal_cache import Principal
+from app.core.response_cache import (
+    employee_response_cache,
+    etag_matches,
+    json_response,
+    make_etag,
+    not_modified,
+    serialize
+)
+from app.core.fast_json import dumps
+from app.core.search_index import employee_search_index
+from app.services.hierarchy import link_statement
+from app.services.onboarding import default_schedule, default_timeoff_balance, default_status
+from datetime import datetime
+
+# Async counterparts of the routes in employees.py, mounted in their place when
+# DATABASE_ASYNC is on. Routes without an async version stay on the sync router.
+router = APIRouter(prefix="/employees", tags=["Employees"])
+
+@router.post("/register", response_model=EmployeeWithTempPassword)
+async def register_employee(
+    employee_data: EmployeeCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: Principal = Depends(get_current_admin_async)
+):
+    """Only Admin/HR can register new employees"""
+    
+    # Check if email already exists
+    existing = (await db.execute(
+        select(Employee.emp_id).where(Employee.email == employee_data.email)
+    )).first()
+    if existing:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    
+    # Generate employee ID
+    emp_id = await agenerate_employee_id(
+        db,
+        employee_data.company_code,
+        employee_data.first_name,
+        employee_data.last_name
+    )
+    
+    # Generate temporary password
+    temp_password = generate_temp_password()
+    
+    # Create employee
+    new_employee = Employee(
+        emp_id=emp_id,
+        company_code=employee_data.company_code,
+        first_name=employee_data.first_name,
+        last_name=employee_data.last_name,
+        email=employee_data.email,
+        phone=employee_data.phone,
+        password_hash=await aget_password_hash(temp_password),
+        role=employee_data.role,
+        department=employee_data.department,
+        manager_id=employee_data.manager_id,
+        location=employee_data.location,
+        date_of_joining=employee_data.date_of_joining
+    )
+    
+    db.add(new_employee)
+    await db.flush()
+    
+    await db.execute(link_statement([emp_id]))
+    
+    db.add(WorkingSchedule(**default_schedule(emp_id, employee_data.date_of_joining)))
+    db.add(TimeOffBalance(**default_timeoff_balance(emp_id, datetime.now().year)))
+    db.add(EmployeeStatusTracker(**default_status(emp_id)))
+    
+    await db.commit()
+    employee_search_index.changed([emp_id])
+    await db.refresh(new_employee)
+    
+    return {
+        "employee": new_employee,
+        "temporary_password": temp_password
+    }
+
+@router.get("/", response_model=EmployeePage)
+async def get_all_employees(
+    cursor: Optional[str] = Query(None, description="emp_id of the last row on the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    department: Optional[str] = None,
+    location: Optional[str] = None,
+    manager_id: Optional[str] = None,
+    role: Optional[RoleEnum] = None,
+    company_code: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_user_async)
+):
+    """Get all employees (Admin/HR see all, employees see only themselves)"""
+    filters = {
+        "department": department,
+        "location": location,
+        "manager_id": manager_id,
+        "role": role,
+        "company_code": company_code
+    }
+    version = (await db.execute(listing_version_statement(current_user, cursor, limit, **filters))).one()
+    etag, key = listing_etag(current_user, cursor, limit, filters, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    body = employee_response_cache.get(key, etag)
+    if body is None:
+        stmt = employee_listing_statement(current_user, cursor, limit, **filters)
+        body = dumps(employee_page((await db.execute(stmt)).all(), limit))
+        employee_response_cache.set(key, etag, body)
+    return json_response(body, etag)
+
+@router.get("/{emp_id}", response_model=EmployeeResponse)
+async def get_employee(
+    emp_id: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_user_async)
+):
+    """Get employee details"""
+    if current_user.role not in ["admin", "hr"] and current_user.emp_id != emp_id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    updated_at = (await db.execute(select(Employee.updated_at).where(Employee.emp_id == emp_id))).first()
+    if not updated_at:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    etag, key = make_etag("employee", emp_id, *updated_at), ("employee", emp_id)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    body = employee_response_cache.get(key, etag)
+    if body is None:
+        employee = (await db.execute(select(*EMPLOYEE_RESPONSE_COLUMNS).where(Employee.emp_id == emp_id))).one()
+        body = serialize(EmployeeResponse, employee)
+        employee_response_cache.set(key, etag, body)
+    return json_response(body, etag)
\ No newline at end of file
@@ -0,0 +1,55 @@
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from app.database import SessionLocal
+from app.api.deps import get_current_admin
+from app.core.principal_cache import Principal
+from app.services import exports as export_service
+
+router = APIRouter(prefix="/exports", tags=["Exports"])
+
+FORMAT_PATTERN = "^(csv|jsonl|parquet)$"
+
+def _export_response(stmt, fmt: str, name: str) -> StreamingResponse:
+    if fmt == "parquet" and not export_service.parquet_available():
+        raise HTTPException(status_code=400, detail="Parquet export is not available on this server (pyarrow is not installed)")
+    media_type, extension = export_service.FORMATS[fmt]
+    return StreamingResponse(
+        export_service.stream_export(SessionLocal, stmt, fmt),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{name}.{extension}"'}
+    )
+
+@router.get("/attendance")
+def export_attendance(
+    start_date: date,
+    end_date: date,
+    emp_id: Optional[str] = None,
+    format: str = Query("csv", pattern=FORMAT_PATTERN),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Only Admin/HR can export attendance for a date range"""
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="end_date is before start_date")
+    stmt = export_service.attendance_statement(start_date, end_date, emp_id)
+    return _export_response(stmt, format, f"attendance_{start_date}_{end_date}")
+
+@router.get("/employees")
+def export_employees(
+    include_inactive: bool = False,
+    format: str = Query("csv", pattern=FORMAT_PATTERN),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Only Admin/HR can export the employee directory"""
+    return _export_response(export_service.employees_statement(include_inactive), format, "employees")
+
+@router.get("/payroll")
+def export_payroll(
+    year: int = Query(..., ge=2000, le=2100),
+    month: int = Query(..., ge=1, le=12),
+    format: str = Query("csv", pattern=FORMAT_PATTERN),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Only Admin/HR can export a month's payroll results"""
+    return _export_response(export_service.payroll_statement(year, month), format, f"payroll_{year}_{month:02d}")
\ No newline at end of file
@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.database import get_db
+from app.models.job import Job
+from app.schemas.job import MonthlyJobCreate, JobResponse, JobPage
+from app.api.deps import get_current_admin
+from app.core.principal_cache import Principal
+from app.services import jobs as job_service
+from app.services.payroll import ensure_month_ended
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+@router.post("/attendance-summaries", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def enqueue_attendance_summaries(
+    data: MonthlyJobCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Rebuild a month's attendance summaries in the background (Admin/HR only)"""
+    return job_service.enqueue(db, "attendance_summaries", data.model_dump(), created_by=current_admin.emp_id)
+
+@router.post("/payroll", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def enqueue_payroll(
+    data: MonthlyJobCreate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Run a month's payroll in the background (Admin/HR only)"""
+    try:
+        ensure_month_ended(data.year, data.month)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return job_service.enqueue(db, "payroll", data.model_dump(), created_by=current_admin.emp_id)
+
+@router.get("/", response_model=JobPage)
+def get_jobs(
+    cursor: Optional[int] = Query(None, description="job_id of the last row on the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    kind: Optional[str] = None,
+    job_status: Optional[str] = Query(None, alias="status"),
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Jobs, newest first (Admin/HR only)"""
+    stmt = select(Job)
+    if kind is not None:
+        stmt = stmt.where(Job.kind == kind)
+    if job_status is not None:
+        stmt = stmt.where(Job.status == job_status)
+    if cursor is not None:
+        stmt = stmt.where(Job.job_id < cursor)
+    rows = db.execute(stmt.order_by(Job.job_id.desc()).limit(limit + 1)).scalars().all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1].job_id
+    return {"items": rows, "next_cursor": next_cursor}
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Status, progress and result of a job (Admin/HR only)"""
+    job = db.get(Job, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
\ No newline at end of file
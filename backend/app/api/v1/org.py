@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.database import get_db
+from app.models.employee import Employee, EmployeeHierarchy
+from app.schemas.employee import OrgMember, ManagerAssignment
+from app.api.deps import get_current_user, get_current_admin
+from app.api.v1.employees import EMPLOYEE_RESPONSE_COLUMNS
+from app.core.principal_cache import Principal
+from app.core.fast_json import FastJSONResponse
+from app.services import hierarchy as hierarchy_service
+
+router = APIRouter(prefix="/org", tags=["Org Chart"])
+
+MAX_SUBTREE_DEPTH = hierarchy_service.MAX_DEPTH
+
+def _ensure_can_view(db: Session, current_user: Principal, emp_id: str) -> None:
+    """Admin/HR see anyone; everyone else sees themselves and the people below them"""
+    if current_user.role in ["admin", "hr"]:
+        return
+    if not hierarchy_service.is_in_subtree(db, current_user.emp_id, emp_id):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+
+def _members(db: Session, member_column, *criteria, order_by) -> FastJSONResponse:
+    """Employees at `member_column` of the closure rows matching `criteria`, with their depth"""
+    return FastJSONResponse(db.execute(
+        select(*EMPLOYEE_RESPONSE_COLUMNS, Employee.manager_id, EmployeeHierarchy.depth)
+        .join(Employee, Employee.emp_id == member_column)
+        .where(*criteria)
+        .order_by(*order_by)
+    ).all())
+
+@router.get("/{emp_id}/reports", response_model=List[OrgMember])
+def get_direct_reports(
+    emp_id: str,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """Employees reporting directly to emp_id"""
+    _ensure_can_view(db, current_user, emp_id)
+    return _members(
+        db,
+        EmployeeHierarchy.descendant_id,
+        EmployeeHierarchy.ancestor_id == emp_id,
+        EmployeeHierarchy.depth == 1,
+        order_by=[Employee.emp_id]
+    )
+
+@router.get("/{emp_id}/subtree", response_model=List[OrgMember])
+def get_subtree(
+    emp_id: str,
+    max_depth: Optional[int] = Query(None, ge=1, le=MAX_SUBTREE_DEPTH),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """Everyone below emp_id, nearest levels first, optionally only down to max_depth levels"""
+    _ensure_can_view(db, current_user, emp_id)
+    criteria = [EmployeeHierarchy.ancestor_id == emp_id, EmployeeHierarchy.depth > 0]
+    if max_depth is not None:
+        criteria.append(EmployeeHierarchy.depth <= max_depth)
+    return _members(db, EmployeeHierarchy.descendant_id, *criteria, order_by=[EmployeeHierarchy.depth, Employee.emp_id])
+
+@router.get("/{emp_id}/chain", response_model=List[OrgMember])
+def get_management_chain(
+    emp_id: str,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """Managers above emp_id, from the direct manager up to the top; depth counts levels up"""
+    _ensure_can_view(db, current_user, emp_id)
+    return _members(
+        db,
+        EmployeeHierarchy.ancestor_id,
+        EmployeeHierarchy.descendant_id == emp_id,
+        EmployeeHierarchy.depth > 0,
+        order_by=[EmployeeHierarchy.depth]
+    )
+
+@router.put("/{emp_id}/manager", response_model=List[OrgMember])
+def set_manager(
+    emp_id: str,
+    assignment: ManagerAssignment,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(get_current_admin)
+):
+    """Only Admin/HR can change who an employee reports to; returns the new chain"""
+    if db.get(Employee, emp_id) is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    try:
+        hierarchy_service.move_employee(db, emp_id, assignment.manager_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return get_management_chain(emp_id, db, current_admin)
\ No newline at end of file
@@ -0,0 +1,83 @@
+import asyncio
+import json
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import AsyncIterator, Optional, Tuple
+from app.config import settings
+from app.database import get_db, SessionLocal
+from app.api.deps import get_current_user
+from app.core.principal_cache import Principal
+from app.core.presence import presence_index
+
+router = APIRouter(prefix="/presence", tags=["Presence"])
+
+def _refresh() -> None:
+    with SessionLocal() as db:
+        presence_index.refresh_if_stale(db)
+
+def _event_id(version: int) -> str:
+    return f"{presence_index.epoch}:{version}"
+
+def _parse_event_id(event_id: Optional[str]) -> Optional[Tuple[str, int]]:
+    """(epoch, version) from an "<epoch>:<version>" event id, or None if it is missing or malformed"""
+    epoch, _, version = (event_id or "").partition(":")
+    return (epoch, int(version)) if version.isdigit() else None
+
+def _event(name: str, version: int, data: dict) -> str:
+    return f"id: {_event_id(version)}\nevent: {name}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+async def presence_events(last_event_id: Optional[str]) -> AsyncIterator[str]:
+    """A `snapshot` event (skipped when resuming within the buffered changes), then a `diff` event per change burst"""
+    if presence_index.is_stale():
+        await asyncio.to_thread(_refresh)
+
+    resume_from = _parse_event_id(last_event_id)
+    changes = presence_index.changes_since(resume_from[1], resume_from[0]) if resume_from else None
+    if changes is None:
+        version, statuses = presence_index.snapshot()
+        yield _event("snapshot", version, statuses)
+    else:
+        version, diff = changes
+        if diff:
+            yield _event("diff", version, diff)
+
+    while True:
+        await presence_index.wait(version, settings.PRESENCE_HEARTBEAT_SECONDS)
+        if presence_index.is_stale():
+            await asyncio.to_thread(_refresh)
+
+        changes = presence_index.changes_since(version)
+        if changes is None:
+            version, statuses = presence_index.snapshot()
+            yield _event("snapshot", version, statuses)
+        elif changes[1]:
+            version, diff = changes
+            yield _event("diff", version, diff)
+        else:
+            yield ": keep-alive\n\n"
+
+@router.get("")
+def get_presence(
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """Current status of every active employee as {emp_id: [current_status, status_indicator]}"""
+    presence_index.refresh_if_stale(db)
+    version, statuses = presence_index.snapshot()
+    return {"version": _event_id(version), "statuses": statuses}
+
+@router.get("/stream")
+def stream_presence(
+    last_event_id: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """Server-Sent Events: a snapshot, then diffs (null = left the board); resumes from Last-Event-ID or a GET version"""
+    # Hand the connection back now rather than when the stream ends
+    db.close()
+    return StreamingResponse(
+        presence_events(last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
\ No newline at end of file
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends
+from app.database import engine, async_engine
+from app.api.deps import get_current_admin
+from app.core.principal_cache import Principal
+from app.core.pool_metrics import PoolMetrics, pool_metrics
+
+router = APIRouter(prefix="/system", tags=["System"])
+
+@router.get("/db-pool")
+def get_db_pool_metrics(current_admin: Principal = Depends(get_current_admin)):
+    """Live connection pool usage and checkout wait times (Admin/HR only)"""
+    pools = {"sync": engine.pool}
+    if async_engine is not None:
+        pools["async"] = async_engine.pool
+    return {
+        name: pool_metrics.get(name, PoolMetrics()).snapshot(pool)
+        for name, pool in pools.items()
+        if hasattr(pool, "checkedout")
+    }
\ No newline at end of file
@@ -0,0 +1,76 @@
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.database import get_db
+from app.models.employee import Employee
+from app.models.timeoff import TimeOffRequest
+from app.schemas.timeoff import (
+    TimeOffRequestCreate,
+    TimeOffRequestResponse,
+    TimeOffRequestPage,
+    TimeOffApproval,
+    TimeOffApprovalResult
+)
+from app.api.deps import get_current_user
+from app.core.principal_cache import Principal
+from app.core.fast_json import FastJSONResponse
+from app.services import timeoff as timeoff_service
+
+router = APIRouter(prefix="/timeoff", tags=["Time Off"])
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+MAX_DECISIONS = 1000
+
+TIME_OFF_REQUEST_RESPONSE_COLUMNS = [getattr(TimeOffRequest, field) for field in TimeOffRequestResponse.model_fields]
+
+@router.post("/requests", response_model=TimeOffRequestResponse)
+def submit_time_off_request(
+    data: TimeOffRequestCreate,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """Request time off for yourself"""
+    try:
+        return timeoff_service.submit_request(db, current_user.emp_id, data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/requests/pending", response_model=TimeOffRequestPage)
+def get_pending_approvals(
+    cursor: Optional[int] = Query(None, description="request_id of the last row on the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """Pending requests awaiting your decision (managers see direct reports, Admin/HR see all)"""
+    stmt = select(*TIME_OFF_REQUEST_RESPONSE_COLUMNS).where(
+        TimeOffRequest.status == "pending",
+        TimeOffRequest.emp_id != current_user.emp_id
+    )
+    if current_user.role not in ["admin", "hr"]:
+        stmt = stmt.where(TimeOffRequest.emp_id.in_(
+            select(Employee.emp_id).where(Employee.manager_id == current_user.emp_id)
+        ))
+    if cursor is not None:
+        stmt = stmt.where(TimeOffRequest.request_id > cursor)
+    rows = db.execute(stmt.order_by(TimeOffRequest.request_id).limit(limit + 1)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1].request_id
+    return FastJSONResponse({"items": rows, "next_cursor": next_cursor})
+
+@router.post("/requests/decisions", response_model=TimeOffApprovalResult)
+def decide_time_off_requests(
+    decisions: List[TimeOffApproval] = Body(..., max_length=MAX_DECISIONS),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """Approve or reject many requests in one transaction"""
+    try:
+        return timeoff_service.decide_requests(db, current_user, decisions)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
@@ -6,6 +6,55 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    # bcrypt cost factor; hashes below it are upgraded on the next login
+    PASSWORD_HASH_ROUNDS: int = 12
+    # Processes used for hashing (None = one per core, 0 = hash inline)
+    PASSWORD_HASH_WORKERS: Optional[int] = None
+    # Connection pool sizing; see GET /api/v1/system/db-pool for live usage
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Running behind PgBouncer in transaction pooling mode: no server-side prepared statements
+    DB_PGBOUNCER_MODE: bool = False
+    # Monthly attendance partitions kept created ahead of today (PostgreSQL)
+    ATTENDANCE_PARTITION_MONTHS_AHEAD: int = 3
+    # Where archived attendance months go, e.g. a tablespace on compressed storage
+    # or a compressing table access method such as "columnar" (PostgreSQL 15+)
+    ATTENDANCE_ARCHIVE_TABLESPACE: Optional[str] = None
+    ATTENDANCE_ARCHIVE_ACCESS_METHOD: Optional[str] = None
+    # How often the job workers create upcoming partitions and archive finalized months (0 = only via the CLI)
+    ATTENDANCE_STORAGE_INTERVAL_SECONDS: int = 86400
+    # How often the job workers move employees on and off leave on the presence board as leave starts and ends (0 = never)
+    LEAVE_PRESENCE_INTERVAL_SECONDS: int = 3600
+    # Serialized employee directory/profile bodies kept for ETag hits
+    RESPONSE_CACHE_MAX_ENTRIES: int = 2000
+    # Presence board: resync from the DB at most this often; SSE keep-alive interval
+    PRESENCE_RESYNC_SECONDS: int = 30
+    PRESENCE_HEARTBEAT_SECONDS: int = 15
+    # Employee search without PostgreSQL: other workers' writes reach this process's index at most this late
+    SEARCH_RESYNC_SECONDS: int = 30
+    # Per-request latency/SQL metrics at GET /metrics and in Server-Timing headers
+    METRICS_ENABLED: bool = True
+    # Static bearer token for Prometheus to scrape GET /metrics with (unset = admin tokens only)
+    METRICS_TOKEN: Optional[str] = None
+    # Same statement run more often than this in one request is logged as a likely N+1
+    N_PLUS_ONE_THRESHOLD: int = 10
+    # Background jobs: worker threads started with the API (0 = run `python -m app.services.jobs`
+    # separately), idle poll interval, retries with exponential backoff, and how long a running
+    # job may go without progress before it is assumed lost and requeued
+    JOB_WORKERS: int = 0
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_BACKOFF_SECONDS: float = 10
+    JOB_LOCK_TIMEOUT_SECONDS: int = 3600
+    # Serve the hot auth/employee routes with async handlers on an AsyncEngine
+    DATABASE_ASYNC: bool = False
+    # Defaults to DATABASE_URL with the asyncpg/aiosqlite driver swapped in
+    ASYNC_DATABASE_URL: Optional[str] = None
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,32 @@
+"""
+Fast JSON encoding for list endpoints.
+
+Rows selected as plain columns are encoded straight to bytes by orjson,
+skipping per-object Pydantic validation. The output matches what the
+endpoint's response_model would produce (dates, times and datetimes in ISO
+format, Decimals as strings, enums by value), so the route keeps its
+response_model for the OpenAPI schema while the body is built here. Callers
+must select exactly the fields of that response model.
+"""
+from decimal import Decimal
+import orjson
+from fastapi import Response
+
+def _default(value):
+    # Result rows (sqlalchemy Row) become objects keyed by column label
+    if hasattr(value, "_asdict"):
+        return value._asdict()
+    # Pydantic renders Decimal as a string in JSON mode
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps(data) -> bytes:
+    return orjson.dumps(data, default=_default)
+
+class FastJSONResponse(Response):
+    """JSONResponse encoded with dumps; return it to bypass response_model serialization"""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
\ No newline at end of file
@@ -0,0 +1,151 @@
+import asyncio
+import secrets
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Set, Tuple
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.employee import Employee, EmployeeStatusTracker
+
+# (current_status, status_indicator)
+Presence = Tuple[str, str]
+
+class PresenceIndex:
+    """
+    In-process copy of every active employee's status, versioned so that
+    dashboards can fetch one snapshot and then follow small diffs.
+
+    Writes in this process update it directly. Writes made by other worker
+    processes are picked up by a resync from employee_status_tracker at most
+    every `resync_seconds`, so the database sees one query per worker per
+    interval however many dashboards are open.
+
+    Versions only count changes seen by this process, so they are paired
+    with a random `epoch`: a client resuming with a version from another
+    worker, or from before a restart, gets a new snapshot.
+    """
+
+    def __init__(self, resync_seconds: float, max_changes: int = 10000):
+        self.resync_seconds = resync_seconds
+        self._statuses: Dict[str, Presence] = {}
+        # (version, emp_id, presence or None when the employee left the board)
+        self._changes: Deque[Tuple[int, str, Optional[Presence]]] = deque(maxlen=max_changes)
+        self._version = 0
+        self.epoch = secrets.token_hex(4)
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    def _record(self, emp_id: str, presence: Optional[Presence]) -> None:
+        # Caller holds self._lock
+        if self._statuses.get(emp_id) == presence:
+            return
+        if presence is None:
+            del self._statuses[emp_id]
+        else:
+            self._statuses[emp_id] = presence
+        self._version += 1
+        self._changes.append((self._version, emp_id, presence))
+
+    def _notify(self) -> None:
+        with self._lock:
+            waiters = list(self._waiters)
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(waiter.set)
+
+    def update(self, emp_id: str, current_status: str, status_indicator: str) -> None:
+        """Record a committed status change"""
+        self.update_many([(emp_id, current_status, status_indicator)])
+
+    def update_many(self, rows: Iterable[Tuple[str, str, str]]) -> None:
+        with self._lock:
+            version = self._version
+            for emp_id, current_status, status_indicator in rows:
+                self._record(emp_id, (current_status, status_indicator))
+            changed = self._version != version
+        if changed:
+            self._notify()
+
+    def _load(self, rows: Iterable[Tuple[str, str, str]]) -> None:
+        loaded = {emp_id: (current_status, status_indicator) for emp_id, current_status, status_indicator in rows}
+        with self._lock:
+            version = self._version
+            for emp_id in self._statuses.keys() - loaded.keys():
+                self._record(emp_id, None)
+            for emp_id, presence in loaded.items():
+                self._record(emp_id, presence)
+            self._loaded_at = time.monotonic()
+            changed = self._version != version
+        if changed:
+            self._notify()
+
+    def is_stale(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.resync_seconds
+
+    def refresh_if_stale(self, db: Session) -> None:
+        """Reload from employee_status_tracker when the resync interval has passed"""
+        if not self.is_stale():
+            return
+        # Only one caller reloads; the rest keep serving the current copy,
+        # except before the first load, when there is nothing to serve yet
+        if not self._refresh_lock.acquire(blocking=self._loaded_at is None):
+            return
+        try:
+            if self.is_stale():
+                self._load(db.execute(
+                    select(
+                        EmployeeStatusTracker.emp_id,
+                        EmployeeStatusTracker.current_status,
+                        EmployeeStatusTracker.status_indicator
+                    )
+                    .join(Employee, Employee.emp_id == EmployeeStatusTracker.emp_id)
+                    .where(Employee.is_active == True)
+                ).all())
+        finally:
+            self._refresh_lock.release()
+
+    def snapshot(self) -> Tuple[int, Dict[str, Presence]]:
+        with self._lock:
+            return self._version, dict(self._statuses)
+
+    def changes_since(
+        self,
+        version: int,
+        epoch: Optional[str] = None
+    ) -> Optional[Tuple[int, Dict[str, Optional[Presence]]]]:
+        """
+        Latest presence of everyone changed after `version`, or None when
+        those changes are no longer buffered, or `version` belongs to another
+        epoch, and a new snapshot is needed.
+        """
+        if epoch is not None and epoch != self.epoch:
+            return None
+        with self._lock:
+            if version > self._version or (self._changes and self._changes[0][0] > version + 1):
+                return None
+            diff = {}
+            for change_version, emp_id, presence in reversed(self._changes):
+                if change_version <= version:
+                    break
+                diff.setdefault(emp_id, presence)
+            return self._version, diff
+
+    async def wait(self, version: int, timeout: float) -> None:
+        """Return once the index moves past `version`, or after `timeout` seconds"""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            if self._version != version:
+                return
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+
+presence_index = PresenceIndex(resync_seconds=settings.PRESENCE_RESYNC_SECONDS)
\ No newline at end of file
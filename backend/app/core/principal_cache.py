@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from sqlalchemy import event, inspect
+from app.config import settings
+from app.models.employee import Employee
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Immutable snapshot of the employee fields needed for authorization"""
+    emp_id: str
+    role: str
+    is_active: bool
+
+    @classmethod
+    def from_employee(cls, employee: Employee) -> "Principal":
+        role = employee.role.value if hasattr(employee.role, "value") else employee.role
+        return cls(emp_id=employee.emp_id, role=role, is_active=bool(employee.is_active))
+
+def token_version(employee: Employee) -> int:
+    """Version stamped into the token as `ver`; changes whenever the row is updated"""
+    if employee.updated_at is None:
+        return 0
+    return int(employee.updated_at.timestamp())
+
+class PrincipalCache:
+    """
+    LRU cache of resolved principals keyed on (token sub, token version).
+    Entries expire after `ttl` seconds, which also bounds staleness across
+    worker processes that did not see an invalidation.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, Principal]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, emp_id: str, version: int) -> Optional[Principal]:
+        key = (emp_id, version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return principal
+
+    def set(self, version: int, principal: Principal) -> None:
+        key = (principal.emp_id, version)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, emp_id: str) -> None:
+        """Drop every cached version for an employee"""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == emp_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+@event.listens_for(Employee, "after_update")
+def _invalidate_on_auth_change(mapper, connection, target):
+    # Role or active flag changes must not be served from a stale snapshot
+    state = inspect(target)
+    if state.attrs.role.history.has_changes() or state.attrs.is_active.history.has_changes():
+        principal_cache.invalidate(target.emp_id)
+
+@event.listens_for(Employee, "after_delete")
+def _invalidate_on_delete(mapper, connection, target):
+    principal_cache.invalidate(target.emp_id)
@@ -0,0 +1,240 @@
+"""
+Per-request performance instrumentation.
+
+`RequestMetricsMiddleware` times every HTTP request. SQLAlchemy cursor
+events on the engines count statements and DB time against the request
+being served. Each response carries a Server-Timing header, and the totals
+are exported per route at GET /metrics (METRICS_TOKEN or an admin token) in the
+Prometheus text format.
+
+A statement shape (its SQL text) executed more than N_PLUS_ONE_THRESHOLD
+times in one request is flagged as a likely N+1 and logged once per request.
+"""
+import bisect
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.config import settings
+from app.core.pool_metrics import pool_metrics
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+# Upper bounds of the statements-per-request histogram buckets
+STATEMENT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+class RequestStats:
+    """SQL activity of the request being served"""
+    __slots__ = ("statements", "db_seconds", "shapes", "flagged")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.shapes: Dict[str, int] = defaultdict(int)
+        self.flagged: List[str] = []
+
+# Holds a mutable RequestStats, so statements run in threadpool workers
+# (which get a copy of the context) still count against their request
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self):
+        running = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            running += count
+            yield ("+Inf" if bound == float("inf") else str(bound)), running
+
+class RouteMetrics:
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.statements = Histogram(STATEMENT_BUCKETS)
+        self.db_seconds = 0.0
+        self.n_plus_one = 0
+        self.responses: Dict[int, int] = defaultdict(int)
+
+class MetricsRegistry:
+    """Request totals per (method, route template)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+
+    def observe(self, method: str, route: str, status_code: int, seconds: float, stats: RequestStats) -> None:
+        with self._lock:
+            metrics = self.routes.get((method, route))
+            if metrics is None:
+                metrics = self.routes[(method, route)] = RouteMetrics()
+            metrics.latency.observe(seconds)
+            metrics.statements.observe(stats.statements)
+            metrics.db_seconds += stats.db_seconds
+            metrics.n_plus_one += len(stats.flagged)
+            metrics.responses[status_code] += 1
+
+    def render(self, pools: Dict[str, object]) -> str:
+        """Prometheus text exposition of the request metrics and the connection pools"""
+        lines = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def histogram(name: str, labels: str, values: Histogram) -> None:
+            for bound, count in values.cumulative():
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {values.sum}")
+            lines.append(f"{name}_count{{{labels}}} {values.count}")
+
+        with self._lock:
+            routes = sorted(self.routes.items())
+
+            header("hrms_http_requests_total", "counter", "HTTP responses by route and status code")
+            for (method, route), metrics in routes:
+                for status_code, count in sorted(metrics.responses.items()):
+                    lines.append(f'hrms_http_requests_total{{method="{method}",route="{route}",status="{status_code}"}} {count}')
+
+            header("hrms_http_request_duration_seconds", "histogram", "Time to serve a request")
+            for (method, route), metrics in routes:
+                histogram("hrms_http_request_duration_seconds", f'method="{method}",route="{route}"', metrics.latency)
+
+            header("hrms_db_statements_per_request", "histogram", "SQL statements executed per request")
+            for (method, route), metrics in routes:
+                histogram("hrms_db_statements_per_request", f'method="{method}",route="{route}"', metrics.statements)
+
+            header("hrms_db_seconds_total", "counter", "Time spent executing SQL, by route")
+            for (method, route), metrics in routes:
+                lines.append(f'hrms_db_seconds_total{{method="{method}",route="{route}"}} {metrics.db_seconds}')
+
+            header("hrms_n_plus_one_total", "counter", "Statement shapes repeated past the N+1 threshold in one request")
+            for (method, route), metrics in routes:
+                lines.append(f'hrms_n_plus_one_total{{method="{method}",route="{route}"}} {metrics.n_plus_one}')
+
+        snapshots = {
+            name: pool_metrics[name].snapshot(pool)
+            for name, pool in pools.items()
+            if hasattr(pool, "checkedout") and name in pool_metrics
+        }
+        header("hrms_db_pool_connections", "gauge", "Connections by pool and state")
+        for name, snapshot in snapshots.items():
+            for state in ("checked_in", "checked_out", "overflow"):
+                lines.append(f'hrms_db_pool_connections{{pool="{name}",state="{state}"}} {snapshot[state]}')
+
+        header("hrms_db_pool_timeouts_total", "counter", "Checkouts that gave up waiting for a connection")
+        for name, snapshot in snapshots.items():
+            lines.append(f'hrms_db_pool_timeouts_total{{pool="{name}"}} {snapshot["timeouts"]}')
+
+        header("hrms_db_pool_wait_seconds", "histogram", "Time a checkout waited for a connection")
+        for name, snapshot in snapshots.items():
+            wait = snapshot["wait_seconds"]
+            for bound, count in wait["buckets"].items():
+                lines.append(f'hrms_db_pool_wait_seconds_bucket{{pool="{name}",le="{bound}"}} {count}')
+            lines.append(f'hrms_db_pool_wait_seconds_sum{{pool="{name}"}} {wait["sum"]}')
+            lines.append(f'hrms_db_pool_wait_seconds_count{{pool="{name}"}} {wait["count"]}')
+        return "\n".join(lines) + "\n"
+
+metrics_registry = MetricsRegistry()
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_request.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_request.get()
+    if stats is None or not conn.info.get("query_start"):
+        return
+    stats.db_seconds += time.perf_counter() - conn.info["query_start"].pop()
+    stats.statements += 1
+    stats.shapes[statement] += 1
+    if stats.shapes[statement] == settings.N_PLUS_ONE_THRESHOLD + 1:
+        stats.flagged.append(statement)
+
+def _handle_error(exception_context):
+    # after_cursor_execute does not run for a statement that raised
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start"):
+        connection.info["query_start"].pop()
+
+def instrument_engine(engine: Engine) -> None:
+    """Count statements and DB time per request on `engine` (for an AsyncEngine, pass .sync_engine)"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+# Route templates by endpoint, so metrics are labelled /employees/{emp_id}, not by raw path
+_route_templates: Dict[object, str] = {}
+
+def _route_template(scope) -> str:
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return "unmatched"
+    template = _route_templates.get(endpoint)
+    if template is None:
+        template = next(
+            (route.path for route in scope["router"].routes if getattr(route, "endpoint", None) is endpoint),
+            endpoint.__name__
+        )
+        _route_templates[endpoint] = template
+    return template
+
+class RequestMetricsMiddleware:
+    """ASGI middleware recording latency and SQL activity for each HTTP request"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current_request.set(stats)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = (time.perf_counter() - start) * 1000
+                timing = (
+                    f'app;dur={elapsed:.1f}, '
+                    f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.statements} queries"'
+                )
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"server-timing", timing.encode()),
+                    # Lets the cross-origin frontend read it from the Resource Timing API
+                    (b"timing-allow-origin", b"*")
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_request.reset(token)
+            route = _route_template(scope)
+            metrics_registry.observe(scope["method"], route, status_code, time.perf_counter() - start, stats)
+            for statement in stats.flagged:
+                logger.warning(
+                    "Possible N+1 on %s %s: statement ran %d times: %s",
+                    scope["method"], route, stats.shapes[statement], " ".join(statement.split())[:200]
+                )
\ No newline at end of file
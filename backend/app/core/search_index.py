@@ -0,0 +1,304 @@
+import bisect
+import heapq
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.employee import Employee, EmployeePersonalInfo
+
+# A match in a name outranks one in the email, which outranks department or
+# location, then skills and certifications
+FIELD_WEIGHTS = {
+    "first_name": 3.0,
+    "last_name": 3.0,
+    "email": 2.0,
+    "department": 1.5,
+    "location": 1.5,
+    "skills": 1.0,
+    "certifications": 1.0,
+}
+
+SEARCH_COLUMNS = [
+    Employee.emp_id,
+    Employee.is_active,
+    *(getattr(Employee, field) for field in ("first_name", "last_name", "email", "department", "location")),
+    EmployeePersonalInfo.skills,
+    EmployeePersonalInfo.certifications,
+]
+
+# Delta resyncs re-read this much before the previous one, so rows written by
+# transactions that were still open at the time are not missed
+RESYNC_OVERLAP = timedelta(minutes=1)
+
+# A resync that finds more changed employees than this rebuilds the whole
+# index aside instead of patching it under the lock
+RESYNC_REBUILD_ROWS = 1000
+
+MAX_QUERY_TERMS = 8
+
+# Runs of letters, or of digits: "jane.doe42@example.com" -> jane, doe, 42, example, com
+_WORD = re.compile(r"[^\W\d_]+|\d+")
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return _WORD.findall(text.lower()) if text else []
+
+def _trigrams(token: str) -> Set[str]:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(token) + 1)}
+
+def _typo_budget(length: int) -> int:
+    return 0 if length < 4 else 1 if length < 8 else 2
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance (a transposition is one edit), or limit + 1 once it is over limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, before[j - 2] + 1)
+            current[j] = value
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+def _document(row) -> Dict[str, float]:
+    """Token -> weight of the best field it appears in"""
+    tokens: Dict[str, float] = {}
+    for field, weight in FIELD_WEIGHTS.items():
+        for token in tokenize(getattr(row, field)):
+            if weight > tokens.get(token, 0.0):
+                tokens[token] = weight
+    return tokens
+
+class SearchIndex:
+    """
+    In-process inverted index over the searchable employee fields, for
+    databases without trigram indexes.
+
+    Queries match whole words, word prefixes and, for words of four letters
+    or more, words one typo away (two from eight letters); from five letters
+    a typo in the start of a longer word matches too. So "jon", "jonh",
+    "pyhton" and "kubrn" all find what was meant. Every query word has to match;
+    employees are ranked by the summed weight of their best matches.
+
+    Writes in this process mark employees stale with `changed` and are
+    re-read before the next search. Writes made by other worker processes
+    are picked up by a resync of rows updated since the last one, at most
+    every `resync_seconds`.
+    """
+
+    def __init__(self, resync_seconds: float):
+        self.resync_seconds = resync_seconds
+        self._documents: Dict[str, Dict[str, float]] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._vocabulary: List[str] = []
+        # Trigram -> words containing it, for typo candidates; numbers are matched by prefix only
+        self._trigram_words: Dict[str, Set[str]] = {}
+        self._changed: Set[str] = set()
+        self._loaded_at: Optional[float] = None
+        self._synced_to: Optional[datetime] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def _add_word(self, token: str) -> None:
+        bisect.insort(self._vocabulary, token)
+        if not token.isdigit():
+            for gram in _trigrams(token):
+                self._trigram_words.setdefault(gram, set()).add(token)
+
+    def _drop_word(self, token: str) -> None:
+        del self._vocabulary[bisect.bisect_left(self._vocabulary, token)]
+        if not token.isdigit():
+            for gram in _trigrams(token):
+                words = self._trigram_words[gram]
+                words.discard(token)
+                if not words:
+                    del self._trigram_words[gram]
+
+    def _remove(self, emp_id: str) -> None:
+        # Caller holds self._lock
+        for token in self._documents.pop(emp_id, ()):
+            postings = self._postings[token]
+            del postings[emp_id]
+            if not postings:
+                del self._postings[token]
+                self._drop_word(token)
+
+    def _apply(self, emp_ids: Iterable[str], rows: Iterable) -> None:
+        """Re-index `rows` and drop every other employee in `emp_ids`"""
+        documents = {row.emp_id: _document(row) for row in rows if row.is_active}
+        with self._lock:
+            for emp_id in set(emp_ids) | documents.keys():
+                self._remove(emp_id)
+                tokens = documents.get(emp_id)
+                if not tokens:
+                    continue
+                self._documents[emp_id] = tokens
+                for token, weight in tokens.items():
+                    postings = self._postings.get(token)
+                    if postings is None:
+                        postings = self._postings[token] = {}
+                        self._add_word(token)
+                    postings[emp_id] = weight
+
+    def _load(self, rows: Iterable) -> None:
+        # Built aside and swapped in: inserting word by word into the sorted vocabulary is quadratic
+        documents = {row.emp_id: _document(row) for row in rows if row.is_active}
+        postings: Dict[str, Dict[str, float]] = {}
+        for emp_id, tokens in documents.items():
+            for token, weight in tokens.items():
+                postings.setdefault(token, {})[emp_id] = weight
+        trigram_words: Dict[str, Set[str]] = {}
+        for token in postings:
+            if not token.isdigit():
+                for gram in _trigrams(token):
+                    trigram_words.setdefault(gram, set()).add(token)
+        with self._lock:
+            self._documents = documents
+            self._postings = postings
+            self._vocabulary = sorted(postings)
+            self._trigram_words = trigram_words
+
+    def _rows(self, db: Session, *criteria) -> list:
+        return db.execute(
+            select(*SEARCH_COLUMNS)
+            .outerjoin(EmployeePersonalInfo, EmployeePersonalInfo.emp_id == Employee.emp_id)
+            .where(*criteria)
+        ).all()
+
+    def changed(self, emp_ids: Iterable[str]) -> None:
+        """Record committed changes to these employees; they are re-read before the next search"""
+        # Nothing to track until the first load, which reads everyone anyway
+        if self._loaded_at is None:
+            return
+        with self._lock:
+            self._changed.update(emp_ids)
+
+    def is_stale(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.resync_seconds
+
+    def refresh(self, db: Session) -> None:
+        """Load everyone on first use; afterwards re-read changed employees and, when stale, resync"""
+        if self._loaded_at is None:
+            with self._refresh_lock:
+                if self._loaded_at is None:
+                    synced_to = datetime.utcnow()
+                    self._load(self._rows(db))
+                    self._synced_to = synced_to
+                    self._loaded_at = time.monotonic()
+            return
+
+        with self._lock:
+            changed, self._changed = self._changed, set()
+        if changed:
+            self._apply(changed, self._rows(db, Employee.emp_id.in_(changed)))
+
+        # Only one caller resyncs; the rest keep searching the current copy
+        if not self.is_stale() or not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            if self.is_stale():
+                synced_to = datetime.utcnow()
+                since = self._synced_to - RESYNC_OVERLAP
+                rows = self._rows(db, or_(Employee.updated_at >= since, EmployeePersonalInfo.updated_at >= since))
+                if len(rows) > RESYNC_REBUILD_ROWS:
+                    self._load(self._rows(db))
+                else:
+                    self._apply((), rows)
+                self._synced_to = synced_to
+                self._loaded_at = time.monotonic()
+        finally:
+            self._refresh_lock.release()
+
+    def _matches(self, term: str) -> Dict[str, float]:
+        """Indexed words matching a query term, with how well they match (1.0 for the word itself)"""
+        # Caller holds self._lock
+        matches = {}
+        position = bisect.bisect_left(self._vocabulary, term)
+        while position < len(self._vocabulary) and self._vocabulary[position].startswith(term):
+            token = self._vocabulary[position]
+            matches[token] = 1.0 if token == term else 0.6 + 0.3 * len(term) / len(token)
+            position += 1
+
+        budget = _typo_budget(len(term))
+        if not budget or term.isdigit():
+            return matches
+        grams = _trigrams(term)
+        # Each edit breaks at most three of the term's trigrams, and the last
+        # one (the word end) is missing from longer words it is a prefix of
+        needed = len(grams) - 1 - 3 * budget
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._trigram_words.get(gram, ()))
+        for token, count in shared.items():
+            if count < needed or token in matches:
+                continue
+            distance = _edit_distance(term, token, budget)
+            if distance <= budget:
+                matches[token] = 0.6 / distance
+                continue
+            # A typo within what has been typed so far of a longer word; too
+            # loose to be useful below five letters
+            if len(term) < 5:
+                continue
+            lengths = [length for length in (len(term) - 1, len(term), len(term) + 1) if length < len(token)]
+            distance = min((_edit_distance(term, token[:length], budget) for length in lengths), default=budget + 1)
+            if distance <= budget:
+                matches[token] = 0.4 / distance
+        return matches
+
+    def _term_scores(self, term: str) -> Dict[str, float]:
+        """emp_id -> score of the employee's best match for one query term"""
+        # Caller holds self._lock; the result may be a posting dict itself, so it is read-only
+        scores: Dict[str, float] = {}
+        matches = sorted(self._matches(term).items(), key=lambda match: -match[1])
+        for position, (token, quality) in enumerate(matches):
+            postings = self._postings[token]
+            if position == 0:
+                scores = postings if quality == 1.0 else {emp_id: quality * weight for emp_id, weight in postings.items()}
+                continue
+            if position == 1:
+                scores = dict(scores)
+            scores.update({
+                emp_id: score
+                for emp_id, weight in postings.items()
+                if (score := quality * weight) > scores.get(emp_id, 0.0)
+            })
+        return scores
+
+    def search(self, query: str, limit: int) -> List[Tuple[str, float]]:
+        """(emp_id, score) of the best `limit` employees matching every word of the query, best first"""
+        terms = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
+        if not terms:
+            return []
+        with self._lock:
+            per_term = sorted((self._term_scores(term) for term in terms), key=len)
+            totals = per_term[0]
+            for scores in per_term[1:]:
+                totals = {emp_id: total + scores[emp_id] for emp_id, total in totals.items() if emp_id in scores}
+            if not totals:
+                return []
+
+            # Broad terms match thousands of employees with equal scores: find the
+            # cutoff score first and only sort what is above it, then fill up with
+            # the lowest emp_ids at the cutoff
+            cutoff = heapq.nlargest(limit, totals.values())[-1]
+            ranked = sorted(
+                [(emp_id, score) for emp_id, score in totals.items() if score > cutoff],
+                key=lambda item: (-item[1], item[0])
+            )
+            tied = heapq.nsmallest(limit - len(ranked), [emp_id for emp_id, score in totals.items() if score == cutoff])
+        return ranked + [(emp_id, cutoff) for emp_id in tied]
+
+employee_search_index = SearchIndex(resync_seconds=settings.SEARCH_RESYNC_SECONDS)
\ No newline at end of file
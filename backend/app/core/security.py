@@ -1,8 +1,100 @@
+import asyncio
+import multiprocessing
+import os
+import secrets
+import string
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
 from jose import jwt
+from passlib.context import CryptContext
+from app.config import settings
 
-SECRET_KEY = "1234"
-ALGORITHM = "HS256"
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHM = settings.ALGORITHM
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_HASH_ROUNDS,
+    bcrypt__min_rounds=settings.PASSWORD_HASH_ROUNDS
+)
+
+# bcrypt is deliberately CPU-bound, so it runs in a bounded pool of processes
+# instead of the request worker. The pool is created on first use.
+_pool: Optional[Executor] = None
+_pool_lock = threading.Lock()
+
+def _get_pool() -> Optional[Executor]:
+    global _pool
+    workers = settings.PASSWORD_HASH_WORKERS
+    if workers == 0:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=workers or os.cpu_count() or 1,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+    return _pool
+
+def shutdown_password_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+def _verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return verify_and_update_password(plain_password, hashed_password)[0]
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and, when the stored hash uses an outdated cost factor,
+    also return a replacement hash (otherwise None).
+    """
+    pool = _get_pool()
+    if pool is None:
+        return _verify_and_update(plain_password, hashed_password)
+    return pool.submit(_verify_and_update, plain_password, hashed_password).result()
+
+def get_password_hash(password: str) -> str:
+    pool = _get_pool()
+    if pool is None:
+        return _hash(password)
+    return pool.submit(_hash, password).result()
+
+async def averify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """verify_and_update_password for async handlers; never blocks the event loop"""
+    pool = _get_pool()
+    if pool is None:
+        return await asyncio.to_thread(_verify_and_update, plain_password, hashed_password)
+    return await asyncio.wrap_future(pool.submit(_verify_and_update, plain_password, hashed_password))
+
+async def aget_password_hash(password: str) -> str:
+    pool = _get_pool()
+    if pool is None:
+        return await asyncio.to_thread(_hash, password)
+    return await asyncio.wrap_future(pool.submit(_hash, password))
+
+def get_password_hashes(passwords: List[str]) -> List[str]:
+    """Hash many passwords, spread across the whole pool"""
+    pool = _get_pool()
+    if pool is None:
+        return [_hash(password) for password in passwords]
+    return list(pool.map(_hash, passwords))
+
+def generate_temp_password(length: int = 12) -> str:
+    alphabet = string.ascii_letters + string.digits
+    return "".join(secrets.choice(alphabet) for _ in range(length))
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     to_encode = data.copy()
@@ -1,6 +1,62 @@
 from datetime import datetime
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.models.employee import Employee
+from app.models.employee import EmployeeIdCounter
+
+SERIAL_DIGITS = 4
+
+def dialect_insert(db: Session):
+    """INSERT construct of the bound dialect, for ON CONFLICT upserts"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert
+    if dialect == "sqlite":
+        return sqlite.insert
+    raise NotImplementedError(f"Upserts are not supported on {dialect}")
+
+def employee_id_prefix(
+    company_code: str,
+    first_name: str,
+    last_name: str,
+    year: int = None
+) -> str:
+    """Prefix shared by all IDs of the same CC + FN(2) + LN(2) + YYYY"""
+    if year is None:
+        year = datetime.now().year
+
+    # Extract 2 letters from first and last name
+    fn_part = first_name[:2].upper()
+    ln_part = last_name[:2].upper()
+
+    return f"{company_code.upper()}{fn_part}{ln_part}{year}"
+
+def _reserve_serials_statement(db, prefix: str, count: int):
+    if count < 1:
+        raise ValueError("count must be at least 1")
+
+    stmt = dialect_insert(db)(EmployeeIdCounter).values(prefix=prefix, last_serial=count)
+    return stmt.on_conflict_do_update(
+        index_elements=[EmployeeIdCounter.prefix],
+        set_={"last_serial": EmployeeIdCounter.last_serial + count}
+    ).returning(EmployeeIdCounter.last_serial)
+
+def reserve_employee_serials(db: Session, prefix: str, count: int = 1) -> range:
+    """
+    Atomically reserve `count` consecutive serials for a prefix in one statement.
+    The counter row stays locked until the caller's transaction ends, so
+    concurrent registrations with the same prefix can never share a serial.
+    """
+    last_serial = db.execute(_reserve_serials_statement(db, prefix, count)).scalar_one()
+    return range(last_serial - count + 1, last_serial + 1)
+
+async def areserve_employee_serials(db: AsyncSession, prefix: str, count: int = 1) -> range:
+    """reserve_employee_serials for an AsyncSession"""
+    last_serial = (await db.execute(_reserve_serials_statement(db, prefix, count))).scalar_one()
+    return range(last_serial - count + 1, last_serial + 1)
+
+def format_employee_id(prefix: str, serial: int) -> str:
+    return f"{prefix}{serial:0{SERIAL_DIGITS}d}"
 
 def generate_employee_id(
     db: Session,
@@ -13,24 +69,18 @@ def generate_employee_id(
     Generate employee ID: CC + FN(2) + LN(2) + YYYY + ####
     Example: ABJO20240001
     """
-    if year is None:
-        year = datetime.now().year
-    
-    # Extract 2 letters from first and last name
-    fn_part = first_name[:2].upper()
-    ln_part = last_name[:2].upper()
-    
-    # Get the last serial number for this year
-    prefix = f"{company_code.upper()}{fn_part}{ln_part}{year}"
-    
-    last_emp = db.query(Employee).filter(
-        Employee.emp_id.like(f"{prefix}%")
-    ).order_by(Employee.emp_id.desc()).first()
-    
-    if last_emp:
-        last_serial = int(last_emp.emp_id[-4:])
-        new_serial = last_serial + 1
-    else:
-        new_serial = 1
-    
-    return f"{prefix}{new_serial:04d}"
\ No newline at end of file
+    prefix = employee_id_prefix(company_code, first_name, last_name, year)
+    serial = reserve_employee_serials(db, prefix)[0]
+    return format_employee_id(prefix, serial)
+
+async def agenerate_employee_id(
+    db: AsyncSession,
+    company_code: str,
+    first_name: str,
+    last_name: str,
+    year: int = None
+) -> str:
+    """generate_employee_id for an AsyncSession"""
+    prefix = employee_id_prefix(company_code, first_name, last_name, year)
+    serial = (await areserve_employee_serials(db, prefix))[0]
+    return format_employee_id(prefix, serial)
@@ -1,12 +1,41 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import APIRouter, Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.v1 import auth, employees
-from app.database import engine, Base
+from fastapi.responses import PlainTextResponse
+from app.api.v1 import auth, employees, attendance, timeoff, presence, org, exports, jobs, system
+from app.api.deps import get_metrics_scraper
+from app.config import settings
+from app.core.request_metrics import PROMETHEUS_CONTENT_TYPE, RequestMetricsMiddleware, instrument_engine, metrics_registry
+from app.database import engine, async_engine
+from app.services.jobs import WorkerPool
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# The schema is managed by Alembic (`alembic upgrade head`), run once per
+# deploy rather than by every worker; importing the app touches no database.
 
-app = FastAPI(title="HRMS API", version="1.0.0")
+def with_fallback(primary: APIRouter, fallback: APIRouter) -> APIRouter:
+    """`primary` plus the routes of `fallback` it does not override"""
+    overrides = {(route.path, method): route for route in primary.routes for method in route.methods}
+    router = APIRouter()
+    # Keep fallback's order, so static paths such as /search still come before /{emp_id}
+    for route in fallback.routes:
+        route = next((overrides[(route.path, method)] for method in route.methods if (route.path, method) in overrides), route)
+        if route not in router.routes:
+            router.routes.append(route)
+    router.routes.extend(route for route in primary.routes if route not in router.routes)
+    return router
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Optional in-process job workers; larger deployments run `python -m app.services.jobs`
+    pool = WorkerPool(settings.JOB_WORKERS) if settings.JOB_WORKERS else None
+    if pool is not None:
+        pool.start()
+    yield
+    if pool is not None:
+        await asyncio.to_thread(pool.stop)
+
+app = FastAPI(title="HRMS API", version="1.0.0", lifespan=lifespan)
 
 # CORS
 app.add_middleware(
@@ -17,10 +46,39 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Added last so it wraps CORS and its timing covers the whole stack
+if settings.METRICS_ENABLED:
+    app.add_middleware(RequestMetricsMiddleware)
+    instrument_engine(engine)
+    if async_engine is not None:
+        instrument_engine(async_engine.sync_engine)
+
 # Include routers
-app.include_router(auth.router, prefix="/api/v1")
-app.include_router(employees.router, prefix="/api/v1")
+auth_router, employees_router = auth.router, employees.router
+if settings.DATABASE_ASYNC:
+    from app.api.v1 import auth_async, employees_async
+
+    # Async handlers replace their sync counterparts; the rest stay sync
+    auth_router = with_fallback(auth_async.router, auth.router)
+    employees_router = with_fallback(employees_async.router, employees.router)
+app.include_router(auth_router, prefix="/api/v1")
+app.include_router(employees_router, prefix="/api/v1")
+app.include_router(attendance.router, prefix="/api/v1")
+app.include_router(timeoff.router, prefix="/api/v1")
+app.include_router(presence.router, prefix="/api/v1")
+app.include_router(org.router, prefix="/api/v1")
+app.include_router(exports.router, prefix="/api/v1")
+app.include_router(jobs.router, prefix="/api/v1")
+app.include_router(system.router, prefix="/api/v1")
 
 @app.get("/")
 def read_root():
-    return {"message": "HRMS API is running"}
\ No newline at end of file
+    return {"message": "HRMS API is running"}
+
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(get_metrics_scraper)])
+def read_metrics():
+    """Prometheus scrape endpoint (bearer METRICS_TOKEN, or an Admin/HR token)"""
+    pools = {"sync": engine.pool}
+    if async_engine is not None:
+        pools["async"] = async_engine.pool
+    return PlainTextResponse(metrics_registry.render(pools), media_type=PROMETHEUS_CONTENT_TYPE)
\ No newline at end of file
@@ -6,10 +6,14 @@ from app.models.employee import (
     EmployeeBankDetails,
     EmployeeSalaryStructure,
     EmployeePFContribution,
-    EmployeeTaxDeductions
+    EmployeeTaxDeductions,
+    EmployeeIdCounter,
+    EmployeeHierarchy
 )
-from app.models.attendance import Attendance, MonthlyAttendanceSummary
+from app.models.attendance import Attendance, AttendanceArchive, MonthlyAttendanceSummary
 from app.models.timeoff import TimeOffBalance, TimeOffRequest
+from app.models.payroll import PayrollResult
+from app.models.job import Job
 
 __all__ = [
     "Employee",
@@ -20,8 +24,13 @@ __all__ = [
     "EmployeeSalaryStructure",
     "EmployeePFContribution",
     "EmployeeTaxDeductions",
+    "EmployeeIdCounter",
+    "EmployeeHierarchy",
     "Attendance",
+    "AttendanceArchive",
     "MonthlyAttendanceSummary",
     "TimeOffBalance",
     "TimeOffRequest",
+    "PayrollResult",
+    "Job",
 ]
\ No newline at end of file
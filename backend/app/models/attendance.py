@@ -1,8 +1,12 @@
-from sqlalchemy import Column, Integer, String, Date, Time, Boolean, DateTime, ForeignKey, Numeric, CheckConstraint, Text, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Date, Time, Boolean, DateTime, ForeignKey, Numeric, CheckConstraint, Text, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
 
+# On PostgreSQL this table is partitioned by month of attendance_date
+# (migration 0004, primary key (attendance_id, attendance_date)), so check-ins
+# and current-month reads only touch the hot partition. Upcoming partitions
+# are created by app.services.attendance_storage.
 class Attendance(Base):
     __tablename__ = "attendance"
     
@@ -23,6 +27,33 @@ class Attendance(Base):
     
     __table_args__ = (
         UniqueConstraint('emp_id', 'attendance_date', name='unique_emp_date'),
+        # "Who's in today" and date-range reports across all employees
+        Index('ix_attendance_date', 'attendance_date'),
+    )
+
+# Attendance of finalized months, moved out of the hot table by
+# app.services.attendance_storage. Same columns, in the same order, as
+# Attendance; query both through attendance_storage.attendance_history().
+class AttendanceArchive(Base):
+    __tablename__ = "attendance_archive"
+    
+    attendance_id = Column(Integer, primary_key=True, autoincrement=False)
+    emp_id = Column(String(20), ForeignKey("employees.emp_id", ondelete="CASCADE"), nullable=False)
+    attendance_date = Column(Date, primary_key=True)
+    check_in_time = Column(Time)
+    check_out_time = Column(Time)
+    work_hours = Column(Numeric(4, 2))
+    extra_hours = Column(Numeric(4, 2))
+    status = Column(String(20), CheckConstraint("status IN ('present', 'absent', 'half_day', 'on_leave')"), nullable=False)
+    is_paid = Column(Boolean)
+    remarks = Column(Text)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    
+    __table_args__ = (
+        Index('ix_attendance_archive_emp_date', 'emp_id', 'attendance_date'),
+        # Archived months are whole partitions detached from attendance
+        {"postgresql_partition_by": "RANGE (attendance_date)"},
     )
 
 class MonthlyAttendanceSummary(Base):
@@ -47,4 +78,5 @@ class MonthlyAttendanceSummary(Base):
         UniqueConstraint('emp_id', 'month', 'year', name='unique_emp_month_year'),
         CheckConstraint('month >= 1 AND month <= 12', name='chk_month_valid'),
         CheckConstraint('year >= 2000 AND year <= 2100', name='chk_year_valid'),
+        Index('ix_monthly_summary_month', 'year', 'month'),
     )
\ No newline at end of file
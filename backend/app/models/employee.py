@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum, ForeignKey, Integer, Date, Numeric, Text, CheckConstraint
+from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum, ForeignKey, Integer, Date, Numeric, Text, CheckConstraint, Index, DDL, event, func, literal_column
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -9,6 +9,14 @@ class RoleEnum(str, enum.Enum):
     hr = "hr"
     admin = "admin"
 
+def search_text(*columns):
+    """lower(coalesce(a, '') || ' ' || coalesce(b, '') ...): the text a directory search trigram index covers"""
+    text = None
+    for column in columns:
+        part = func.coalesce(column, literal_column("''"))
+        text = part if text is None else text + literal_column("' '") + part
+    return func.lower(text)
+
 class Employee(Base):
     __tablename__ = "employees"
     
@@ -20,8 +28,8 @@ class Employee(Base):
     phone = Column(String(15), nullable=False)
     password_hash = Column(String(255), nullable=False)
     role = Column(SQLEnum(RoleEnum), nullable=False, default=RoleEnum.employee)
-    department = Column(String(50))
-    manager_id = Column(String(20), ForeignKey("employees.emp_id"))
+    department = Column(String(50), index=True)
+    manager_id = Column(String(20), ForeignKey("employees.emp_id"), index=True)
     location = Column(String(100))
     date_of_joining = Column(Date, nullable=False)
     profile_picture = Column(String(255))
@@ -40,12 +48,24 @@ class Employee(Base):
     salary_structure = relationship("EmployeeSalaryStructure", back_populates="employee")
     pf_contributions = relationship("EmployeePFContribution", back_populates="employee")
     tax_deductions = relationship("EmployeeTaxDeductions", back_populates="employee")
+    
+    __table_args__ = (
+        # Directory listing pages through active employees only
+        Index('ix_employees_active', 'emp_id', postgresql_where=is_active == True, sqlite_where=is_active == True),
+        # Directory search on PostgreSQL (pg_trgm); other databases use the in-process search index
+        Index(
+            'ix_employees_search',
+            search_text(first_name, last_name, email, department, location).label('search_text'),
+            postgresql_using='gin',
+            postgresql_ops={'search_text': 'gin_trgm_ops'}
+        ).ddl_if(dialect='postgresql'),
+    )
 
 class WorkingSchedule(Base):
     __tablename__ = "schedules"
     
     schedule_id = Column(Integer, primary_key=True, autoincrement=True)
-    emp_id = Column(String(20), ForeignKey("employees.emp_id", ondelete="CASCADE"), nullable=False)
+    emp_id = Column(String(20), ForeignKey("employees.emp_id", ondelete="CASCADE"), nullable=False, index=True)
     total_working_hours = Column(Numeric(4, 2), nullable=False)
     break_time_hours = Column(Numeric(4, 2), default=1.00)
     working_days_per_month = Column(Integer, default=22)
@@ -88,6 +108,15 @@ class EmployeePersonalInfo(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     employee = relationship("Employee", back_populates="personal_info")
+    
+    __table_args__ = (
+        Index(
+            'ix_employee_personal_info_search',
+            search_text(skills, certifications).label('search_text'),
+            postgresql_using='gin',
+            postgresql_ops={'search_text': 'gin_trgm_ops'}
+        ).ddl_if(dialect='postgresql'),
+    )
 
 class EmployeeBankDetails(Base):
     __tablename__ = "employee_bank_details"
@@ -113,7 +142,7 @@ class EmployeeSalaryStructure(Base):
     __tablename__ = "employee_salary_structure"
     
     salary_structure_id = Column(Integer, primary_key=True, autoincrement=True)
-    emp_id = Column(String(20), ForeignKey("employees.emp_id", ondelete="CASCADE"), nullable=False)
+    emp_id = Column(String(20), ForeignKey("employees.emp_id", ondelete="CASCADE"), nullable=False, index=True)
     monthly_wage = Column(Numeric(10, 2), nullable=False)
     no_of_working_days_in_week = Column(Integer, default=5)
     standard_allowance = Column(Numeric(10, 2), default=4167.00)
@@ -145,6 +174,8 @@ class EmployeePFContribution(Base):
         CheckConstraint('month >= 1 AND month <= 12', name='chk_pf_month_valid'),
         CheckConstraint('year >= 2000 AND year <= 2100', name='chk_pf_year_valid'),
         CheckConstraint('basic_salary > 0', name='chk_pf_basic_salary_positive'),
+        Index('ix_pf_contribution_emp_month', 'emp_id', 'year', 'month'),
+        Index('ix_pf_contribution_month', 'year', 'month'),
     )
 
 class EmployeeTaxDeductions(Base):
@@ -168,4 +199,30 @@ class EmployeeTaxDeductions(Base):
     __table_args__ = (
         CheckConstraint('month >= 1 AND month <= 12', name='chk_tax_month_valid'),
         CheckConstraint('year >= 2000 AND year <= 2100', name='chk_tax_year_valid'),
-    )
\ No newline at end of file
+        Index('ix_tax_deductions_emp_month', 'emp_id', 'year', 'month'),
+        Index('ix_tax_deductions_month', 'year', 'month'),
+    )
+
+class EmployeeIdCounter(Base):
+    __tablename__ = "employee_id_counters"
+    
+    prefix = Column(String(16), primary_key=True)
+    last_serial = Column(Integer, nullable=False, default=0)
+
+# Closure table of the reporting tree: one row per (manager, report) pair at
+# any depth, plus a depth-0 row per employee
+class EmployeeHierarchy(Base):
+    __tablename__ = "employee_hierarchy"
+    
+    ancestor_id = Column(String(20), ForeignKey("employees.emp_id", ondelete="CASCADE"), primary_key=True)
+    descendant_id = Column(String(20), ForeignKey("employees.emp_id", ondelete="CASCADE"), primary_key=True)
+    depth = Column(Integer, nullable=False)
+    
+    __table_args__ = (
+        # Subtree and direct reports by depth; chain to the top
+        Index('ix_employee_hierarchy_ancestor_depth', 'ancestor_id', 'depth'),
+        Index('ix_employee_hierarchy_descendant_depth', 'descendant_id', 'depth'),
+    )
+
+# The directory search indexes need the pg_trgm extension
+event.listen(Employee.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"))
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, CheckConstraint, Text, JSON, Index
+from datetime import datetime
+from app.database import Base
+
+class Job(Base):
+    __tablename__ = "jobs"
+    
+    job_id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(50), nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    status = Column(String(20), CheckConstraint("status IN ('queued', 'running', 'succeeded', 'failed')"), default="queued", nullable=False)
+    progress = Column(Integer, default=0, nullable=False)
+    progress_message = Column(String(255))
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=3, nullable=False)
+    run_after = Column(DateTime, default=datetime.utcnow, nullable=False)
+    result = Column(JSON)
+    last_error = Column(Text)
+    locked_by = Column(String(64))
+    locked_at = Column(DateTime)
+    created_by = Column(String(20), ForeignKey("employees.emp_id", ondelete="SET NULL"))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime)
+    
+    __table_args__ = (
+        # Workers only ever claim queued jobs that are due
+        Index(
+            'ix_jobs_claim',
+            'run_after',
+            'job_id',
+            postgresql_where=status == 'queued',
+            sqlite_where=status == 'queued'
+        ),
+        # Reclaiming jobs from workers that died
+        Index('ix_jobs_running', 'locked_at', postgresql_where=status == 'running', sqlite_where=status == 'running'),
+    )
\ No newline at end of file
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, CheckConstraint, UniqueConstraint
+from datetime import datetime
+from app.database import Base
+
+class PayrollResult(Base):
+    __tablename__ = "payroll_results"
+    
+    payroll_result_id = Column(Integer, primary_key=True, autoincrement=True)
+    emp_id = Column(String(20), ForeignKey("employees.emp_id", ondelete="CASCADE"), nullable=False)
+    month = Column(Integer, nullable=False)
+    year = Column(Integer, nullable=False)
+    salary_structure_id = Column(Integer, ForeignKey("employee_salary_structure.salary_structure_id", ondelete="SET NULL"))
+    working_days = Column(Numeric(4, 1), nullable=False)
+    loss_of_pay_days = Column(Numeric(4, 1), default=0.0)
+    gross_pay = Column(Numeric(10, 2), nullable=False)
+    basic_salary = Column(Numeric(10, 2), nullable=False)
+    pf_employee = Column(Numeric(10, 2), default=0.00)
+    pf_employer = Column(Numeric(10, 2), default=0.00)
+    tax_deductions = Column(Numeric(10, 2), default=0.00)
+    net_pay = Column(Numeric(10, 2), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        UniqueConstraint('emp_id', 'month', 'year', name='unique_payroll_emp_month_year'),
+        CheckConstraint('month >= 1 AND month <= 12', name='chk_payroll_month_valid'),
+        CheckConstraint('year >= 2000 AND year <= 2100', name='chk_payroll_year_valid'),
+    )
\ No newline at end of file
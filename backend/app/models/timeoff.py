@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Numeric, Text, CheckConstraint, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Numeric, Text, CheckConstraint, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -40,4 +40,17 @@ class TimeOffRequest(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
-    employee = relationship("Employee", back_populates="timeoff_requests", foreign_keys=[emp_id])
\ No newline at end of file
+    employee = relationship("Employee", back_populates="timeoff_requests", foreign_keys=[emp_id])
+    
+    __table_args__ = (
+        Index('ix_time_off_requests_emp_status', 'emp_id', 'status'),
+        Index('ix_time_off_requests_approved_by', 'approved_by'),
+        # Approval queues only ever look at pending requests
+        Index(
+            'ix_time_off_requests_pending',
+            'emp_id',
+            'start_date',
+            postgresql_where=status == 'pending',
+            sqlite_where=status == 'pending'
+        ),
+    )
\ No newline at end of file
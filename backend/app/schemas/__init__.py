@@ -2,13 +2,25 @@ from app.schemas.auth import Token, TokenData, LoginRequest
 from app.schemas.employee import (
     EmployeeCreate,
     EmployeeResponse,
+    EmployeePage,
+    OrgMember,
+    EmployeeSearchResult,
+    DirectoryEntry,
+    DirectorySearchResult,
+    ManagerAssignment,
     EmployeeWithTempPassword,
+    BulkOnboardedEmployee,
+    BulkRowError,
+    BulkOnboardingResult,
     EmployeePersonalInfoCreate,
     EmployeePersonalInfoResponse,
     EmployeeBankDetailsCreate,
     EmployeeBankDetailsResponse,
     EmployeeSalaryStructureCreate,
-    EmployeeSalaryStructureResponse
+    EmployeeSalaryStructureResponse,
+    WorkingScheduleResponse,
+    EmployeeStatusResponse,
+    EmployeeProfile
 )
 from app.schemas.attendance import (
     AttendanceCheckIn,
@@ -18,8 +30,13 @@ from app.schemas.attendance import (
 from app.schemas.timeoff import (
     TimeOffRequestCreate,
     TimeOffRequestResponse,
-    TimeOffApproval
+    TimeOffBalanceResponse,
+    TimeOffApproval,
+    TimeOffRequestPage,
+    TimeOffApprovalError,
+    TimeOffApprovalResult
 )
+from app.schemas.job import MonthlyJobCreate, JobResponse, JobPage
 
 __all__ = [
     "Token",
@@ -27,17 +44,36 @@ __all__ = [
     "LoginRequest",
     "EmployeeCreate",
     "EmployeeResponse",
+    "EmployeePage",
+    "OrgMember",
+    "EmployeeSearchResult",
+    "DirectoryEntry",
+    "DirectorySearchResult",
+    "ManagerAssignment",
     "EmployeeWithTempPassword",
+    "BulkOnboardedEmployee",
+    "BulkRowError",
+    "BulkOnboardingResult",
     "EmployeePersonalInfoCreate",
     "EmployeePersonalInfoResponse",
     "EmployeeBankDetailsCreate",
     "EmployeeBankDetailsResponse",
     "EmployeeSalaryStructureCreate",
     "EmployeeSalaryStructureResponse",
+    "WorkingScheduleResponse",
+    "EmployeeStatusResponse",
+    "EmployeeProfile",
     "AttendanceCheckIn",
     "AttendanceCheckOut",
     "AttendanceResponse",
     "TimeOffRequestCreate",
     "TimeOffRequestResponse",
+    "TimeOffBalanceResponse",
     "TimeOffApproval",
+    "TimeOffRequestPage",
+    "TimeOffApprovalError",
+    "TimeOffApprovalResult",
+    "MonthlyJobCreate",
+    "JobResponse",
+    "JobPage",
 ]
\ No newline at end of file
@@ -8,6 +8,7 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     emp_id: Optional[str] = None
+    version: int = 0
 
 class LoginRequest(BaseModel):
     email: EmailStr
@@ -1,7 +1,8 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional
-from datetime import date
+from typing import List, Optional
+from datetime import date, datetime
 from decimal import Decimal
+from app.schemas.timeoff import TimeOffBalanceResponse
 
 class EmployeeCreate(BaseModel):
     company_code: str
@@ -32,10 +33,55 @@ class EmployeeResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class OrgMember(EmployeeResponse):
+    manager_id: Optional[str]
+    depth: int
+
+class EmployeeSearchResult(EmployeeResponse):
+    score: float
+
+class DirectoryEntry(BaseModel):
+    """What any employee may see of a colleague"""
+    emp_id: str
+    first_name: str
+    last_name: str
+    email: str
+    department: Optional[str]
+    location: Optional[str]
+    profile_picture: Optional[str]
+
+    class Config:
+        from_attributes = True
+
+class DirectorySearchResult(DirectoryEntry):
+    score: float
+
+class ManagerAssignment(BaseModel):
+    manager_id: Optional[str] = None
+
+class EmployeePage(BaseModel):
+    items: List[EmployeeResponse]
+    next_cursor: Optional[str] = None
+
 class EmployeeWithTempPassword(BaseModel):
     employee: EmployeeResponse
     temporary_password: str
 
+# Bulk Onboarding Schemas
+class BulkOnboardedEmployee(BaseModel):
+    row: int
+    emp_id: str
+    email: str
+    temporary_password: str
+
+class BulkRowError(BaseModel):
+    row: int
+    error: str
+
+class BulkOnboardingResult(BaseModel):
+    created: List[BulkOnboardedEmployee]
+    errors: List[BulkRowError]
+
 # Personal Info Schemas
 class EmployeePersonalInfoCreate(BaseModel):
     about: Optional[str] = None
@@ -97,4 +143,35 @@ class EmployeeSalaryStructureResponse(BaseModel):
     is_active: bool
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# Schedule and Status Schemas
+class WorkingScheduleResponse(BaseModel):
+    schedule_id: int
+    total_working_hours: Decimal
+    break_time_hours: Optional[Decimal]
+    working_days_per_month: Optional[int]
+    effective_from: date
+    effective_to: Optional[date]
+    
+    class Config:
+        from_attributes = True
+
+class EmployeeStatusResponse(BaseModel):
+    current_status: str
+    status_indicator: str
+    last_check_in: Optional[datetime]
+    last_check_out: Optional[datetime]
+    
+    class Config:
+        from_attributes = True
+
+# Profile Aggregate Schemas
+class EmployeeProfile(EmployeeResponse):
+    manager_id: Optional[str]
+    personal_info: Optional[EmployeePersonalInfoResponse]
+    bank_details: Optional[EmployeeBankDetailsResponse]
+    salary_structure: Optional[EmployeeSalaryStructureResponse]
+    working_schedule: Optional[WorkingScheduleResponse]
+    status: Optional[EmployeeStatusResponse]
+    timeoff_balance: Optional[TimeOffBalanceResponse]
\ No newline at end of file
@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+class MonthlyJobCreate(BaseModel):
+    year: int = Field(..., ge=2000, le=2100)
+    month: int = Field(..., ge=1, le=12)
+
+class JobResponse(BaseModel):
+    job_id: int
+    kind: str
+    payload: Dict[str, Any]
+    status: str
+    progress: int
+    progress_message: Optional[str]
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    result: Optional[Dict[str, Any]]
+    last_error: Optional[str]
+    created_by: Optional[str]
+    created_at: datetime
+    finished_at: Optional[datetime]
+    
+    class Config:
+        from_attributes = True
+
+class JobPage(BaseModel):
+    items: List[JobResponse]
+    next_cursor: Optional[int] = None
\ No newline at end of file
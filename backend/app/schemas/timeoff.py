@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 from decimal import Decimal
 
 class TimeOffRequestCreate(BaseModel):
@@ -23,7 +23,30 @@ class TimeOffRequestResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class TimeOffBalanceResponse(BaseModel):
+    year: int
+    paid_time_off_total: Decimal
+    paid_time_off_used: Optional[Decimal]
+    sick_leave_total: Decimal
+    sick_leave_used: Optional[Decimal]
+    
+    class Config:
+        from_attributes = True
+
 class TimeOffApproval(BaseModel):
     request_id: int
     status: str  # "approved" or "rejected"
-    approval_comments: Optional[str] = None
\ No newline at end of file
+    approval_comments: Optional[str] = None
+
+class TimeOffRequestPage(BaseModel):
+    items: List[TimeOffRequestResponse]
+    next_cursor: Optional[int] = None
+
+class TimeOffApprovalError(BaseModel):
+    request_id: int
+    detail: str
+
+class TimeOffApprovalResult(BaseModel):
+    approved: List[int]
+    rejected: List[int]
+    failed: List[TimeOffApprovalError]
\ No newline at end of file
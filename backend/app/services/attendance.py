@@ -0,0 +1,158 @@
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+from sqlalchemy import Numeric, and_, case, cast, func, or_, select, update
+from sqlalchemy.orm import Session
+from app.models.attendance import Attendance
+from app.models.employee import WorkingSchedule, EmployeeStatusTracker
+from app.core.presence import Presence, presence_index
+from app.core.utils import dialect_insert
+from app.services.attendance_summary import apply_summary_delta, retract_attendance_hours, retract_day_status
+
+IN_OFFICE = ("in_office", "green")
+CHECKED_OUT = ("absent", "yellow")
+
+def _hours_between(db: Session, start, end):
+    """SQL expression for the hours elapsed between two TIME columns"""
+    if db.get_bind().dialect.name == "sqlite":
+        return (func.julianday(end) - func.julianday(start)) * 24
+    return func.extract("epoch", end - start) / 3600
+
+def _current_schedule(column, emp_id: str, on_date: date, default):
+    """Scalar subquery for a column of the schedule in effect on a date"""
+    return func.coalesce(
+        select(column)
+        .where(
+            WorkingSchedule.emp_id == emp_id,
+            WorkingSchedule.effective_from <= on_date,
+            or_(WorkingSchedule.effective_to.is_(None), WorkingSchedule.effective_to >= on_date)
+        )
+        .order_by(WorkingSchedule.effective_from.desc())
+        .limit(1)
+        .scalar_subquery(),
+        default
+    )
+
+def _set_status(db: Session, emp_id: str, presence: Presence, **values) -> None:
+    current_status, status_indicator = presence
+    db.execute(
+        update(EmployeeStatusTracker)
+        .where(EmployeeStatusTracker.emp_id == emp_id)
+        .values(
+            current_status=current_status,
+            status_indicator=status_indicator,
+            updated_at=datetime.utcnow(),
+            **values
+        )
+    )
+
+def check_in(db: Session, emp_id: str, check_in_time: Optional[time] = None) -> dict:
+    """
+    Upsert today's attendance row in one statement. Repeated check-ins keep
+    the first check-in time, so retries during the morning burst are harmless.
+    """
+    now = datetime.now()
+    today = now.date()
+    # Rolled back below when the day already has a check-in
+    retract_day_status(db, emp_id, today)
+    stmt = dialect_insert(db)(Attendance).values(
+        emp_id=emp_id,
+        attendance_date=today,
+        check_in_time=check_in_time or now.time(),
+        status="present"
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Attendance.emp_id, Attendance.attendance_date],
+        set_={
+            "check_in_time": stmt.excluded.check_in_time,
+            "status": "present",
+            "updated_at": datetime.utcnow()
+        },
+        where=Attendance.check_in_time.is_(None)
+    ).returning(*Attendance.__table__.columns)
+    record = db.execute(stmt).mappings().one_or_none()
+
+    if record is None:
+        # Already checked in today: nothing changes
+        db.rollback()
+        return dict(
+            db.execute(
+                select(*Attendance.__table__.columns)
+                .where(Attendance.emp_id == emp_id, Attendance.attendance_date == today)
+            ).mappings().one()
+        )
+
+    apply_summary_delta(db, emp_id, today.year, today.month, days_present=1)
+    _set_status(db, emp_id, IN_OFFICE, last_check_in=now)
+    db.commit()
+    presence_index.update(emp_id, *IN_OFFICE)
+    return dict(record)
+
+def check_out(db: Session, emp_id: str, check_out_time: Optional[time] = None) -> Optional[dict]:
+    """
+    Close the open attendance row in one statement, computing work and extra
+    hours against the employee's WorkingSchedule for that day. That is today's
+    row, or for a shift that ran past midnight, yesterday's row that is still
+    open and checked in later in the day than this check-out. Returns None when
+    there is no check-in to close.
+    """
+    now = datetime.now()
+    today = now.date()
+    yesterday = today - timedelta(days=1)
+    check_out_time = check_out_time or now.time()
+
+    day = db.execute(
+        select(Attendance.attendance_date)
+        .where(
+            Attendance.emp_id == emp_id,
+            Attendance.attendance_date.in_([today, yesterday]),
+            Attendance.check_in_time.is_not(None),
+            or_(
+                Attendance.attendance_date == today,
+                and_(Attendance.check_out_time.is_(None), Attendance.check_in_time > check_out_time)
+            )
+        )
+        .order_by(Attendance.attendance_date.desc())
+        .limit(1)
+    ).scalar()
+    if day is None:
+        return None
+
+    break_hours = _current_schedule(WorkingSchedule.break_time_hours, emp_id, day, 1)
+    expected_hours = _current_schedule(WorkingSchedule.total_working_hours, emp_id, day, 8)
+    worked = _hours_between(db, Attendance.check_in_time, check_out_time) - break_hours
+    if day != today:
+        # The check-out time is on the next day
+        worked = worked + 24
+    work_hours = case((worked > 0, worked), else_=0)
+    extra_hours = case((worked > expected_hours, worked - expected_hours), else_=0)
+
+    retract_attendance_hours(db, emp_id, day)
+    stmt = (
+        update(Attendance)
+        .where(and_(
+            Attendance.emp_id == emp_id,
+            Attendance.attendance_date == day,
+            Attendance.check_in_time.is_not(None)
+        ))
+        .values(
+            check_out_time=check_out_time,
+            work_hours=cast(work_hours, Numeric(4, 2)),
+            extra_hours=cast(extra_hours, Numeric(4, 2)),
+            updated_at=datetime.utcnow()
+        )
+        .returning(*Attendance.__table__.columns)
+    )
+    record = db.execute(stmt).mappings().one_or_none()
+    if record is None:
+        db.rollback()
+        return None
+
+    apply_summary_delta(
+        db, emp_id, day.year, day.month,
+        total_work_hours=record["work_hours"],
+        total_extra_hours=record["extra_hours"]
+    )
+    _set_status(db, emp_id, CHECKED_OUT, last_check_out=now)
+    db.commit()
+    presence_index.update(emp_id, *CHECKED_OUT)
+    return dict(record)
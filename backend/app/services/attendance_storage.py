@@ -0,0 +1,191 @@
+"""
+Hot/cold storage of attendance.
+
+On PostgreSQL `attendance` is partitioned by month of attendance_date (see
+migration 0004): check-ins and current-month reads are pruned to one small
+partition. `ensure_partitions` creates the upcoming months' partitions
+ahead of time. Rows that land in the default
+partition before their month exists are moved into it.
+
+`archive_finalized_months` moves months whose MonthlyAttendanceSummary rows
+are all finalized into `attendance_archive`. On PostgreSQL the month's
+partition is detached and re-attached under the archive as is, optionally
+moved to ATTENDANCE_ARCHIVE_TABLESPACE and rewritten with
+ATTENDANCE_ARCHIVE_ACCESS_METHOD (e.g. a compressing columnar access
+method). Elsewhere the rows are copied and deleted. `attendance_history()`
+reads both tables.
+
+The job workers run both every ATTENDANCE_STORAGE_INTERVAL_SECONDS as the
+`attendance_storage` periodic job; the CLI runs them on demand.
+
+    python -m app.services.attendance_storage --ensure-partitions
+    python -m app.services.attendance_storage --archive
+"""
+import argparse
+from datetime import date
+from typing import List, Optional, Tuple
+from sqlalchemy import case, delete, func, insert, select, text, union_all
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.attendance import Attendance, AttendanceArchive, MonthlyAttendanceSummary
+
+ARCHIVE_COLUMNS = [AttendanceArchive.__table__.c[column.name] for column in Attendance.__table__.columns]
+
+def attendance_history():
+    """Hot and archived attendance as one selectable with Attendance's columns"""
+    return union_all(
+        select(*Attendance.__table__.columns),
+        select(*ARCHIVE_COLUMNS)
+    ).subquery("attendance_history")
+
+def month_bounds(year: int, month: int) -> Tuple[date, date]:
+    """First day of the month and first day of the next one"""
+    return date(year, month, 1), date(year + month // 12, month % 12 + 1, 1)
+
+def add_months(year: int, month: int, months: int) -> Tuple[int, int]:
+    index = year * 12 + month - 1 + months
+    return index // 12, index % 12 + 1
+
+def partition_name(table: str, year: int, month: int) -> str:
+    return f"{table}_y{year}m{month:02d}"
+
+def is_partitioned(db: Session, table: str = "attendance") -> bool:
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+    return db.execute(
+        text("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": table}
+    ).scalar() or False
+
+def _partition_exists(db: Session, name: str) -> bool:
+    return db.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}).scalar()
+
+def create_partition(db: Session, table: str, year: int, month: int) -> Optional[str]:
+    """
+    Create `table`'s partition for a month unless it exists. Rows already in
+    the default partition for that month are moved into it. Returns the name
+    of the new partition, or None.
+    """
+    name = partition_name(table, year, month)
+    if _partition_exists(db, name):
+        return None
+    start, end = month_bounds(year, month)
+    bounds = {"start": start, "end": end}
+    db.execute(text(f'CREATE TABLE "{name}" (LIKE "{table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'))
+    if _partition_exists(db, f"{table}_default"):
+        db.execute(text(
+            f'WITH moved AS (DELETE FROM "{table}_default" '
+            f'WHERE attendance_date >= :start AND attendance_date < :end RETURNING *) '
+            f'INSERT INTO "{name}" SELECT * FROM moved'
+        ), bounds)
+    db.execute(text(
+        f'ALTER TABLE "{table}" ATTACH PARTITION "{name}" '
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    ))
+    return name
+
+def ensure_partitions(db: Session, months_ahead: Optional[int] = None, today: Optional[date] = None) -> List[str]:
+    """Create attendance partitions for this month and the next `months_ahead`. Returns the new ones."""
+    if not is_partitioned(db):
+        return []
+    today = today or date.today()
+    months_ahead = settings.ATTENDANCE_PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    created = []
+    for offset in range(months_ahead + 1):
+        name = create_partition(db, "attendance", *add_months(today.year, today.month, offset))
+        if name:
+            created.append(name)
+    db.commit()
+    return created
+
+def finalized_months(db: Session, today: Optional[date] = None) -> List[Tuple[int, int]]:
+    """Months before the current one whose summaries are all finalized"""
+    today = today or date.today()
+    all_finalized = func.min(case((MonthlyAttendanceSummary.is_finalized == True, 1), else_=0)) == 1
+    rows = db.execute(
+        select(MonthlyAttendanceSummary.year, MonthlyAttendanceSummary.month)
+        .where(MonthlyAttendanceSummary.year * 12 + MonthlyAttendanceSummary.month < today.year * 12 + today.month)
+        .group_by(MonthlyAttendanceSummary.year, MonthlyAttendanceSummary.month)
+        .having(all_finalized)
+        .order_by(MonthlyAttendanceSummary.year, MonthlyAttendanceSummary.month)
+    )
+    return [(year, month) for year, month in rows]
+
+def _archive_partition(db: Session, year: int, month: int) -> bool:
+    """Move a month's whole partition under attendance_archive; False when there is none to move"""
+    source = partition_name("attendance", year, month)
+    target = partition_name("attendance_archive", year, month)
+    # Rows written to a month after it was archived are copied into the existing archive partition
+    if not _partition_exists(db, source) or _partition_exists(db, target):
+        return False
+    start, end = month_bounds(year, month)
+    db.execute(text(f'ALTER TABLE attendance DETACH PARTITION "{source}"'))
+    db.execute(text(f'ALTER TABLE "{source}" RENAME TO "{target}"'))
+    if settings.ATTENDANCE_ARCHIVE_TABLESPACE:
+        db.execute(text(f'ALTER TABLE "{target}" SET TABLESPACE "{settings.ATTENDANCE_ARCHIVE_TABLESPACE}"'))
+    if settings.ATTENDANCE_ARCHIVE_ACCESS_METHOD:
+        db.execute(text(f'ALTER TABLE "{target}" SET ACCESS METHOD "{settings.ATTENDANCE_ARCHIVE_ACCESS_METHOD}"'))
+    db.execute(text(
+        f'ALTER TABLE attendance_archive ATTACH PARTITION "{target}" '
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    ))
+    return True
+
+def archive_month(db: Session, year: int, month: int) -> int:
+    """Move one month of attendance into the archive in one transaction. Returns the rows moved."""
+    if is_partitioned(db) and is_partitioned(db, "attendance_archive") and _archive_partition(db, year, month):
+        moved = db.execute(text(f'SELECT count(*) FROM "{partition_name("attendance_archive", year, month)}"')).scalar()
+        db.commit()
+        return moved
+
+    start, end = month_bounds(year, month)
+    in_month = (Attendance.attendance_date >= start, Attendance.attendance_date < end)
+    if is_partitioned(db, "attendance_archive"):
+        if not _partition_exists(db, partition_name("attendance_archive", year, month)):
+            db.execute(text(
+                f'CREATE TABLE "{partition_name("attendance_archive", year, month)}" PARTITION OF attendance_archive '
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+    db.execute(insert(AttendanceArchive).from_select(
+        [column.name for column in ARCHIVE_COLUMNS],
+        select(*Attendance.__table__.columns).where(*in_month)
+    ))
+    moved = db.execute(delete(Attendance).where(*in_month)).rowcount
+    db.commit()
+    return moved
+
+def archive_finalized_months(db: Session, today: Optional[date] = None) -> List[Tuple[int, int, int]]:
+    """Archive every finalized month still in the hot table. Returns (year, month, rows) per month archived."""
+    archived = []
+    for year, month in finalized_months(db, today):
+        start, end = month_bounds(year, month)
+        hot = db.execute(
+            select(Attendance.attendance_id).where(Attendance.attendance_date >= start, Attendance.attendance_date < end).limit(1)
+        ).first()
+        if hot is not None:
+            archived.append((year, month, archive_month(db, year, month)))
+    return archived
+
+def main():
+    from app.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Maintain attendance partitions and archive finalized months")
+    parser.add_argument("--ensure-partitions", action="store_true", help="create upcoming monthly partitions")
+    parser.add_argument("--months-ahead", type=int, default=None)
+    parser.add_argument("--archive", action="store_true", help="move finalized months into attendance_archive")
+    args = parser.parse_args()
+    if not (args.ensure_partitions or args.archive):
+        parser.error("nothing to do; pass --ensure-partitions and/or --archive")
+
+    with SessionLocal() as db:
+        if args.ensure_partitions:
+            created = ensure_partitions(db, args.months_ahead)
+            print(f"Created {len(created)} partitions: {', '.join(created) or '-'}")
+        if args.archive:
+            archived = archive_finalized_months(db)
+            for year, month, rows in archived:
+                print(f"Archived {year}-{month:02d}: {rows} rows")
+            print(f"Archived {len(archived)} months")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+"""
+Incremental maintenance of MonthlyAttendanceSummary.
+
+Attendance writes and time-off approvals apply deltas to the summary row of
+the affected month, so readers get one row per employee per month instead of
+aggregating raw attendance. `rebuild_monthly_summaries` recomputes a month
+from scratch for repairs and backfills. `finalize_month` closes a month once
+it has been paid; finalized months are never touched again and can be
+archived.
+
+    python -m app.services.attendance_summary --year 2024 --month 6
+    python -m app.services.attendance_summary --year 2024 --month 6 --finalize
+"""
+import argparse
+import calendar
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy import and_, case, func, select, update
+from sqlalchemy.orm import Session
+from app.models.attendance import Attendance, MonthlyAttendanceSummary
+from app.models.employee import Employee, WorkingSchedule
+from app.models.timeoff import TimeOffRequest
+from app.core.utils import dialect_insert
+
+DELTA_COLUMNS = (
+    "days_present",
+    "days_absent",
+    "paid_leaves_taken",
+    "unpaid_leaves_taken",
+    "total_work_hours",
+    "total_extra_hours",
+)
+
+REBUILD_BATCH_SIZE = 1000
+
+# Average weeks in a month, to turn working_days_per_month into a work week
+WEEKS_PER_MONTH = 4.35
+
+def _not_finalized():
+    return MonthlyAttendanceSummary.is_finalized.is_not(True)
+
+def _month_end(year: int, month: int) -> date:
+    return date(year, month, calendar.monthrange(year, month)[1])
+
+def _working_days(emp_id: str, year: int, month: int):
+    # The schedule in effect by the end of the month, as rebuild_monthly_summaries uses
+    return func.coalesce(
+        select(WorkingSchedule.working_days_per_month)
+        .where(WorkingSchedule.emp_id == emp_id, WorkingSchedule.effective_from <= _month_end(year, month))
+        .order_by(WorkingSchedule.effective_from.desc(), WorkingSchedule.schedule_id.desc())
+        .limit(1)
+        .scalar_subquery(),
+        22
+    )
+
+def apply_summary_delta(db: Session, emp_id: str, year: int, month: int, **deltas) -> None:
+    """Add `deltas` to the employee's summary for the month in one upsert"""
+    unknown = set(deltas) - set(DELTA_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown summary columns: {', '.join(sorted(unknown))}")
+    if not any(deltas.values()):
+        return
+
+    stmt = dialect_insert(db)(MonthlyAttendanceSummary).values(
+        emp_id=emp_id,
+        year=year,
+        month=month,
+        total_working_days=_working_days(emp_id, year, month),
+        **{column: deltas.get(column, 0) for column in DELTA_COLUMNS}
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[MonthlyAttendanceSummary.emp_id, MonthlyAttendanceSummary.month, MonthlyAttendanceSummary.year],
+        set_={
+            **{
+                column: func.coalesce(getattr(MonthlyAttendanceSummary, column), 0) + getattr(stmt.excluded, column)
+                for column in deltas
+            },
+            "updated_at": datetime.utcnow()
+        },
+        where=_not_finalized()
+    )
+    db.execute(stmt)
+
+def apply_summary_deltas(db: Session, deltas: Dict[Tuple[str, int, int], Dict[str, int]]) -> None:
+    """apply_summary_delta for many (emp_id, year, month) keys in one batched upsert"""
+    if not deltas:
+        return
+    # One lookup per month touched, each against the schedules in effect by its end
+    months = defaultdict(set)
+    for emp_id, year, month in deltas:
+        months[(year, month)].add(emp_id)
+    working_days = {
+        (year, month): working_days_per_month(db, emp_ids, until=_month_end(year, month))
+        for (year, month), emp_ids in months.items()
+    }
+    now = datetime.utcnow()
+    rows = [
+        {
+            "emp_id": emp_id,
+            "year": year,
+            "month": month,
+            "total_working_days": working_days[(year, month)].get(emp_id) or 22,
+            **{column: values.get(column, 0) for column in DELTA_COLUMNS},
+            "updated_at": now
+        }
+        for (emp_id, year, month), values in deltas.items()
+    ]
+
+    stmt = dialect_insert(db)(MonthlyAttendanceSummary)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[MonthlyAttendanceSummary.emp_id, MonthlyAttendanceSummary.month, MonthlyAttendanceSummary.year],
+        set_={
+            **{
+                column: func.coalesce(getattr(MonthlyAttendanceSummary, column), 0) + getattr(stmt.excluded, column)
+                for column in DELTA_COLUMNS
+            },
+            "updated_at": stmt.excluded.updated_at
+        },
+        where=_not_finalized()
+    )
+    db.execute(stmt, rows)
+
+def _recorded(column, emp_id: str, attendance_date: date):
+    return func.coalesce(
+        select(column)
+        .where(Attendance.emp_id == emp_id, Attendance.attendance_date == attendance_date)
+        .scalar_subquery(),
+        0
+    )
+
+def retract_attendance_hours(db: Session, emp_id: str, attendance_date: date) -> None:
+    """
+    Subtract the hours currently recorded on an attendance row from its
+    summary. Call before overwriting the row's hours, then apply the new hours.
+    """
+    db.execute(
+        update(MonthlyAttendanceSummary)
+        .where(
+            MonthlyAttendanceSummary.emp_id == emp_id,
+            MonthlyAttendanceSummary.year == attendance_date.year,
+            MonthlyAttendanceSummary.month == attendance_date.month,
+            _not_finalized()
+        )
+        .values(
+            total_work_hours=MonthlyAttendanceSummary.total_work_hours - _recorded(Attendance.work_hours, emp_id, attendance_date),
+            total_extra_hours=MonthlyAttendanceSummary.total_extra_hours - _recorded(Attendance.extra_hours, emp_id, attendance_date),
+            updated_at=datetime.utcnow()
+        )
+    )
+
+def retract_day_status(db: Session, emp_id: str, attendance_date: date) -> None:
+    """
+    Subtract what a day currently counts as in its summary: the status
+    recorded on its attendance row (present or absent) and, when approved
+    leave covers it, one day of that leave, since a day worked is not a leave
+    day. Call before a check-in turns the day into a present day.
+    """
+    recorded = db.execute(
+        select(
+            select(Attendance.status)
+            .where(Attendance.emp_id == emp_id, Attendance.attendance_date == attendance_date)
+            .scalar_subquery(),
+            select(TimeOffRequest.time_off_type)
+            .where(
+                TimeOffRequest.emp_id == emp_id,
+                TimeOffRequest.status == "approved",
+                TimeOffRequest.start_date <= attendance_date,
+                TimeOffRequest.end_date >= attendance_date
+            )
+            .limit(1)
+            .scalar_subquery()
+        )
+    ).one()
+    status, time_off_type = recorded
+
+    deltas = defaultdict(int)
+    if status == "present":
+        deltas["days_present"] -= 1
+    elif status == "absent":
+        deltas["days_absent"] -= 1
+    if time_off_type is not None:
+        # Leave was only counted on the employee's working days
+        workweek = days_per_week(working_days_per_month(db, [emp_id], until=attendance_date).get(emp_id))
+        if attendance_date.weekday() < workweek:
+            deltas[_leave_column(time_off_type)] -= 1
+    apply_summary_delta(db, emp_id, attendance_date.year, attendance_date.month, **deltas)
+
+def working_days_per_month(db: Session, emp_ids: Iterable[str], until: Optional[date] = None) -> Dict[str, int]:
+    """Scheduled working days per month for each employee, from their latest schedule effective by `until`"""
+    latest = select(
+        WorkingSchedule.emp_id,
+        WorkingSchedule.working_days_per_month,
+        func.row_number().over(
+            partition_by=WorkingSchedule.emp_id,
+            order_by=(WorkingSchedule.effective_from.desc(), WorkingSchedule.schedule_id.desc())
+        ).label("position")
+    ).where(WorkingSchedule.emp_id.in_(list(emp_ids)))
+    if until is not None:
+        latest = latest.where(WorkingSchedule.effective_from <= until)
+    latest = latest.subquery()
+    return dict(db.execute(
+        select(latest.c.emp_id, latest.c.working_days_per_month).where(latest.c.position == 1)
+    ).all())
+
+def days_per_week(working_days: int) -> int:
+    """Work week implied by a schedule's working days per month (22 -> Mon-Fri, 26 -> Mon-Sat)"""
+    return min(7, max(1, round((working_days or 22) / WEEKS_PER_MONTH)))
+
+def _leave_days_by_month(start_date: date, end_date: date, workweek: int = 5) -> Dict[Tuple[int, int], int]:
+    """Working days between two dates (inclusive), grouped by (year, month)"""
+    days = defaultdict(int)
+    current = start_date
+    while current <= end_date:
+        if current.weekday() < workweek:
+            days[(current.year, current.month)] += 1
+        current += timedelta(days=1)
+    return days
+
+def count_working_days(start_date: date, end_date: date, workweek: int = 5) -> int:
+    return sum(_leave_days_by_month(start_date, end_date, workweek).values())
+
+def _leave_column(time_off_type: str) -> str:
+    return "unpaid_leaves_taken" if time_off_type == "unpaid_leave" else "paid_leaves_taken"
+
+def apply_timeoff_delta(
+    db: Session,
+    emp_id: str,
+    time_off_type: str,
+    start_date: date,
+    end_date: date,
+    sign: int = 1,
+    workweek: int = 5
+) -> None:
+    """Count an approved time-off request (or, with sign=-1, a revoked one) in each month it spans"""
+    column = _leave_column(time_off_type)
+    for (year, month), days in _leave_days_by_month(start_date, end_date, workweek).items():
+        apply_summary_delta(db, emp_id, year, month, **{column: sign * days})
+
+def apply_timeoff_deltas(db: Session, requests: Iterable, sign: int = 1) -> None:
+    """
+    apply_timeoff_delta for many requests (rows with emp_id, time_off_type,
+    start_date and end_date) in one batched upsert
+    """
+    requests = list(requests)
+    if not requests:
+        return
+    working_days = working_days_per_month(db, {request.emp_id for request in requests})
+    deltas = defaultdict(lambda: defaultdict(int))
+    for request in requests:
+        workweek = days_per_week(working_days.get(request.emp_id))
+        column = _leave_column(request.time_off_type)
+        for (year, month), days in _leave_days_by_month(request.start_date, request.end_date, workweek).items():
+            deltas[(request.emp_id, year, month)][column] += sign * days
+    apply_summary_deltas(db, deltas)
+
+def _employee_batches(db: Session, batch_size: int) -> Iterator[List[str]]:
+    last_emp_id = None
+    while True:
+        query = db.query(Employee.emp_id).filter(Employee.is_active == True)
+        if last_emp_id is not None:
+            query = query.filter(Employee.emp_id > last_emp_id)
+        batch = [emp_id for (emp_id,) in query.order_by(Employee.emp_id).limit(batch_size)]
+        if not batch:
+            return
+        yield batch
+        last_emp_id = batch[-1]
+
+def rebuild_monthly_summaries(
+    db: Session,
+    year: int,
+    month: int,
+    batch_size: int = REBUILD_BATCH_SIZE,
+    progress: Optional[Callable[[int], None]] = None
+) -> int:
+    """
+    Recompute one month's summaries with one grouped aggregate per batch of
+    employees. Finalized summaries are left untouched. Returns the number of
+    employees processed; `progress` is called with the running total after
+    each batch.
+    """
+    first_day = date(year, month, 1)
+    last_day = _month_end(year, month)
+    processed = 0
+
+    for emp_ids in _employee_batches(db, batch_size):
+        attendance = {
+            row.emp_id: row
+            for row in db.query(
+                Attendance.emp_id,
+                func.sum(case((Attendance.status == "present", 1), else_=0)).label("days_present"),
+                func.sum(case((Attendance.status == "absent", 1), else_=0)).label("days_absent"),
+                func.coalesce(func.sum(Attendance.work_hours), 0).label("total_work_hours"),
+                func.coalesce(func.sum(Attendance.extra_hours), 0).label("total_extra_hours"),
+            )
+            .filter(
+                Attendance.emp_id.in_(emp_ids),
+                Attendance.attendance_date.between(first_day, last_day)
+            )
+            .group_by(Attendance.emp_id)
+        }
+
+        working_days = working_days_per_month(db, emp_ids, until=last_day)
+
+        leaves = defaultdict(lambda: {"paid_leaves_taken": 0, "unpaid_leaves_taken": 0})
+        for request in db.query(
+            TimeOffRequest.emp_id,
+            TimeOffRequest.time_off_type,
+            TimeOffRequest.start_date,
+            TimeOffRequest.end_date
+        ).filter(
+            TimeOffRequest.emp_id.in_(emp_ids),
+            TimeOffRequest.status == "approved",
+            TimeOffRequest.start_date <= last_day,
+            TimeOffRequest.end_date >= first_day
+        ):
+            leaves[request.emp_id][_leave_column(request.time_off_type)] += _leave_days_by_month(
+                max(request.start_date, first_day),
+                min(request.end_date, last_day),
+                days_per_week(working_days.get(request.emp_id))
+            )[(year, month)]
+
+        # Days worked during approved leave count as present, not as leave
+        for row in db.query(
+            Attendance.emp_id,
+            Attendance.attendance_date,
+            TimeOffRequest.time_off_type
+        ).join(
+            TimeOffRequest,
+            and_(
+                TimeOffRequest.emp_id == Attendance.emp_id,
+                TimeOffRequest.status == "approved",
+                TimeOffRequest.start_date <= Attendance.attendance_date,
+                TimeOffRequest.end_date >= Attendance.attendance_date
+            )
+        ).filter(
+            Attendance.emp_id.in_(emp_ids),
+            Attendance.attendance_date.between(first_day, last_day),
+            Attendance.status == "present"
+        ):
+            if row.attendance_date.weekday() < days_per_week(working_days.get(row.emp_id)):
+                leaves[row.emp_id][_leave_column(row.time_off_type)] -= 1
+
+        now = datetime.utcnow()
+        rows = []
+        for emp_id in emp_ids:
+            totals = attendance.get(emp_id)
+            rows.append({
+                "emp_id": emp_id,
+                "year": year,
+                "month": month,
+                "total_working_days": working_days.get(emp_id) or 22,
+                "days_present": int(totals.days_present) if totals else 0,
+                "days_absent": int(totals.days_absent) if totals else 0,
+                "paid_leaves_taken": Decimal(leaves[emp_id]["paid_leaves_taken"]),
+                "unpaid_leaves_taken": Decimal(leaves[emp_id]["unpaid_leaves_taken"]),
+                "total_work_hours": Decimal(str(totals.total_work_hours)) if totals else Decimal("0"),
+                "total_extra_hours": Decimal(str(totals.total_extra_hours)) if totals else Decimal("0"),
+                "updated_at": now
+            })
+
+        stmt = dialect_insert(db)(MonthlyAttendanceSummary)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MonthlyAttendanceSummary.emp_id, MonthlyAttendanceSummary.month, MonthlyAttendanceSummary.year],
+            set_={
+                column: getattr(stmt.excluded, column)
+                for column in ("total_working_days", *DELTA_COLUMNS, "updated_at")
+            },
+            where=_not_finalized()
+        )
+        db.execute(stmt, rows)
+        db.commit()
+        processed += len(emp_ids)
+        if progress is not None:
+            progress(processed)
+
+    return processed
+
+def finalize_month(db: Session, year: int, month: int) -> int:
+    """Mark a month's summaries final. Returns the rows finalized; the caller commits."""
+    return db.execute(
+        update(MonthlyAttendanceSummary)
+        .where(MonthlyAttendanceSummary.year == year, MonthlyAttendanceSummary.month == month, _not_finalized())
+        .values(is_finalized=True, updated_at=datetime.utcnow())
+    ).rowcount
+
+def main():
+    from app.database import SessionLocal
+
+    today = date.today()
+    parser = argparse.ArgumentParser(description="Rebuild monthly attendance summaries")
+    parser.add_argument("--year", type=int, default=today.year)
+    parser.add_argument("--month", type=int, default=today.month)
+    parser.add_argument("--batch-size", type=int, default=REBUILD_BATCH_SIZE)
+    parser.add_argument("--finalize", action="store_true", help="close the month after rebuilding it (payroll does this too)")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        processed = rebuild_monthly_summaries(db, args.year, args.month, args.batch_size)
+        print(f"Rebuilt {args.year}-{args.month:02d} summaries for {processed} employees")
+        if args.finalize:
+            finalized = finalize_month(db, args.year, args.month)
+            db.commit()
+            print(f"Finalized {finalized} summaries")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Streaming exports.
+
+Rows are read through a server-side cursor (`yield_per`) and encoded chunk by
+chunk, so memory stays flat whatever the date range. CSV and JSONL are always
+available. Parquet needs the optional `pyarrow` package
+(`pip install pyarrow`); each chunk becomes one row group.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Iterator, List, Optional, Sequence
+from sqlalchemy import Boolean, Date, DateTime, Integer, Numeric, String, Time, cast, select
+from sqlalchemy.orm import Session
+from app.models.employee import Employee
+from app.models.payroll import PayrollResult
+from app.services.attendance_storage import attendance_history
+
+CHUNK_ROWS = 5000
+
+FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+# Every employee column except the password hash
+EMPLOYEE_EXPORT_COLUMNS = [
+    cast(column, String).label(column.name) if column.name == "role" else column
+    for column in Employee.__table__.columns
+    if column.name != "password_hash"
+]
+
+def attendance_statement(start_date: date, end_date: date, emp_id: Optional[str] = None):
+    """Hot and archived attendance in a date range"""
+    history = attendance_history()
+    stmt = select(*history.c).where(history.c.attendance_date.between(start_date, end_date))
+    if emp_id is not None:
+        stmt = stmt.where(history.c.emp_id == emp_id)
+    return stmt.order_by(history.c.attendance_date, history.c.emp_id)
+
+def employees_statement(include_inactive: bool = False):
+    stmt = select(*EMPLOYEE_EXPORT_COLUMNS)
+    if not include_inactive:
+        stmt = stmt.where(Employee.is_active == True)
+    return stmt.order_by(Employee.emp_id)
+
+def payroll_statement(year: int, month: int):
+    return (
+        select(*PayrollResult.__table__.columns)
+        .where(PayrollResult.year == year, PayrollResult.month == month)
+        .order_by(PayrollResult.emp_id)
+    )
+
+def iter_chunks(db: Session, stmt, chunk_rows: int = CHUNK_ROWS) -> Iterator[Sequence]:
+    """Rows of `stmt` in lists of at most `chunk_rows`, fetched through a server-side cursor"""
+    result = db.execute(stmt.execution_options(yield_per=chunk_rows))
+    try:
+        for partition in result.partitions():
+            yield partition
+    finally:
+        result.close()
+
+def _json_default(value):
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def encode_csv(columns: List[str], chunks: Iterator[Sequence]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in chunks:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+def encode_jsonl(columns: List[str], chunks: Iterator[Sequence]) -> Iterator[bytes]:
+    encoder = json.JSONEncoder(default=_json_default, separators=(",", ":"))
+    for rows in chunks:
+        yield "".join(encoder.encode(dict(zip(columns, row))) + "\n" for row in rows).encode()
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands written bytes back to the generator between row groups"""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+def _arrow_type(column):
+    import pyarrow as pa
+
+    if isinstance(column.type, Boolean):
+        return pa.bool_()
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, Numeric):
+        return pa.decimal128(column.type.precision or 38, column.type.scale or 0)
+    if isinstance(column.type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(column.type, Date):
+        return pa.date32()
+    if isinstance(column.type, Time):
+        return pa.time64("us")
+    return pa.string()
+
+def encode_parquet(stmt, chunks: Iterator[Sequence]) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(column.name, _arrow_type(column)) for column in stmt.selected_columns])
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for rows in chunks:
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)],
+                schema=schema
+            ))
+            yield sink.drain()
+    yield sink.drain()
+
+def stream_export(session_factory, stmt, fmt: str, chunk_rows: int = CHUNK_ROWS) -> Iterator[bytes]:
+    """
+    Encoded export of `stmt`. Opens its own session so the cursor lives
+    exactly as long as the response body is being sent.
+    """
+    columns = [column.name for column in stmt.selected_columns]
+    with session_factory() as db:
+        chunks = iter_chunks(db, stmt, chunk_rows)
+        if fmt == "csv":
+            yield from encode_csv(columns, chunks)
+        elif fmt == "jsonl":
+            yield from encode_jsonl(columns, chunks)
+        elif fmt == "parquet":
+            yield from encode_parquet(stmt, chunks)
+        else:
+            raise ValueError(f"Unknown export format: {fmt}")
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+Maintenance of the employee_hierarchy closure table.
+
+Every employee has a depth-0 row to themselves and one row per manager
+above them, so direct reports, whole subtrees and the chain to the top are
+each one indexed lookup. New employees are linked with one recursive
+INSERT ... SELECT, a manager change rewires the moved subtree with one
+DELETE and one INSERT (manager changes take turns, so two of them cannot
+form a cycle between them), and `rebuild_hierarchy` recomputes the table
+from employees.manager_id for repairs.
+
+    python -m app.services.hierarchy --rebuild
+"""
+import argparse
+from typing import List, Optional
+from sqlalchemy import delete, func, literal, select, true, update
+from sqlalchemy.orm import Session, aliased
+from app.models.employee import Employee, EmployeeHierarchy
+
+# Guards the recursive walk against manager_id cycles in bad data
+MAX_DEPTH = 64
+
+# PostgreSQL advisory lock key held by manager changes for their transaction
+MOVE_LOCK_KEY = 7021654953
+
+def link_statement(emp_ids: Optional[List[str]] = None):
+    """INSERT of the closure rows of the given employees (all employees when None), walking manager_id upwards"""
+    start = select(
+        Employee.emp_id.label("ancestor_id"),
+        Employee.emp_id.label("descendant_id"),
+        literal(0).label("depth")
+    )
+    if emp_ids is not None:
+        start = start.where(Employee.emp_id.in_(emp_ids))
+    chain = start.cte("chain", recursive=True)
+
+    manager = aliased(Employee)
+    chain = chain.union_all(
+        select(manager.manager_id, chain.c.descendant_id, chain.c.depth + 1)
+        .join(manager, manager.emp_id == chain.c.ancestor_id)
+        .where(manager.manager_id.is_not(None), chain.c.depth < MAX_DEPTH)
+    )
+    return EmployeeHierarchy.__table__.insert().from_select(
+        ["ancestor_id", "descendant_id", "depth"],
+        select(chain.c.ancestor_id, chain.c.descendant_id, chain.c.depth)
+    )
+
+def link_employees(db: Session, emp_ids: List[str]) -> None:
+    """Add newly inserted employees to the hierarchy (call in the transaction that inserts them)"""
+    if emp_ids:
+        db.execute(link_statement(emp_ids))
+
+def is_in_subtree(db: Session, manager_id: str, emp_id: str) -> bool:
+    """Whether emp_id is manager_id or reports to them at any depth"""
+    return db.execute(
+        select(EmployeeHierarchy.depth).where(
+            EmployeeHierarchy.ancestor_id == manager_id,
+            EmployeeHierarchy.descendant_id == emp_id
+        )
+    ).first() is not None
+
+def _lock_for_move(db: Session, emp_id: str, manager_id: Optional[str]) -> set:
+    """
+    Lock what a manager change reads before it checks for cycles; returns the
+    ids of the two employees that exist. Moves on disjoint rows can still close
+    a cycle together (a under b while b's manager goes under a), so on
+    PostgreSQL an advisory lock makes moves take turns. SQLite has a single
+    writer, so there the manager_id update, which runs before the check,
+    takes the lock.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(select(func.pg_advisory_xact_lock(MOVE_LOCK_KEY)))
+    return set(db.execute(
+        select(Employee.emp_id)
+        .where(Employee.emp_id.in_([emp_id] if manager_id is None else [emp_id, manager_id]))
+        .order_by(Employee.emp_id)
+        .with_for_update()
+    ).scalars())
+
+def move_employee(db: Session, emp_id: str, manager_id: Optional[str]) -> None:
+    """Set an employee's manager and move their whole subtree with them"""
+    found = _lock_for_move(db, emp_id, manager_id)
+    if manager_id is not None and manager_id not in found:
+        db.rollback()
+        raise ValueError("Manager not found")
+    db.execute(update(Employee).where(Employee.emp_id == emp_id).values(manager_id=manager_id))
+    if manager_id is not None and is_in_subtree(db, emp_id, manager_id):
+        db.rollback()
+        raise ValueError("An employee cannot report to themselves or to one of their reports")
+
+    subtree = select(EmployeeHierarchy.descendant_id).where(EmployeeHierarchy.ancestor_id == emp_id)
+    # Detach the subtree from its old managers
+    db.execute(
+        delete(EmployeeHierarchy).where(
+            EmployeeHierarchy.descendant_id.in_(subtree),
+            EmployeeHierarchy.ancestor_id.not_in(subtree)
+        )
+    )
+    if manager_id is not None:
+        # Attach it under every manager in the new chain
+        above = aliased(EmployeeHierarchy)
+        below = aliased(EmployeeHierarchy)
+        db.execute(
+            EmployeeHierarchy.__table__.insert().from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(above.ancestor_id, below.descendant_id, above.depth + below.depth + 1)
+                .select_from(above)
+                .join(below, true())
+                .where(above.descendant_id == manager_id, below.ancestor_id == emp_id)
+            )
+        )
+    db.commit()
+
+def rebuild_hierarchy(db: Session) -> int:
+    """Recompute the closure table from employees.manager_id. Returns the number of rows."""
+    db.execute(delete(EmployeeHierarchy))
+    db.execute(link_statement())
+    db.commit()
+    return db.query(EmployeeHierarchy).count()
+
+def main():
+    from app.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Maintain the employee hierarchy closure table")
+    parser.add_argument("--rebuild", action="store_true", help="recompute it from employees.manager_id")
+    args = parser.parse_args()
+    if not args.rebuild:
+        parser.error("nothing to do; pass --rebuild")
+
+    with SessionLocal() as db:
+        rows = rebuild_hierarchy(db)
+    print(f"Rebuilt employee hierarchy: {rows} rows")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Background jobs.
+
+Requests enqueue work with `enqueue` and get a job id back at once. Worker
+threads claim due jobs from the `jobs` table and run the handler registered
+for the job's kind. A claim is one UPDATE ... RETURNING on the oldest due
+job, picked with FOR UPDATE SKIP LOCKED on PostgreSQL so workers never
+block each other. SQLite serializes writers, and the status guard turns a
+lost race into a no-op.
+
+A failed job is retried with exponential backoff until it has used
+max_attempts. A running job whose worker has not reported progress for
+JOB_LOCK_TIMEOUT_SECONDS is assumed lost and requeued.
+
+Maintenance registered with `periodic_job` is enqueued by the workers
+themselves whenever the last run of its kind is older than its interval.
+
+Handlers take (db, payload, progress) and return a JSON-serializable dict.
+`progress(percent, message)` is saved at once, so GET /jobs/{job_id}
+shows it.
+
+    python -m app.services.jobs --workers 4
+"""
+import argparse
+import logging
+import os
+import socket
+import threading
+import time
+import traceback
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.employee import Employee
+from app.models.job import Job
+from app.services.attendance_storage import archive_finalized_months, ensure_partitions
+from app.services.attendance_summary import rebuild_monthly_summaries
+from app.services.payroll import run_payroll
+from app.services.timeoff import sync_leave_presence
+
+logger = logging.getLogger(__name__)
+
+Progress = Callable[..., None]
+JOB_HANDLERS: Dict[str, Callable[[Session, dict, Progress], Optional[dict]]] = {}
+# kind -> seconds between runs
+PERIODIC_JOBS: Dict[str, float] = {}
+
+# How often one worker per pool looks for jobs left behind by dead workers and
+# enqueues the periodic jobs that are due
+STALE_SWEEP_SECONDS = 60
+
+def job_handler(kind: str):
+    """Register the decorated function as the handler for `kind`"""
+    def register(fn):
+        JOB_HANDLERS[kind] = fn
+        return fn
+    return register
+
+def periodic_job(kind: str, every_seconds: float):
+    """Register the decorated function as the handler for `kind` and run it every `every_seconds` (0 = never)"""
+    def register(fn):
+        if every_seconds > 0:
+            PERIODIC_JOBS[kind] = every_seconds
+        return job_handler(kind)(fn)
+    return register
+
+def enqueue(
+    db: Session,
+    kind: str,
+    payload: Optional[dict] = None,
+    created_by: Optional[str] = None,
+    max_attempts: Optional[int] = None
+) -> Job:
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job kind: {kind}")
+    job = Job(
+        kind=kind,
+        payload=payload or {},
+        created_by=created_by,
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+def claim_job(db: Session, worker_id: str):
+    """Mark the oldest due job as running for `worker_id`; None when the queue is empty"""
+    now = datetime.utcnow()
+    due = (
+        select(Job.job_id)
+        .where(Job.status == "queued", Job.run_after <= now)
+        .order_by(Job.run_after, Job.job_id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    job = db.execute(
+        update(Job)
+        .where(Job.job_id == due, Job.status == "queued")
+        .values(status="running", attempts=Job.attempts + 1, locked_by=worker_id, locked_at=now, updated_at=now)
+        .returning(Job.job_id, Job.kind, Job.payload, Job.attempts, Job.max_attempts)
+        .execution_options(synchronize_session=False)
+    ).one_or_none()
+    db.commit()
+    return job
+
+def retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=settings.JOB_RETRY_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0))
+
+def _owned(job_id: int, worker_id: str):
+    # A job requeued from under a slow worker belongs to someone else now
+    return update(Job).where(Job.job_id == job_id, Job.locked_by == worker_id).execution_options(synchronize_session=False)
+
+def _progress_reporter(session_factory, job_id: int, worker_id: str) -> Progress:
+    def report(percent: float, message: Optional[str] = None) -> None:
+        with session_factory() as db:
+            db.execute(_owned(job_id, worker_id).values(
+                progress=max(0, min(100, int(percent))),
+                progress_message=message,
+                locked_at=datetime.utcnow()
+            ))
+            db.commit()
+    return report
+
+def run_job(session_factory, job, worker_id: str) -> bool:
+    """Run a claimed job and record the outcome. Returns True when it succeeded."""
+    progress = _progress_reporter(session_factory, job.job_id, worker_id)
+    with session_factory() as db:
+        try:
+            handler = JOB_HANDLERS.get(job.kind)
+            if handler is None:
+                raise LookupError(f"No handler for job kind {job.kind!r}")
+            result = handler(db, job.payload, progress)
+        except Exception:
+            db.rollback()
+            now = datetime.utcnow()
+            error = traceback.format_exc()
+            logger.warning("Job %s (%s) failed on attempt %s/%s", job.job_id, job.kind, job.attempts, job.max_attempts)
+            if job.attempts < job.max_attempts:
+                values = {"status": "queued", "run_after": now + retry_delay(job.attempts)}
+            else:
+                values = {"status": "failed", "finished_at": now}
+            db.execute(_owned(job.job_id, worker_id).values(last_error=error, locked_by=None, **values))
+            db.commit()
+            return False
+
+        db.execute(_owned(job.job_id, worker_id).values(
+            status="succeeded",
+            progress=100,
+            result=result,
+            locked_by=None,
+            finished_at=datetime.utcnow()
+        ))
+        db.commit()
+        return True
+
+def requeue_stale_jobs(db: Session) -> int:
+    """Requeue (or fail, when out of attempts) running jobs whose worker went quiet"""
+    now = datetime.utcnow()
+    cutoff = now - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS)
+    requeued = db.execute(
+        update(Job)
+        .where(Job.status == "running", Job.locked_at < cutoff)
+        .values(
+            status=case((Job.attempts >= Job.max_attempts, "failed"), else_="queued"),
+            finished_at=case((Job.attempts >= Job.max_attempts, now), else_=None),
+            locked_by=None,
+            last_error="Worker stopped responding"
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return requeued
+
+def enqueue_periodic_jobs(db: Session) -> List[Job]:
+    """Enqueue each periodic job that is not already pending and has not been enqueued within its interval"""
+    now = datetime.utcnow()
+    enqueued = []
+    for kind, every_seconds in PERIODIC_JOBS.items():
+        recent = db.execute(
+            select(Job.job_id)
+            .where(Job.kind == kind)
+            .where((Job.status.in_(("queued", "running"))) | (Job.created_at > now - timedelta(seconds=every_seconds)))
+            .limit(1)
+        ).first()
+        if recent is None:
+            enqueued.append(enqueue(db, kind))
+    return enqueued
+
+class WorkerPool:
+    """`concurrency` threads that claim and run jobs until stopped"""
+
+    def __init__(self, concurrency: int, session_factory=None, poll_interval: Optional[float] = None):
+        if session_factory is None:
+            from app.database import SessionLocal as session_factory
+        self.concurrency = concurrency
+        self.session_factory = session_factory
+        self.poll_interval = settings.JOB_POLL_INTERVAL_SECONDS if poll_interval is None else poll_interval
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        prefix = f"{socket.gethostname()}:{os.getpid()}:{id(self):x}"
+        for index in range(self.concurrency):
+            thread = threading.Thread(target=self._run, args=(f"{prefix}:{index}"[-64:], index == 0), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop claiming jobs and wait for the running ones to finish"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def _run(self, worker_id: str, sweeps: bool) -> None:
+        last_sweep = float("-inf")
+        while not self._stop.is_set():
+            try:
+                if sweeps and time.monotonic() - last_sweep > STALE_SWEEP_SECONDS:
+                    with self.session_factory() as db:
+                        requeue_stale_jobs(db)
+                        enqueue_periodic_jobs(db)
+                    last_sweep = time.monotonic()
+                with self.session_factory() as db:
+                    job = claim_job(db, worker_id)
+                if job is not None:
+                    run_job(self.session_factory, job, worker_id)
+                    continue
+            except Exception:
+                logger.exception("Job worker %s hit an error", worker_id)
+            self._stop.wait(self.poll_interval)
+
+@job_handler("attendance_summaries")
+def _rebuild_attendance_summaries(db: Session, payload: dict, progress: Progress) -> dict:
+    total = db.query(func.count(Employee.emp_id)).filter(Employee.is_active == True).scalar() or 1
+    processed = rebuild_monthly_summaries(
+        db, payload["year"], payload["month"],
+        progress=lambda done: progress(done * 100 / total, f"{done}/{total} employees")
+    )
+    return {"employees": processed}
+
+@job_handler("payroll")
+def _run_payroll(db: Session, payload: dict, progress: Progress) -> dict:
+    return {"employees": run_payroll(db, payload["year"], payload["month"])}
+
+@periodic_job("attendance_storage", settings.ATTENDANCE_STORAGE_INTERVAL_SECONDS)
+def _maintain_attendance_storage(db: Session, payload: dict, progress: Progress) -> dict:
+    partitions = ensure_partitions(db)
+    progress(50, f"{len(partitions)} partitions created")
+    archived = archive_finalized_months(db)
+    return {
+        "partitions_created": partitions,
+        "months_archived": [{"year": year, "month": month, "rows": rows} for year, month, rows in archived]
+    }
+
+@periodic_job("leave_presence", settings.LEAVE_PRESENCE_INTERVAL_SECONDS)
+def _sync_leave_presence(db: Session, payload: dict, progress: Progress) -> dict:
+    return sync_leave_presence(db)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run background job workers")
+    parser.add_argument("--workers", type=int, default=max(settings.JOB_WORKERS, 1))
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    pool = WorkerPool(args.workers)
+    pool.start()
+    print(f"Running {args.workers} job workers; Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pool.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+import csv
+import io
+import json
+from collections import defaultdict
+from datetime import date, datetime
+from typing import IO, Dict, Iterator, List, Tuple
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.models.employee import Employee, WorkingSchedule, EmployeeStatusTracker, RoleEnum
+from app.models.timeoff import TimeOffBalance
+from app.schemas.employee import EmployeeCreate
+from app.core.security import get_password_hashes, generate_temp_password
+from app.core.utils import employee_id_prefix, reserve_employee_serials, format_employee_id
+from app.core.search_index import employee_search_index
+from app.services.hierarchy import link_employees
+
+CHUNK_SIZE = 500
+
+def default_schedule(emp_id: str, date_of_joining: date) -> dict:
+    return {
+        "emp_id": emp_id,
+        "total_working_hours": 8,
+        "break_time_hours": 1,
+        "working_days_per_month": 22,
+        "effective_from": date_of_joining
+    }
+
+def default_timeoff_balance(emp_id: str, year: int) -> dict:
+    return {
+        "emp_id": emp_id,
+        "year": year,
+        "paid_time_off_total": 12.0,
+        "sick_leave_total": 7.0
+    }
+
+def default_status(emp_id: str) -> dict:
+    return {
+        "emp_id": emp_id,
+        "current_status": "absent",
+        "status_indicator": "yellow"
+    }
+
+def iter_upload_rows(upload: IO[bytes], fmt: str) -> Iterator[Tuple[int, dict]]:
+    """Yield (row number, raw record) pairs without reading the whole upload into memory"""
+    text = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+    if fmt == "csv":
+        for row_number, record in enumerate(csv.DictReader(text), start=1):
+            # Empty CSV cells mean "not provided"
+            yield row_number, {key: value for key, value in record.items() if key and value not in ("", None)}
+    elif fmt == "jsonl":
+        row_number = 0
+        for line in text:
+            if not line.strip():
+                continue
+            row_number += 1
+            try:
+                yield row_number, json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield row_number, {"__error__": f"Invalid JSON: {exc.msg}"}
+    else:
+        raise ValueError(f"Unsupported upload format: {fmt}")
+
+def _chunks(rows: Iterator[Tuple[int, dict]], size: int) -> Iterator[List[Tuple[int, dict]]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _validate_chunk(
+    db: Session,
+    chunk: List[Tuple[int, dict]],
+    seen_emails: set,
+    errors: List[dict]
+) -> List[Tuple[int, EmployeeCreate]]:
+    valid = []
+    for row_number, record in chunk:
+        if "__error__" in record:
+            errors.append({"row": row_number, "error": record["__error__"]})
+            continue
+        try:
+            data = EmployeeCreate(**record)
+        except ValidationError as exc:
+            message = "; ".join(
+                f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in exc.errors()
+            )
+            errors.append({"row": row_number, "error": message})
+            continue
+        if data.role not in RoleEnum.__members__:
+            errors.append({"row": row_number, "error": f"Invalid role: {data.role}"})
+            continue
+        if data.email in seen_emails:
+            errors.append({"row": row_number, "error": "Duplicate email in upload"})
+            continue
+        seen_emails.add(data.email)
+        valid.append((row_number, data))
+
+    # One query per chunk for emails that are already registered
+    emails = [data.email for _, data in valid]
+    registered = {
+        email for (email,) in db.query(Employee.email).filter(Employee.email.in_(emails))
+    } if emails else set()
+    for row_number, data in valid:
+        if data.email in registered:
+            errors.append({"row": row_number, "error": "Email already registered"})
+    return [(row_number, data) for row_number, data in valid if data.email not in registered]
+
+def _insert_rows(db: Session, employees: List[dict], year: int) -> None:
+    """Multi-row INSERTs into all four onboarding tables, plus the hierarchy"""
+    db.execute(insert(Employee), employees)
+    db.execute(insert(WorkingSchedule), [
+        default_schedule(emp["emp_id"], emp["date_of_joining"]) for emp in employees
+    ])
+    db.execute(insert(TimeOffBalance), [
+        default_timeoff_balance(emp["emp_id"], year) for emp in employees
+    ])
+    db.execute(insert(EmployeeStatusTracker), [
+        default_status(emp["emp_id"]) for emp in employees
+    ])
+    link_employees(db, [emp["emp_id"] for emp in employees])
+
+def onboard_employees(db: Session, rows: Iterator[Tuple[int, dict]], chunk_size: int = CHUNK_SIZE) -> dict:
+    """
+    Validate and insert employees chunk by chunk. Each chunk is committed on its
+    own; a row that fails validation or violates a constraint is reported in
+    `errors` and never aborts the rest of the import.
+    """
+    created = []
+    errors = []
+    seen_emails = set()
+    year = datetime.now().year
+
+    for chunk in _chunks(rows, chunk_size):
+        valid = _validate_chunk(db, chunk, seen_emails, errors)
+        if not valid:
+            continue
+
+        # Reserve one block of serials per distinct prefix
+        by_prefix: Dict[str, List[int]] = defaultdict(list)
+        for index, (_, data) in enumerate(valid):
+            prefix = employee_id_prefix(data.company_code, data.first_name, data.last_name)
+            by_prefix[prefix].append(index)
+        emp_ids = [None] * len(valid)
+        for prefix, indexes in by_prefix.items():
+            serials = reserve_employee_serials(db, prefix, len(indexes))
+            for index, serial in zip(indexes, serials):
+                emp_ids[index] = format_employee_id(prefix, serial)
+        # Keep the reserved serials even if some rows fail below
+        db.commit()
+
+        temp_passwords = [generate_temp_password() for _ in valid]
+        password_hashes = get_password_hashes(temp_passwords)
+
+        employees = [
+            {
+                "emp_id": emp_id,
+                "company_code": data.company_code,
+                "first_name": data.first_name,
+                "last_name": data.last_name,
+                "email": data.email,
+                "phone": data.phone,
+                "password_hash": password_hash,
+                "role": RoleEnum(data.role),
+                "department": data.department,
+                "manager_id": data.manager_id,
+                "location": data.location,
+                "date_of_joining": data.date_of_joining
+            }
+            for emp_id, (_, data), password_hash in zip(emp_ids, valid, password_hashes)
+        ]
+
+        try:
+            _insert_rows(db, employees, year)
+            db.commit()
+            inserted = list(range(len(employees)))
+        except IntegrityError:
+            # Fall back to row-by-row inserts to isolate the offending rows
+            db.rollback()
+            inserted = []
+            for index, employee in enumerate(employees):
+                try:
+                    _insert_rows(db, [employee], year)
+                    db.commit()
+                    inserted.append(index)
+                except IntegrityError as exc:
+                    db.rollback()
+                    errors.append({"row": valid[index][0], "error": str(exc.orig)})
+
+        for index in inserted:
+            created.append({
+                "row": valid[index][0],
+                "emp_id": emp_ids[index],
+                "email": valid[index][1].email,
+                "temporary_password": temp_passwords[index]
+            })
+        employee_search_index.changed(emp_ids[index] for index in inserted)
+
+    errors.sort(key=lambda err: err["row"])
+    return {"created": created, "errors": errors}
@@ -0,0 +1,234 @@
+"""
+Month-end payroll run.
+
+Loads the month's salary structures, attendance summaries, PF and tax rows
+with one query per table into column lists, computes every employee's pay in
+a single pass with Decimal arithmetic, and writes the results back with one
+bulk upsert. Running payroll closes the month: its attendance summaries are
+finalized, after which the attendance_storage job archives its attendance.
+
+    python -m app.services.payroll --year 2024 --month 6
+"""
+import argparse
+import calendar
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, List, Optional
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+from app.models.attendance import MonthlyAttendanceSummary
+from app.models.employee import Employee, EmployeeSalaryStructure, EmployeePFContribution, EmployeeTaxDeductions
+from app.models.payroll import PayrollResult
+from app.core.utils import dialect_insert
+from app.services.attendance_summary import finalize_month, working_days_per_month
+
+logger = logging.getLogger(__name__)
+
+CENT = Decimal("0.01")
+ZERO = Decimal("0.00")
+
+BASIC_RATE = Decimal("0.50")
+PF_RATE = Decimal("0.12")
+PF_WAGE_CEILING = Decimal("15000.00")
+DEFAULT_MONTHLY_TAX = Decimal("200.00")
+
+@dataclass
+class PayrollColumns:
+    """Column-oriented inputs for one payroll month, aligned by position"""
+    emp_id: List[str]
+    salary_structure_id: List[int]
+    monthly_wage: List[Decimal]
+    working_days: List[Decimal]
+    loss_of_pay_days: List[Decimal]
+    pf_basic: List[Optional[Decimal]]
+    tax: List[Decimal]
+
+def _money(value: Decimal) -> Decimal:
+    return value.quantize(CENT, rounding=ROUND_HALF_UP)
+
+def load_payroll_columns(db: Session, year: int, month: int) -> PayrollColumns:
+    first_day = date(year, month, 1)
+    last_day = date(year, month, calendar.monthrange(year, month)[1])
+
+    # Latest active structure in effect during the month, per active employee
+    structures: Dict[str, tuple] = {}
+    for row in db.query(
+        EmployeeSalaryStructure.emp_id,
+        EmployeeSalaryStructure.salary_structure_id,
+        EmployeeSalaryStructure.monthly_wage
+    ).join(Employee, Employee.emp_id == EmployeeSalaryStructure.emp_id).filter(
+        Employee.is_active == True,
+        EmployeeSalaryStructure.is_active == True,
+        EmployeeSalaryStructure.effective_from <= last_day,
+        or_(EmployeeSalaryStructure.effective_to.is_(None), EmployeeSalaryStructure.effective_to >= first_day)
+    ).order_by(EmployeeSalaryStructure.emp_id, EmployeeSalaryStructure.effective_from):
+        structures[row.emp_id] = (row.salary_structure_id, row.monthly_wage)
+
+    summaries = {
+        row.emp_id: row
+        for row in db.query(
+            MonthlyAttendanceSummary.emp_id,
+            MonthlyAttendanceSummary.total_working_days,
+            MonthlyAttendanceSummary.days_present,
+            MonthlyAttendanceSummary.paid_leaves_taken,
+            MonthlyAttendanceSummary.unpaid_leaves_taken
+        ).filter(MonthlyAttendanceSummary.year == year, MonthlyAttendanceSummary.month == month)
+    }
+
+    pf_basic = dict(
+        db.query(EmployeePFContribution.emp_id, EmployeePFContribution.basic_salary)
+        .filter(EmployeePFContribution.year == year, EmployeePFContribution.month == month)
+    )
+
+    taxes = {
+        row.emp_id: sum(
+            (Decimal(value or 0) for value in (
+                row.monthly_tax_deduction, row.professional_tax, row.tds_deduction, row.other_deductions
+            )),
+            ZERO
+        )
+        for row in db.query(
+            EmployeeTaxDeductions.emp_id,
+            EmployeeTaxDeductions.monthly_tax_deduction,
+            EmployeeTaxDeductions.professional_tax,
+            EmployeeTaxDeductions.tds_deduction,
+            EmployeeTaxDeductions.other_deductions
+        ).filter(EmployeeTaxDeductions.year == year, EmployeeTaxDeductions.month == month)
+    }
+
+    emp_ids = sorted(structures)
+    # Employees with no summary row never checked in and took no leave this month
+    scheduled_days = working_days_per_month(db, [emp_id for emp_id in emp_ids if emp_id not in summaries], until=last_day)
+    default_working_days = Decimal(sum(1 for day in range(1, last_day.day + 1) if date(year, month, day).weekday() < 5))
+    columns = PayrollColumns([], [], [], [], [], [], [])
+    for emp_id in emp_ids:
+        summary = summaries.get(emp_id)
+        if summary:
+            working_days = Decimal(summary.total_working_days)
+            present = Decimal(summary.days_present or 0)
+            paid_leave = Decimal(summary.paid_leaves_taken or 0)
+            unpaid_leave = Decimal(summary.unpaid_leaves_taken or 0)
+        else:
+            working_days = Decimal(scheduled_days[emp_id]) if scheduled_days.get(emp_id) else default_working_days
+            present = paid_leave = unpaid_leave = ZERO
+        columns.emp_id.append(emp_id)
+        columns.salary_structure_id.append(structures[emp_id][0])
+        columns.monthly_wage.append(Decimal(structures[emp_id][1]))
+        columns.working_days.append(working_days)
+        # Unpaid leave, plus every scheduled day neither worked nor covered by leave
+        unaccounted = max(working_days - present - paid_leave - unpaid_leave, ZERO)
+        columns.loss_of_pay_days.append(unaccounted + unpaid_leave)
+        columns.pf_basic.append(Decimal(pf_basic[emp_id]) if emp_id in pf_basic else None)
+        columns.tax.append(taxes.get(emp_id, DEFAULT_MONTHLY_TAX))
+    return columns
+
+def compute_payroll(columns: PayrollColumns) -> List[dict]:
+    """
+    Gross is the monthly wage prorated for loss-of-pay days (unpaid leave and
+    scheduled days without attendance or leave); basic is half of gross; PF is 12% of basic up to the statutory
+    wage ceiling (or of the month's recorded PF basic); net is gross less
+    employee PF and taxes, never below zero.
+    """
+    results = []
+    shortfalls = []
+    for emp_id, structure_id, wage, working_days, lop_days, pf_basic, tax in zip(
+        columns.emp_id,
+        columns.salary_structure_id,
+        columns.monthly_wage,
+        columns.working_days,
+        columns.loss_of_pay_days,
+        columns.pf_basic,
+        columns.tax
+    ):
+        paid_days = max(working_days - lop_days, ZERO)
+        gross = _money(wage * paid_days / working_days) if working_days else ZERO
+        basic = _money(gross * BASIC_RATE)
+        pf = _money(min(pf_basic if pf_basic is not None else basic, PF_WAGE_CEILING) * PF_RATE)
+        tax = _money(tax)
+        net = gross - pf - tax
+        if net < ZERO:
+            shortfalls.append(emp_id)
+            net = ZERO
+        results.append({
+            "emp_id": emp_id,
+            "salary_structure_id": structure_id,
+            "working_days": working_days,
+            "loss_of_pay_days": lop_days,
+            "gross_pay": gross,
+            "basic_salary": basic,
+            "pf_employee": pf,
+            "pf_employer": pf,
+            "tax_deductions": tax,
+            "net_pay": net
+        })
+    if shortfalls:
+        logger.warning(
+            "Deductions exceed gross pay for %d employees, net pay set to 0: %s",
+            len(shortfalls), ", ".join(shortfalls)
+        )
+    return results
+
+def ensure_month_ended(year: int, month: int) -> None:
+    """Payroll counts every working day without attendance or leave as unpaid, so it only runs on past months"""
+    if date(year, month, calendar.monthrange(year, month)[1]) >= date.today():
+        raise ValueError(f"{year}-{month:02d} has not ended yet")
+
+def run_payroll(db: Session, year: int, month: int) -> int:
+    """Compute and store payroll for a month; re-running replaces earlier results. Returns rows written."""
+    ensure_month_ended(year, month)
+    results = compute_payroll(load_payroll_columns(db, year, month))
+
+    now = datetime.utcnow()
+    if results:
+        for result in results:
+            result.update(year=year, month=month, updated_at=now)
+
+        stmt = dialect_insert(db)(PayrollResult)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PayrollResult.emp_id, PayrollResult.month, PayrollResult.year],
+            set_={
+                column: getattr(stmt.excluded, column)
+                for column in (
+                    "salary_structure_id", "working_days", "loss_of_pay_days", "gross_pay", "basic_salary",
+                    "pf_employee", "pf_employer", "tax_deductions", "net_pay", "updated_at"
+                )
+            }
+        )
+        db.execute(stmt, results)
+
+        # Only the rows that went into a result; anyone skipped is still unprocessed
+        paid = [result["emp_id"] for result in results]
+        for model in (EmployeePFContribution, EmployeeTaxDeductions):
+            db.execute(
+                update(model)
+                .where(model.year == year, model.month == month, model.emp_id.in_(paid))
+                .values(is_processed=True, updated_at=now)
+            )
+
+    # The month is closed once paid: later attendance edits no longer move its
+    # summaries, and attendance_storage may archive it
+    finalize_month(db, year, month)
+    db.commit()
+    return len(results)
+
+def main():
+    from app.database import SessionLocal
+
+    # Defaults to last month: a month is paid once it has ended
+    last_month = date.today().replace(day=1) - timedelta(days=1)
+    parser = argparse.ArgumentParser(description="Run payroll for a month")
+    parser.add_argument("--year", type=int, default=last_month.year)
+    parser.add_argument("--month", type=int, default=last_month.month)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        try:
+            written = run_payroll(db, args.year, args.month)
+        except ValueError as exc:
+            parser.error(str(exc))
+    print(f"Payroll for {args.year}-{args.month:02d}: {written} employees")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Employee profile aggregates.
+
+A profile is the employee plus personal info, bank details, the active
+salary structure, the current working schedule, the status tracker and this
+year's time-off balance. `load_profiles` fetches any number of them with a
+fixed four queries: one joined query for the employees and their
+one-to-one rows, and one selectin query each for salary structures,
+schedules and balances, already filtered to the rows a profile shows.
+Every other relationship raises instead of lazy loading.
+"""
+from datetime import date
+from typing import Iterable, List, Optional
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from app.models.employee import Employee, EmployeeSalaryStructure, WorkingSchedule
+from app.models.timeoff import TimeOffBalance
+
+def _in_effect(model, on_date: date):
+    return model.effective_from <= on_date, or_(model.effective_to.is_(None), model.effective_to >= on_date)
+
+def profile_statement(emp_ids: Iterable[str], on_date: date):
+    return (
+        select(Employee)
+        .where(Employee.emp_id.in_(list(emp_ids)))
+        .options(
+            joinedload(Employee.personal_info),
+            joinedload(Employee.bank_details),
+            joinedload(Employee.status),
+            selectinload(Employee.salary_structure.and_(
+                EmployeeSalaryStructure.is_active == True,
+                *_in_effect(EmployeeSalaryStructure, on_date)
+            )),
+            selectinload(Employee.working_schedule.and_(*_in_effect(WorkingSchedule, on_date))),
+            selectinload(Employee.timeoff_balance.and_(TimeOffBalance.year == on_date.year)),
+            raiseload("*")
+        )
+        # The filtered collections must not be mixed with ones already in the session
+        .execution_options(populate_existing=True)
+    )
+
+def _latest(rows: list):
+    return max(rows, key=lambda row: row.effective_from, default=None)
+
+def _profile(employee: Employee) -> dict:
+    return {
+        **{column.key: getattr(employee, column.key) for column in Employee.__table__.columns},
+        "personal_info": employee.personal_info,
+        "bank_details": employee.bank_details,
+        "salary_structure": _latest(employee.salary_structure),
+        "working_schedule": _latest(employee.working_schedule),
+        "status": employee.status,
+        "timeoff_balance": employee.timeoff_balance[0] if employee.timeoff_balance else None
+    }
+
+def load_profiles(db: Session, emp_ids: Iterable[str], on_date: Optional[date] = None) -> List[dict]:
+    """Profiles of the given employees in the requested order; unknown emp_ids are left out"""
+    emp_ids = list(dict.fromkeys(emp_ids))
+    employees = {
+        employee.emp_id: employee
+        for employee in db.execute(profile_statement(emp_ids, on_date or date.today())).unique().scalars()
+    }
+    return [_profile(employees[emp_id]) for emp_id in emp_ids if emp_id in employees]
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+Employee directory search.
+
+On PostgreSQL, each query word is matched by pg_trgm word similarity through
+the trigram indexes ix_employees_search and ix_employee_personal_info_search,
+so prefixes and typos match without scanning the table. Other databases search
+the in-process index in app.core.search_index. Either way every word has to
+match, in any of the searchable fields.
+"""
+from typing import List, Tuple
+from sqlalchemy import func, intersect, literal, select, union
+from sqlalchemy.orm import Session
+from app.models.employee import Employee, EmployeePersonalInfo, search_text
+from app.core.search_index import MAX_QUERY_TERMS, employee_search_index, tokenize
+
+# Lower than pg_trgm's default (0.6) so a typo in a short word still matches
+WORD_SIMILARITY_THRESHOLD = 0.3
+# Skills and certifications rank below the same match in a name, email, department or location
+PERSONAL_INFO_WEIGHT = 0.8
+
+# Must stay identical to the index expressions, or PostgreSQL will not use them
+EMPLOYEE_SEARCH_TEXT = search_text(
+    Employee.first_name, Employee.last_name, Employee.email, Employee.department, Employee.location
+)
+PERSONAL_INFO_SEARCH_TEXT = search_text(EmployeePersonalInfo.skills, EmployeePersonalInfo.certifications)
+
+def _term_matches(term: str):
+    """emp_ids with a word similar to `term` in either search text, one trigram index lookup per table"""
+    matches = union(
+        select(Employee.emp_id).where(literal(term).op("<%")(EMPLOYEE_SEARCH_TEXT)),
+        select(EmployeePersonalInfo.emp_id).where(literal(term).op("<%")(PERSONAL_INFO_SEARCH_TEXT))
+    ).subquery()
+    return select(matches.c.emp_id)
+
+def _term_score(term: str):
+    return func.greatest(
+        func.word_similarity(term, EMPLOYEE_SEARCH_TEXT),
+        func.coalesce(func.word_similarity(term, PERSONAL_INFO_SEARCH_TEXT), 0) * PERSONAL_INFO_WEIGHT
+    )
+
+def _trigram_search(db: Session, terms: List[str], limit: int) -> List[Tuple[str, float]]:
+    db.execute(select(func.set_config("pg_trgm.word_similarity_threshold", str(WORD_SIMILARITY_THRESHOLD), True)))
+    matching = _term_matches(terms[0]) if len(terms) == 1 else intersect(*(_term_matches(term) for term in terms))
+    score = _term_score(terms[0])
+    for term in terms[1:]:
+        score = score + _term_score(term)
+    score = score.label("score")
+    return [
+        (row.emp_id, row.score)
+        for row in db.execute(
+            select(Employee.emp_id, score)
+            .outerjoin(EmployeePersonalInfo, EmployeePersonalInfo.emp_id == Employee.emp_id)
+            .where(Employee.is_active == True, Employee.emp_id.in_(matching))
+            .order_by(score.desc(), Employee.emp_id)
+            .limit(limit)
+        )
+    ]
+
+def search_employees(db: Session, query: str, limit: int) -> List[Tuple[str, float]]:
+    """(emp_id, score) of the best matching active employees, best first; scores only order one result list"""
+    terms = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
+    if not terms:
+        return []
+    if db.get_bind().dialect.name == "postgresql":
+        return _trigram_search(db, terms, limit)
+    employee_search_index.refresh(db)
+    return employee_search_index.search(" ".join(terms), limit)
\ No newline at end of file
@@ -0,0 +1,267 @@
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import and_, case, func, select, tuple_, update
+from sqlalchemy.orm import Session
+from app.core.presence import presence_index
+from app.core.principal_cache import Principal
+from app.models.attendance import Attendance
+from app.models.employee import Employee, EmployeeStatusTracker
+from app.models.timeoff import TimeOffBalance, TimeOffRequest
+from app.schemas.timeoff import TimeOffRequestCreate, TimeOffApproval
+from app.services.attendance import CHECKED_OUT
+from app.services.attendance_summary import apply_timeoff_deltas, count_working_days, days_per_week, working_days_per_month
+
+TIME_OFF_TYPES = ("paid_time_off", "sick_leave", "unpaid_leave")
+DECISIONS = ("approved", "rejected")
+ON_LEAVE = ("on_leave", "airplane")
+
+# (used, total) balance columns drawn on by each type; unpaid leave has no balance
+BALANCE_COLUMNS = {
+    "paid_time_off": ("paid_time_off_used", "paid_time_off_total"),
+    "sick_leave": ("sick_leave_used", "sick_leave_total"),
+}
+
+def submit_request(db: Session, emp_id: str, data: TimeOffRequestCreate) -> TimeOffRequest:
+    """File a pending request; total_days counts the working days of the employee's schedule"""
+    if data.time_off_type not in TIME_OFF_TYPES:
+        raise ValueError(f"time_off_type must be one of: {', '.join(TIME_OFF_TYPES)}")
+    if data.end_date < data.start_date:
+        raise ValueError("end_date is before start_date")
+
+    working_days = working_days_per_month(db, [emp_id], until=data.start_date).get(emp_id)
+    total_days = count_working_days(data.start_date, data.end_date, days_per_week(working_days))
+    if not total_days:
+        raise ValueError("No working days in the requested range")
+
+    overlapping = db.query(TimeOffRequest.request_id).filter(
+        TimeOffRequest.emp_id == emp_id,
+        TimeOffRequest.status.in_(["pending", "approved"]),
+        TimeOffRequest.start_date <= data.end_date,
+        TimeOffRequest.end_date >= data.start_date
+    ).first()
+    if overlapping:
+        raise ValueError(f"Overlaps time-off request {overlapping.request_id}")
+
+    request = TimeOffRequest(emp_id=emp_id, total_days=total_days, status="pending", **data.model_dump())
+    db.add(request)
+    db.commit()
+    db.refresh(request)
+    return request
+
+def _days_by_year(db: Session, request) -> Dict[int, int]:
+    """Days a request draws from each year's balance; leave over New Year is split between the two"""
+    if request.start_date.year == request.end_date.year:
+        return {request.start_date.year: request.total_days}
+    # Counted against the schedule submit_request used for total_days
+    working_days = working_days_per_month(db, [request.emp_id], until=request.start_date).get(request.emp_id)
+    workweek = days_per_week(working_days)
+    days = {
+        year: count_working_days(max(request.start_date, date(year, 1, 1)), min(request.end_date, date(year, 12, 31)), workweek)
+        for year in range(request.start_date.year, request.end_date.year + 1)
+    }
+    return {year: count for year, count in days.items() if count}
+
+def _debit_balances(db: Session, demand: Dict[Tuple[str, int], Dict[str, int]], now: datetime, sign: int = 1) -> Set[Tuple[str, int]]:
+    """
+    Add the demanded days to the used columns of every (emp_id, year)
+    balance in one statement. The increment is computed and checked against
+    the total inside the UPDATE, so concurrent approvals serialize on the row
+    and a balance that would be overdrawn is left untouched. sign=-1 gives
+    the days back. Returns the keys that were updated.
+    """
+    values, guards = {}, []
+    for time_off_type, (used, total) in BALANCE_COLUMNS.items():
+        days = [
+            (and_(TimeOffBalance.emp_id == emp_id, TimeOffBalance.year == year), sign * by_type[time_off_type])
+            for (emp_id, year), by_type in demand.items()
+            if by_type.get(time_off_type)
+        ]
+        if not days:
+            continue
+        new_used = func.coalesce(getattr(TimeOffBalance, used), 0) + case(*days, else_=0)
+        values[used] = new_used
+        if sign > 0:
+            guards.append(new_used <= getattr(TimeOffBalance, total))
+
+    rows = db.execute(
+        update(TimeOffBalance)
+        .where(tuple_(TimeOffBalance.emp_id, TimeOffBalance.year).in_(list(demand)), *guards)
+        .values(updated_at=now, **values)
+        .returning(TimeOffBalance.emp_id, TimeOffBalance.year)
+    ).all()
+    return {(row.emp_id, row.year) for row in rows}
+
+def decide_requests(db: Session, approver: Principal, decisions: List[TimeOffApproval]) -> dict:
+    """
+    Approve or reject a batch of requests in one transaction with a fixed
+    number of statements, whatever the batch size (plus a schedule lookup for
+    each request spanning New Year, whose days are split between the two
+    years' balances). Managers decide for their direct reports, Admin/HR for
+    anyone; nobody decides their own requests. When approving would overdraw
+    a balance, or the balance row is missing, every request of that employee
+    and year in the batch stays pending.
+    """
+    statuses: Dict[int, str] = {}
+    comments: Dict[int, str] = {}
+    for decision in decisions:
+        if decision.status not in DECISIONS:
+            raise ValueError(f"status must be one of: {', '.join(DECISIONS)}")
+        statuses[decision.request_id] = decision.status
+        if decision.approval_comments is not None:
+            comments[decision.request_id] = decision.approval_comments
+    if not statuses:
+        return {"approved": [], "rejected": [], "failed": []}
+
+    now = datetime.utcnow()
+
+    # Claim the pending requests in one UPDATE; a concurrent approver of the
+    # same requests blocks on their rows and then no longer sees them pending
+    claim = update(TimeOffRequest).where(
+        TimeOffRequest.request_id.in_(list(statuses)),
+        TimeOffRequest.status == "pending",
+        TimeOffRequest.emp_id != approver.emp_id
+    )
+    if approver.role not in ["admin", "hr"]:
+        claim = claim.where(TimeOffRequest.emp_id.in_(
+            select(Employee.emp_id).where(Employee.manager_id == approver.emp_id)
+        ))
+    values = {
+        "status": case(statuses, value=TimeOffRequest.request_id),
+        "approved_by": approver.emp_id,
+        "approval_date": now,
+        "updated_at": now
+    }
+    if comments:
+        values["approval_comments"] = case(comments, value=TimeOffRequest.request_id, else_=TimeOffRequest.approval_comments)
+    claimed = db.execute(
+        claim.values(**values).returning(
+            TimeOffRequest.request_id,
+            TimeOffRequest.emp_id,
+            TimeOffRequest.time_off_type,
+            TimeOffRequest.start_date,
+            TimeOffRequest.end_date,
+            TimeOffRequest.total_days,
+            TimeOffRequest.status
+        )
+    ).all()
+
+    approved = [row for row in claimed if row.status == "approved"]
+    # (emp_id, year) -> days per time-off type; request_id -> the balances it draws on
+    demand: Dict[Tuple[str, int], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    draws: Dict[int, Set[Tuple[str, int]]] = {}
+    for row in approved:
+        if row.time_off_type in BALANCE_COLUMNS:
+            by_year = _days_by_year(db, row)
+            for year, days in by_year.items():
+                demand[(row.emp_id, year)][row.time_off_type] += days
+            draws[row.request_id] = {(row.emp_id, year) for year in by_year}
+
+    failed_keys: Set[Tuple[str, int]] = set()
+    missing: Set[Tuple[str, int]] = set()
+    if demand:
+        debited = _debit_balances(db, demand, now)
+        failed_keys = set(demand) - debited
+    if failed_keys:
+        # Leave over New Year needs both years' balances: when one of them could
+        # not be debited, give back what the other was debited and hold its
+        # requests as well
+        refund: Set[Tuple[str, int]] = set()
+        while True:
+            held = failed_keys | refund
+            more = {key for keys in draws.values() if keys & held for key in keys} - held
+            if not more:
+                break
+            refund |= more
+        if refund:
+            _debit_balances(db, {key: demand[key] for key in refund}, now, sign=-1)
+        missing = failed_keys - {
+            (row.emp_id, row.year)
+            for row in db.execute(
+                select(TimeOffBalance.emp_id, TimeOffBalance.year)
+                .where(tuple_(TimeOffBalance.emp_id, TimeOffBalance.year).in_(list(failed_keys)))
+            )
+        }
+        failed_keys |= refund
+
+    overdrawn = {request_id for request_id, keys in draws.items() if keys & failed_keys}
+    if overdrawn:
+        db.execute(
+            update(TimeOffRequest)
+            .where(TimeOffRequest.request_id.in_(list(overdrawn)))
+            .values(status="pending", approved_by=None, approval_date=None, approval_comments=None, updated_at=now)
+        )
+        approved = [row for row in approved if row.request_id not in overdrawn]
+
+    apply_timeoff_deltas(db, approved)
+
+    # Employees whose approved leave covers today are off the presence board now
+    today = date.today()
+    on_leave = sorted({row.emp_id for row in approved if row.start_date <= today <= row.end_date})
+    if on_leave:
+        db.execute(
+            update(EmployeeStatusTracker)
+            .where(EmployeeStatusTracker.emp_id.in_(on_leave))
+            .values(current_status=ON_LEAVE[0], status_indicator=ON_LEAVE[1], updated_at=now)
+        )
+    db.commit()
+    presence_index.update_many((emp_id, *ON_LEAVE) for emp_id in on_leave)
+
+    claimed_ids = {row.request_id for row in claimed}
+    return {
+        "approved": sorted(row.request_id for row in approved),
+        "rejected": sorted(row.request_id for row in claimed if row.status == "rejected"),
+        "failed": [
+            {
+                "request_id": request_id,
+                "detail": "No time-off balance for the year" if draws[request_id] & missing else "Insufficient balance"
+            }
+            for request_id in sorted(overdrawn)
+        ] + [
+            {"request_id": request_id, "detail": "Not found, not pending, or not yours to decide"}
+            for request_id in sorted(set(statuses) - claimed_ids)
+        ]
+    }
+
+def sync_leave_presence(db: Session, today: Optional[date] = None) -> Dict[str, int]:
+    """
+    Put employees whose approved leave covers today on leave on the presence
+    board, unless they have checked in anyway, and take employees whose leave
+    has ended off it. The job workers run this periodically; approving leave
+    that has already started flips the status at once.
+    """
+    today = today or date.today()
+    now = datetime.utcnow()
+    covered = select(TimeOffRequest.emp_id).where(
+        TimeOffRequest.status == "approved",
+        TimeOffRequest.start_date <= today,
+        TimeOffRequest.end_date >= today
+    )
+    checked_in = select(Attendance.emp_id).where(
+        Attendance.attendance_date == today,
+        Attendance.check_in_time.is_not(None)
+    )
+
+    started = db.execute(
+        update(EmployeeStatusTracker)
+        .where(
+            EmployeeStatusTracker.emp_id.in_(covered),
+            EmployeeStatusTracker.emp_id.not_in(checked_in),
+            EmployeeStatusTracker.current_status != ON_LEAVE[0]
+        )
+        .values(current_status=ON_LEAVE[0], status_indicator=ON_LEAVE[1], updated_at=now)
+        .returning(EmployeeStatusTracker.emp_id)
+    ).scalars().all()
+    # Back to the status of someone who is not in the office
+    ended = db.execute(
+        update(EmployeeStatusTracker)
+        .where(EmployeeStatusTracker.current_status == ON_LEAVE[0], EmployeeStatusTracker.emp_id.not_in(covered))
+        .values(current_status=CHECKED_OUT[0], status_indicator=CHECKED_OUT[1], updated_at=now)
+        .returning(EmployeeStatusTracker.emp_id)
+    ).scalars().all()
+    db.commit()
+
+    presence_index.update_many(
+        [(emp_id, *ON_LEAVE) for emp_id in started] + [(emp_id, *CHECKED_OUT) for emp_id in ended]
+    )
+    return {"started": len(started), "ended": len(ended)}
@@ -0,0 +1,108 @@
+"""
+Year rollover of time-off balances.
+
+Creates next year's TimeOffBalance for every active employee with one
+INSERT ... SELECT, carrying forward unused paid time off (and, if enabled,
+sick leave) up to a cap. Rows that already exist are left untouched via the
+unique_emp_year constraint, so the job is safe to re-run and to run before
+the year starts.
+
+    python -m app.services.timeoff_rollover --year 2025 --carry-forward-cap 5
+"""
+import argparse
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from sqlalchemy import and_, case, func, literal, select
+from sqlalchemy.orm import Session, aliased
+from app.models.employee import Employee
+from app.models.timeoff import TimeOffBalance
+from app.core.utils import dialect_insert
+
+@dataclass
+class RolloverRules:
+    """Allowances granted each year and how much unused leave carries over"""
+    paid_time_off_allowance: Decimal = Decimal("12.0")
+    sick_leave_allowance: Decimal = Decimal("7.0")
+    # Most unused days carried into the new year (0 disables carry-forward)
+    paid_time_off_carry_cap: Decimal = Decimal("5.0")
+    sick_leave_carry_cap: Decimal = Decimal("0.0")
+    # Upper bound on a year's total after carry-forward
+    paid_time_off_max_total: Decimal = Decimal("30.0")
+    sick_leave_max_total: Decimal = Decimal("7.0")
+
+def _at_most(value, cap: Decimal):
+    return case((value > cap, literal(cap)), else_=value)
+
+def _new_total(previous, used_column: str, total_column: str, allowance: Decimal, carry_cap: Decimal, max_total: Decimal):
+    """allowance + unused days of last year (capped), capped at max_total; no previous row carries nothing"""
+    unused = func.coalesce(getattr(previous, total_column), 0) - func.coalesce(getattr(previous, used_column), 0)
+    carried = case((unused <= 0, literal(Decimal("0"))), else_=_at_most(unused, carry_cap))
+    return _at_most(literal(allowance) + carried, max_total)
+
+def rollover_statement(db: Session, year: int, rules: RolloverRules):
+    previous = aliased(TimeOffBalance)
+    now = datetime.utcnow()
+    source = select(
+        Employee.emp_id,
+        literal(year),
+        _new_total(
+            previous, "paid_time_off_used", "paid_time_off_total",
+            rules.paid_time_off_allowance, rules.paid_time_off_carry_cap, rules.paid_time_off_max_total
+        ),
+        literal(Decimal("0")),
+        _new_total(
+            previous, "sick_leave_used", "sick_leave_total",
+            rules.sick_leave_allowance, rules.sick_leave_carry_cap, rules.sick_leave_max_total
+        ),
+        literal(Decimal("0")),
+        literal(now),
+        literal(now)
+    ).outerjoin(
+        previous, and_(previous.emp_id == Employee.emp_id, previous.year == year - 1)
+    ).where(Employee.is_active == True)
+
+    return dialect_insert(db)(TimeOffBalance).from_select(
+        [
+            "emp_id", "year",
+            "paid_time_off_total", "paid_time_off_used",
+            "sick_leave_total", "sick_leave_used",
+            "created_at", "updated_at"
+        ],
+        source
+    ).on_conflict_do_nothing(index_elements=[TimeOffBalance.emp_id, TimeOffBalance.year])
+
+def rollover_balances(db: Session, year: int, rules: RolloverRules = RolloverRules()) -> int:
+    """Provision `year` balances for all active employees. Returns the number of rows created."""
+    created = db.execute(rollover_statement(db, year, rules)).rowcount
+    db.commit()
+    return created
+
+def main():
+    from app.database import SessionLocal
+
+    defaults = RolloverRules()
+    parser = argparse.ArgumentParser(description="Create next year's time-off balances")
+    parser.add_argument("--year", type=int, default=date.today().year + 1)
+    parser.add_argument("--paid-allowance", type=Decimal, default=defaults.paid_time_off_allowance)
+    parser.add_argument("--sick-allowance", type=Decimal, default=defaults.sick_leave_allowance)
+    parser.add_argument("--carry-forward-cap", type=Decimal, default=defaults.paid_time_off_carry_cap)
+    parser.add_argument("--sick-carry-forward-cap", type=Decimal, default=defaults.sick_leave_carry_cap)
+    parser.add_argument("--paid-max-total", type=Decimal, default=defaults.paid_time_off_max_total)
+    parser.add_argument("--sick-max-total", type=Decimal, default=defaults.sick_leave_max_total)
+    args = parser.parse_args()
+
+    rules = RolloverRules(
+        paid_time_off_allowance=args.paid_allowance,
+        sick_leave_allowance=args.sick_allowance,
+        paid_time_off_carry_cap=args.carry_forward_cap,
+        sick_leave_carry_cap=args.sick_carry_forward_cap,
+        paid_time_off_max_total=args.paid_max_total,
+        sick_leave_max_total=args.sick_max_total
+    )
+    with SessionLocal() as db:
+        created = rollover_balances(db, args.year, rules)
+    print(f"Created {created} time-off balances for {args.year}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+9 AM check-in burst benchmark.
+
+Seeds employees with schedules and status trackers, then has every employee
+POST /api/v1/attendance/check-in concurrently against the app in-process
+and reports sustained check-ins/sec and latency percentiles. SQLite
+serializes writers; point --database-url at Postgres for realistic numbers.
+
+Run from the backend directory:
+    python -m benchmarks.bench_checkin --employees 5000 --concurrency 1000
+"""
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite:///./bench_checkin.db")
+parser.add_argument("--employees", type=int, default=2000)
+parser.add_argument("--concurrency", type=int, default=256)
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from app.database import Base, SessionLocal, engine
+from app.models.employee import Employee, WorkingSchedule, EmployeeStatusTracker
+from app.core.security import create_access_token
+from app.services.onboarding import default_schedule, default_status
+from app.main import app
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def main():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    emp_ids = [f"BMCHEC2024{i:05d}" for i in range(args.employees)]
+    with SessionLocal() as db:
+        db.execute(insert(Employee), [
+            {
+                "emp_id": emp_id,
+                "company_code": "BM",
+                "first_name": "Check",
+                "last_name": "In",
+                "email": f"{emp_id.lower()}@example.com",
+                "phone": "0000000000",
+                "password_hash": "not-used",
+                "date_of_joining": date(2024, 1, 1)
+            }
+            for emp_id in emp_ids
+        ])
+        db.execute(insert(WorkingSchedule), [default_schedule(emp_id, date(2024, 1, 1)) for emp_id in emp_ids])
+        db.execute(insert(EmployeeStatusTracker), [default_status(emp_id) for emp_id in emp_ids])
+        db.commit()
+
+    tokens = {emp_id: create_access_token({"sub": emp_id}) for emp_id in emp_ids}
+    client = TestClient(app)
+
+    def check_in(emp_id: str) -> float:
+        start = time.perf_counter()
+        response = client.post(
+            "/api/v1/attendance/check-in",
+            json={"emp_id": emp_id},
+            headers={"Authorization": f"Bearer {tokens[emp_id]}"}
+        )
+        assert response.status_code == 200, response.text
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        latencies = list(pool.map(check_in, emp_ids))
+    elapsed = time.perf_counter() - start
+
+    print(f"employees: {args.employees}  concurrency: {args.concurrency}")
+    print(f"elapsed: {elapsed:.2f}s  throughput: {len(latencies) / elapsed:.1f} check-ins/s")
+    print(f"p50: {statistics.median(latencies) * 1000:.1f}ms  p99: {percentile(latencies, 99) * 1000:.1f}ms")
+
+if __name__ == "__main__":
+    main()
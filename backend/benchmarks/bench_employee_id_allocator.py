@@ -0,0 +1,73 @@
+"""
+Contention benchmark for the employee ID allocator.
+
+Fires many parallel register_employee calls that all share the same
+CC + FN + LN + YYYY prefix and checks that every issued ID is unique.
+
+Run from the backend directory:
+    python -m benchmarks.bench_employee_id_allocator --registrations 200 --workers 16
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite:///./bench_employee_ids.db")
+parser.add_argument("--registrations", type=int, default=200)
+parser.add_argument("--workers", type=int, default=16)
+args = parser.parse_args()
+
+os.environ.setdefault("DATABASE_URL", args.database_url)
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from app.models.employee import Employee
+from app.schemas.employee import EmployeeCreate
+from app.api.v1.employees import register_employee
+from app.core.principal_cache import Principal
+
+def main():
+    connect_args = {"timeout": 60, "check_same_thread": False} if args.database_url.startswith("sqlite") else {}
+    engine = create_engine(args.database_url, connect_args=connect_args, pool_size=args.workers, max_overflow=0)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    admin = Principal(emp_id="BENCHADMIN", role="admin", is_active=True)
+
+    def register(i: int) -> str:
+        data = EmployeeCreate(
+            company_code="AB",
+            first_name="John",
+            last_name="Doe",
+            email=f"john.doe.{i}@example.com",
+            phone="0000000000",
+            date_of_joining=date.today()
+        )
+        with Session() as db:
+            return register_employee(data, db=db, current_admin=admin)["employee"].emp_id
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        issued = list(pool.map(register, range(args.registrations)))
+    elapsed = time.perf_counter() - start
+
+    with Session() as db:
+        stored = db.query(func.count(func.distinct(Employee.emp_id))).scalar()
+
+    duplicates = len(issued) - len(set(issued))
+    print(f"registrations: {len(issued)}  workers: {args.workers}")
+    print(f"elapsed: {elapsed:.2f}s  throughput: {len(issued) / elapsed:.1f} registrations/s")
+    print(f"distinct ids issued: {len(set(issued))}  stored: {stored}  duplicates: {duplicates}")
+    expected = {f"ABJODO{date.today().year}{n:04d}" for n in range(1, args.registrations + 1)}
+    if duplicates or stored != args.registrations or set(issued) != expected:
+        print("FAIL: employee IDs are not unique and contiguous")
+        sys.exit(1)
+    print("OK")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Streaming export benchmark.
+
+Seeds a year of attendance and, in a fresh interpreter per case, streams the
+attendance export for growing date ranges in each format. For every case it
+prints rows/sec, bytes written and the interpreter's peak RSS. With
+streaming, peak RSS should stay flat as the range grows. The `all()` rows
+load the same range in one go for comparison.
+
+Run from the backend directory:
+    python -m benchmarks.bench_exports --employees 1000 --months 1 3 12
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from datetime import date, timedelta, time as clock
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite:///./bench_exports.db")
+parser.add_argument("--employees", type=int, default=1000)
+parser.add_argument("--months", type=int, nargs="+", default=[1, 3, 12])
+parser.add_argument("--formats", nargs="+", default=["csv", "jsonl", "parquet"])
+parser.add_argument("--case", nargs=2, metavar=("FORMAT", "MONTHS"), help=argparse.SUPPRESS)
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+YEAR = 2024
+
+def date_range(months: int):
+    start = date(YEAR, 1, 1)
+    end = date(YEAR + (months // 12), months % 12 + 1, 1) - timedelta(days=1)
+    return start, end
+
+def run_case(fmt: str, months: int):
+    from sqlalchemy import func
+    from app.database import SessionLocal
+    from app.services import exports
+
+    stmt = exports.attendance_statement(*date_range(months))
+    start = time.perf_counter()
+    rows = written = 0
+    if fmt == "all()":
+        with SessionLocal() as db:
+            records = db.execute(stmt).all()
+            rows = len(records)
+            written = sum(len(json.dumps([str(value) for value in record])) for record in records)
+    else:
+        for chunk in exports.stream_export(SessionLocal, stmt, fmt):
+            written += len(chunk)
+    elapsed = time.perf_counter() - start
+    if fmt != "all()":
+        with SessionLocal() as db:
+            rows = db.execute(stmt.with_only_columns(func.count()).order_by(None)).scalar()
+    print(json.dumps({
+        "rows": rows,
+        "rows_per_sec": rows / elapsed,
+        "bytes": written,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    }))
+
+def seed():
+    from sqlalchemy import insert
+    from app.database import Base, SessionLocal, engine
+    from app.models import Employee, Attendance
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    emp_ids = [f"BMEXPO2024{i:05d}" for i in range(args.employees)]
+    with SessionLocal() as db:
+        db.execute(insert(Employee), [
+            {
+                "emp_id": emp_id,
+                "company_code": "BM",
+                "first_name": "Ex",
+                "last_name": "Port",
+                "email": f"{emp_id.lower()}@example.com",
+                "phone": "0000000000",
+                "password_hash": "not-used",
+                "date_of_joining": date(2020, 1, 1)
+            }
+            for emp_id in emp_ids
+        ])
+        day = date(YEAR, 1, 1)
+        while day.year == YEAR:
+            if day.weekday() < 5:
+                db.execute(insert(Attendance), [
+                    {
+                        "emp_id": emp_id,
+                        "attendance_date": day,
+                        "check_in_time": clock(9),
+                        "check_out_time": clock(18),
+                        "work_hours": 8,
+                        "extra_hours": 0,
+                        "status": "present"
+                    }
+                    for emp_id in emp_ids
+                ])
+            day += timedelta(days=1)
+        db.commit()
+
+def main():
+    if args.case:
+        run_case(args.case[0], int(args.case[1]))
+        return
+
+    start = time.perf_counter()
+    seed()
+    print(f"seeded a year of attendance for {args.employees} employees in {time.perf_counter() - start:.2f}s")
+
+    print(f"{'format':>8} {'months':>7} {'rows':>10} {'rows/s':>10} {'MB out':>8} {'peak RSS MB':>12}")
+    for fmt in [*args.formats, "all()"]:
+        for months in args.months:
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_exports", *sys.argv[1:], "--case", fmt, str(months)],
+                capture_output=True, text=True
+            )
+            if output.returncode != 0:
+                print(f"{fmt:>8} {months:>7}  failed: {output.stderr.strip().splitlines()[-1]}")
+                continue
+            result = json.loads(output.stdout.strip().splitlines()[-1])
+            print(
+                f"{fmt:>8} {months:>7} {result['rows']:>10} {result['rows_per_sec']:>10.0f} "
+                f"{result['bytes'] / 1e6:>8.1f} {result['peak_rss_mb']:>12.1f}"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Background job throughput benchmark.
+
+Queues a batch of jobs whose handler sleeps for --work-ms (standing in for
+I/O-bound batch work), then drains the queue with a WorkerPool of each size
+and reports jobs/sec and the time from enqueue to completion. Throughput
+should scale with the number of workers until claiming becomes the
+bottleneck. SQLite serializes writers; point --database-url at Postgres to
+measure SKIP LOCKED claiming.
+
+Run from the backend directory:
+    python -m benchmarks.bench_jobs --jobs 500 --work-ms 20 --workers 1 2 4 8
+"""
+import argparse
+import os
+import statistics
+import time
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite:///./bench_jobs.db")
+parser.add_argument("--jobs", type=int, default=500)
+parser.add_argument("--work-ms", type=float, default=20)
+parser.add_argument("--workers", type=int, nargs="*", default=[1, 2, 4, 8])
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from datetime import datetime
+from sqlalchemy import delete, func, insert, select
+from app.database import Base, SessionLocal, engine
+from app.models.job import Job
+from app.services.jobs import WorkerPool, job_handler
+
+@job_handler("benchmark")
+def benchmark_job(db, payload, progress):
+    time.sleep(payload["work_ms"] / 1000)
+    return {"done": True}
+
+def pending(db) -> int:
+    return db.execute(select(func.count()).select_from(Job).where(Job.status.in_(("queued", "running")))).scalar()
+
+def main():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    print(f"jobs: {args.jobs}  work: {args.work_ms}ms  ideal 1-worker rate: {1000 / args.work_ms:.1f} jobs/s")
+    print(f"{'workers':>8} {'jobs/s':>10} {'p50 ms':>10} {'max ms':>10}")
+    for workers in args.workers:
+        with SessionLocal() as db:
+            db.execute(delete(Job))
+            now = datetime.utcnow()
+            db.execute(insert(Job), [
+                {"kind": "benchmark", "payload": {"work_ms": args.work_ms}, "run_after": now}
+                for _ in range(args.jobs)
+            ])
+            db.commit()
+
+        pool = WorkerPool(workers, poll_interval=0.01)
+        start = time.perf_counter()
+        pool.start()
+        with SessionLocal() as db:
+            while pending(db):
+                time.sleep(0.01)
+        elapsed = time.perf_counter() - start
+        pool.stop()
+
+        with SessionLocal() as db:
+            rows = db.execute(select(Job.created_at, Job.finished_at).where(Job.status == "succeeded")).all()
+        assert len(rows) == args.jobs, f"{args.jobs - len(rows)} jobs did not succeed"
+        latencies = [(finished - created).total_seconds() * 1000 for created, finished in rows]
+        print(f"{workers:>8} {args.jobs / elapsed:>10.1f} {statistics.median(latencies):>10.1f} {max(latencies):>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+List serialization benchmark.
+
+Compares the two ways a list endpoint can build its body, at several list
+sizes:
+  response_model  ORM objects validated into List[EmployeeResponse]
+                  (from_attributes), dumped to JSON-mode Python and encoded
+                  by the stdlib json encoder, as FastAPI does for a
+                  returned list
+  fast_json       the response columns fetched as rows and encoded
+                  directly by app.core.fast_json.dumps
+
+Each path is timed from query to bytes; the bodies are checked to decode
+to the same data.
+
+Run from the backend directory:
+    python -m benchmarks.bench_json --rows 1000 10000 100000 --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+from datetime import date, timedelta
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite:///./bench_json.db")
+parser.add_argument("--rows", type=int, nargs="*", default=[1000, 10000, 100000])
+parser.add_argument("--runs", type=int, default=5)
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from typing import List
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
+from app.database import Base, SessionLocal, engine
+from app.models.employee import Employee
+from app.schemas.employee import EmployeeResponse
+from app.api.v1.employees import EMPLOYEE_RESPONSE_COLUMNS
+from app.core.fast_json import dumps
+
+employee_list = TypeAdapter(List[EmployeeResponse])
+
+def seed(rows: int):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    joined = date(2020, 1, 1)
+    with SessionLocal() as db:
+        db.execute(insert(Employee), [{
+            "emp_id": f"BMJSON2024{i:06d}",
+            "company_code": "BM",
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "email": f"bmjson{i}@example.com",
+            "phone": f"9{i:09d}",
+            "password_hash": "not-a-hash",
+            "role": "employee",
+            "department": ("Engineering", "Sales", "Support", None)[i % 4],
+            "location": ("Pune", "Delhi", "Bengaluru")[i % 3],
+            "date_of_joining": joined + timedelta(days=i % 1500)
+        } for i in range(rows)])
+        db.commit()
+
+def response_model_body(limit: int) -> bytes:
+    with SessionLocal() as db:
+        employees = db.execute(select(Employee).order_by(Employee.emp_id).limit(limit)).scalars().all()
+        content = employee_list.dump_python(employee_list.validate_python(employees), mode="json")
+    # starlette.responses.JSONResponse.render
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+def fast_json_body(limit: int) -> bytes:
+    with SessionLocal() as db:
+        rows = db.execute(select(*EMPLOYEE_RESPONSE_COLUMNS).order_by(Employee.emp_id).limit(limit)).all()
+    return dumps(rows)
+
+def timed(fn, limit: int) -> float:
+    samples = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        fn(limit)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def main():
+    seed(max(args.rows))
+    print(f"{'rows':>8} {'response_model ms':>18} {'fast_json ms':>13} {'speedup':>8}")
+    for limit in args.rows:
+        assert json.loads(response_model_body(limit)) == json.loads(fast_json_body(limit))
+        old = timed(response_model_body, limit)
+        new = timed(fast_json_body, limit)
+        print(f"{limit:>8} {old:>18.1f} {new:>13.1f} {old / new:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Login storm benchmark.
+
+Seeds a set of employees, then fires concurrent POST /api/v1/auth/login
+requests against the app in-process for each password-hashing pool size and
+reports logins/sec and latency percentiles. Throughput should scale with the
+pool size up to the number of cores.
+
+Run from the backend directory:
+    python -m benchmarks.bench_login --users 50 --requests 200 --concurrency 32
+"""
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite:///./bench_login.db")
+parser.add_argument("--users", type=int, default=50)
+parser.add_argument("--requests", type=int, default=200)
+parser.add_argument("--concurrency", type=int, default=32)
+parser.add_argument("--workers", type=int, nargs="*", help="Pool sizes to compare (default: 1, 2, 4 ... cores)")
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from app.config import settings
+from app.database import Base, SessionLocal, engine
+from app.models.employee import Employee
+from app.core.security import get_password_hash, shutdown_password_pool
+from app.main import app
+
+def pool_sizes():
+    if args.workers:
+        return args.workers
+    cores = os.cpu_count() or 1
+    sizes = [1]
+    while sizes[-1] * 2 <= cores:
+        sizes.append(sizes[-1] * 2)
+    if sizes[-1] != cores:
+        sizes.append(cores)
+    return sizes
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def main():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    password_hash = get_password_hash("benchmark-password")
+    with SessionLocal() as db:
+        db.execute(insert(Employee), [
+            {
+                "emp_id": f"BMLOGI2024{i:04d}",
+                "company_code": "BM",
+                "first_name": "Login",
+                "last_name": "User",
+                "email": f"login.user.{i}@example.com",
+                "phone": "0000000000",
+                "password_hash": password_hash,
+                "date_of_joining": date.today()
+            }
+            for i in range(args.users)
+        ])
+        db.commit()
+
+    client = TestClient(app)
+
+    def login(i: int) -> float:
+        start = time.perf_counter()
+        response = client.post("/api/v1/auth/login", data={
+            "username": f"login.user.{i % args.users}@example.com",
+            "password": "benchmark-password"
+        })
+        assert response.status_code == 200, response.text
+        return time.perf_counter() - start
+
+    print(f"cores: {os.cpu_count()}  rounds: {settings.PASSWORD_HASH_ROUNDS}  "
+          f"requests: {args.requests}  concurrency: {args.concurrency}")
+    print(f"{'workers':>8} {'logins/s':>10} {'p50 ms':>10} {'p99 ms':>10}")
+    for workers in pool_sizes():
+        shutdown_password_pool()
+        settings.PASSWORD_HASH_WORKERS = workers
+        login(0)  # warm up the pool
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            latencies = list(pool.map(login, range(args.requests)))
+        elapsed = time.perf_counter() - start
+
+        print(f"{workers:>8} {args.requests / elapsed:>10.1f} "
+              f"{statistics.median(latencies) * 1000:>10.1f} {percentile(latencies, 99) * 1000:>10.1f}")
+    shutdown_password_pool()
+
+if __name__ == "__main__":
+    main()
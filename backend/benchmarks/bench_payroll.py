@@ -0,0 +1,107 @@
+"""
+Month-end payroll benchmark.
+
+Seeds employees with salary structures, attendance summaries, PF and tax rows
+and times app.services.payroll.run_payroll for one month, split into the
+load, compute and write phases.
+
+Run from the backend directory:
+    python -m benchmarks.bench_payroll --employees 50000
+"""
+import argparse
+import os
+import random
+import time
+from datetime import date
+from decimal import Decimal
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite:///./bench_payroll.db")
+parser.add_argument("--employees", type=int, default=50000)
+parser.add_argument("--year", type=int, default=2024)
+parser.add_argument("--month", type=int, default=6)
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import func, insert
+from app.database import Base, SessionLocal, engine
+from app.models import (
+    Employee,
+    EmployeeSalaryStructure,
+    EmployeePFContribution,
+    EmployeeTaxDeductions,
+    MonthlyAttendanceSummary,
+    PayrollResult
+)
+from app.services import payroll
+
+def seed(db):
+    rng = random.Random(42)
+    emp_ids = [f"BMPAYR2024{i:06d}" for i in range(args.employees)]
+    db.execute(insert(Employee), [
+        {
+            "emp_id": emp_id,
+            "company_code": "BM",
+            "first_name": "Pay",
+            "last_name": "Roll",
+            "email": f"{emp_id.lower()}@example.com",
+            "phone": "0000000000",
+            "password_hash": "not-used",
+            "date_of_joining": date(2020, 1, 1)
+        }
+        for emp_id in emp_ids
+    ])
+    db.execute(insert(EmployeeSalaryStructure), [
+        {
+            "emp_id": emp_id,
+            "monthly_wage": Decimal(rng.randrange(2000000, 20000000)) / 100,
+            "effective_from": date(2020, 1, 1)
+        }
+        for emp_id in emp_ids
+    ])
+    db.execute(insert(MonthlyAttendanceSummary), [
+        {
+            "emp_id": emp_id,
+            "year": args.year,
+            "month": args.month,
+            "total_working_days": 22,
+            "days_present": 20,
+            "unpaid_leaves_taken": Decimal(rng.choice([0, 0, 0, 1, 2]))
+        }
+        for emp_id in emp_ids
+    ])
+    db.execute(insert(EmployeePFContribution), [
+        {"emp_id": emp_id, "year": args.year, "month": args.month, "basic_salary": Decimal("15000.00")}
+        for emp_id in emp_ids[::3]
+    ])
+    db.execute(insert(EmployeeTaxDeductions), [
+        {"emp_id": emp_id, "year": args.year, "month": args.month, "tds_deduction": Decimal(rng.randrange(0, 500000)) / 100}
+        for emp_id in emp_ids[::2]
+    ])
+    db.commit()
+
+def main():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        start = time.perf_counter()
+        seed(db)
+        print(f"seeded {args.employees} employees in {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        columns = payroll.load_payroll_columns(db, args.year, args.month)
+        loaded = time.perf_counter()
+        results = payroll.compute_payroll(columns)
+        computed = time.perf_counter()
+        print(f"load: {loaded - start:.2f}s  compute: {computed - loaded:.2f}s  ({len(results)} employees)")
+
+        start = time.perf_counter()
+        written = payroll.run_payroll(db, args.year, args.month)
+        elapsed = time.perf_counter() - start
+        total_net = db.query(func.sum(PayrollResult.net_pay)).scalar()
+        print(f"full run: {elapsed:.2f}s  {written / elapsed:.0f} employees/s  total net pay: {total_net}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Request instrumentation overhead benchmark.
+
+Serves the same requests in-process with METRICS_ENABLED on and off, each
+in a fresh interpreter, and reports per-request latency for both and the
+difference. The directory request runs a few SQL statements, the root
+request none, so both the middleware and the cursor hooks are covered.
+
+Run from the backend directory:
+    python -m benchmarks.bench_request_metrics --requests 2000 --runs 3
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite:///./bench_request_metrics.db")
+parser.add_argument("--requests", type=int, default=2000)
+parser.add_argument("--runs", type=int, default=3)
+parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+ENDPOINTS = {
+    "root": "/",
+    "employee": "/api/v1/employees/BMMETR20240000",
+}
+
+def seed():
+    from sqlalchemy import insert
+    from app.database import Base, SessionLocal, engine
+    from app.models.employee import Employee
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.execute(insert(Employee), [{
+            "emp_id": "BMMETR20240000",
+            "company_code": "BM",
+            "first_name": "Metrics",
+            "last_name": "User",
+            "email": "metrics.user@example.com",
+            "phone": "0000000000",
+            "password_hash": "not-a-hash",
+            "role": "admin",
+            "date_of_joining": date.today()
+        }])
+        db.commit()
+
+def run_child():
+    from fastapi.testclient import TestClient
+    from app.core.security import create_access_token
+    from app.main import app
+
+    client = TestClient(app)
+    headers = {"Authorization": "Bearer " + create_access_token({"sub": "BMMETR20240000"})}
+    timings = {}
+    for name, path in ENDPOINTS.items():
+        for _ in range(50):  # warm up
+            client.get(path, headers=headers)
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            response = client.get(path, headers=headers)
+        timings[name] = (time.perf_counter() - start) / args.requests
+        assert response.status_code == 200, response.text
+    print(json.dumps(timings))
+
+def main():
+    if args.child:
+        run_child()
+        return
+
+    seed()
+    results = {}
+    for enabled in ("false", "true"):
+        env = {**os.environ, "METRICS_ENABLED": enabled}
+        runs = []
+        for _ in range(args.runs):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_request_metrics", "--child",
+                 "--database-url", args.database_url, "--requests", str(args.requests)],
+                check=True, capture_output=True, text=True, env=env
+            ).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+        results[enabled] = {name: statistics.median(run[name] for run in runs) * 1e6 for name in ENDPOINTS}
+
+    print(f"{'endpoint':<10} {'off us':>10} {'on us':>10} {'overhead us':>12}")
+    for name in ENDPOINTS:
+        off, on = results["false"][name], results["true"][name]
+        print(f"{name:<10} {off:>10.1f} {on:>10.1f} {on - off:>12.1f}")
+
+if __name__ == "__main__":
+    main()
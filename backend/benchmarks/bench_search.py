@@ -0,0 +1,139 @@
+"""
+Employee search latency benchmark.
+
+Seeds employees with names, emails, departments, locations, skills and
+certifications drawn from realistic pools, then runs a mix of queries
+(whole names, prefixes, typos, skills, multi-word) against
+GET /api/v1/employees/search in-process and reports latency percentiles,
+plus the one-off cost of building the in-process index. The target is a
+p99 under 20 ms at 100k employees. On SQLite the in-process index is
+measured; point --database-url at Postgres (with migrations applied) to
+measure the trigram indexes.
+
+Run from the backend directory:
+    python -m benchmarks.bench_search --employees 100000 --requests 2000
+"""
+import argparse
+import os
+import random
+import statistics
+import time
+from datetime import date
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite:///./bench_search.db")
+parser.add_argument("--employees", type=int, default=100000)
+parser.add_argument("--requests", type=int, default=2000)
+parser.add_argument("--limit", type=int, default=20)
+parser.add_argument("--seed", type=int, default=42)
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from app.database import Base, SessionLocal, engine
+from app.models.employee import Employee, EmployeePersonalInfo
+from app.core.search_index import employee_search_index
+from app.core.security import create_access_token
+from app.main import app
+
+FIRST_NAMES = [
+    "Aarav", "Aditi", "Aisha", "Akash", "Amit", "Ananya", "Anil", "Anjali", "Arjun", "Asha", "Deepak", "Divya",
+    "Farhan", "Gaurav", "Isha", "Karan", "Kavya", "Lakshmi", "Manish", "Meera", "Mohit", "Neha", "Nikhil", "Pooja",
+    "Pradeep", "Priya", "Rahul", "Rajesh", "Ravi", "Riya", "Rohan", "Sanjay", "Sneha", "Sunil", "Tanvi", "Varun",
+    "Vikram", "Zara", "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "David",
+    "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Daniel",
+    "Karen", "Matthew", "Nancy", "Anthony", "Lisa", "Mark", "Sandra", "Steven", "Ashley", "Andrew", "Emily",
+]
+LAST_NAMES = [
+    "Sharma", "Verma", "Gupta", "Singh", "Kumar", "Patel", "Reddy", "Nair", "Iyer", "Menon", "Rao", "Joshi",
+    "Mehta", "Shah", "Desai", "Kapoor", "Malhotra", "Chopra", "Bose", "Banerjee", "Mukherjee", "Das", "Ghosh",
+    "Pillai", "Kulkarni", "Deshpande", "Agarwal", "Bhat", "Chauhan", "Saxena", "Smith", "Johnson", "Williams",
+    "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wilson",
+    "Anderson", "Taylor", "Thomas", "Moore", "Jackson", "Martin", "Lee", "Thompson", "White", "Harris", "Clark",
+]
+DEPARTMENTS = ["Engineering", "Sales", "Marketing", "Finance", "Human Resources", "Support", "Operations", "Legal", "Design", "Product"]
+LOCATIONS = ["Pune", "Mumbai", "Delhi", "Bengaluru", "Hyderabad", "Chennai", "Kolkata", "London", "Singapore", "Austin"]
+SKILLS = [
+    "Python", "Java", "Go", "Rust", "TypeScript", "React", "Kubernetes", "Docker", "Terraform", "PostgreSQL",
+    "Excel", "Negotiation", "Recruiting", "Payroll", "Accounting", "Figma", "SQL", "Tableau", "Salesforce",
+    "Public Speaking", "Machine Learning", "Data Analysis", "Project Management", "Copywriting", "SEO",
+]
+CERTIFICATIONS = [
+    "AWS Solutions Architect", "CKA", "PMP", "CPA", "SHRM", "Scrum Master", "Google Analytics", "CISSP",
+    "Azure Fundamentals", "ITIL", "Six Sigma", "CFA",
+]
+QUERIES = [
+    "priya", "pri", "sharma", "priya sharma", "sharm", "shrama", "john", "jonh", "jo", "kulkarni", "kulkarny",
+    "engineering", "engineering pune", "python", "pyhton", "kubernetes", "kube", "aws", "machine learning",
+    "data", "recruiting mumbai", "singapore", "finance london", "rahul kumar", "deshpande", "bengaluru",
+    "tableau", "scrum", "legal", "human resources", "anan", "anderson", "elizabeth", "elizabth", "six sigma",
+]
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def seed():
+    rng = random.Random(args.seed)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    employees, personal_info = [], []
+    for i in range(args.employees):
+        emp_id = f"BMSRCH2024{i:06d}"
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        employees.append({
+            "emp_id": emp_id,
+            "company_code": "BM",
+            "first_name": first,
+            "last_name": last,
+            "email": f"{first.lower()}.{last.lower()}{i}@example.com",
+            "phone": f"9{i:09d}",
+            "password_hash": "not-a-hash",
+            "role": "admin" if i == 0 else "employee",
+            "department": rng.choice(DEPARTMENTS),
+            "location": rng.choice(LOCATIONS),
+            "date_of_joining": date(2020, 1, 1)
+        })
+        personal_info.append({
+            "emp_id": emp_id,
+            "skills": ", ".join(rng.sample(SKILLS, rng.randint(1, 4))),
+            "certifications": ", ".join(rng.sample(CERTIFICATIONS, rng.randint(0, 2))) or None
+        })
+    with SessionLocal() as db:
+        db.execute(insert(Employee), employees)
+        db.execute(insert(EmployeePersonalInfo), personal_info)
+        db.commit()
+
+def main():
+    seed()
+    client = TestClient(app)
+    headers = {"Authorization": "Bearer " + create_access_token({"sub": "BMSRCH2024000000"})}
+
+    start = time.perf_counter()
+    client.get("/api/v1/employees/search", params={"q": QUERIES[0]}, headers=headers)
+    first = (time.perf_counter() - start) * 1000
+    for query in QUERIES:  # warm up
+        client.get("/api/v1/employees/search", params={"q": query, "limit": args.limit}, headers=headers)
+
+    rng = random.Random(args.seed)
+    latencies, results = [], []
+    for _ in range(args.requests):
+        query = rng.choice(QUERIES)
+        start = time.perf_counter()
+        response = client.get("/api/v1/employees/search", params={"q": query, "limit": args.limit}, headers=headers)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.text
+        results.append(len(response.json()))
+
+    print(f"employees: {args.employees}  requests: {args.requests}  limit: {args.limit}")
+    if not employee_search_index.is_stale():
+        print(f"first request (builds in-process index): {first:.0f} ms")
+    print(f"p50 {statistics.median(latencies):.2f} ms  p95 {percentile(latencies, 95):.2f} ms  "
+          f"p99 {percentile(latencies, 99):.2f} ms  max {max(latencies):.2f} ms")
+    print(f"queries with no results: {sum(1 for count in results if count == 0)}")
+
+if __name__ == "__main__":
+    main()
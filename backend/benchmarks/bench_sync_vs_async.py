@@ -0,0 +1,120 @@
+"""
+Sync vs async database stack benchmark.
+
+Runs GET /api/v1/employees/{emp_id} against the app in-process at rising
+concurrency, once with the sync handlers (FastAPI threadpool) and once with
+DATABASE_ASYNC=true (AsyncEngine + async handlers), and prints requests/sec
+side by side, with the number of failed requests (e.g. connection pool
+timeouts) in brackets. Each mode runs in its own interpreter because the mode is
+chosen at import time.
+
+Run from the backend directory:
+    python -m benchmarks.bench_sync_vs_async --requests 2000 --concurrency 10 50 100 400
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite:///./bench_sync_vs_async.db")
+parser.add_argument("--employees", type=int, default=1000)
+parser.add_argument("--requests", type=int, default=2000)
+parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50, 100, 200, 400])
+parser.add_argument("--mode", choices=["sync", "async"], help=argparse.SUPPRESS)
+args = parser.parse_args()
+
+def run_mode():
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["DATABASE_ASYNC"] = "true" if args.mode == "async" else "false"
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+
+    import httpx
+    from app.core.security import create_access_token
+    from app.main import app
+
+    token = create_access_token({"sub": "BMADMI20240000"})
+    headers = {"Authorization": f"Bearer {token}"}
+    results = {}
+
+    async def bench(concurrency: int) -> dict:
+        semaphore = asyncio.Semaphore(concurrency)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            async def fetch(i: int) -> bool:
+                async with semaphore:
+                    try:
+                        response = await client.get(
+                            f"/api/v1/employees/BMEMPL2024{i % args.employees:05d}", headers=headers
+                        )
+                    except Exception:
+                        return False
+                    return response.status_code == 200
+
+            await fetch(0)  # warm up the principal cache and connection pool
+            start = time.perf_counter()
+            succeeded = await asyncio.gather(*(fetch(i) for i in range(args.requests)))
+            return {
+                "requests_per_sec": args.requests / (time.perf_counter() - start),
+                "errors": succeeded.count(False)
+            }
+
+    for concurrency in args.concurrency:
+        results[concurrency] = asyncio.run(bench(concurrency))
+    print(json.dumps(results))
+
+def seed():
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    from datetime import date
+    from sqlalchemy import insert
+    from app.database import Base, SessionLocal, engine
+    from app import models
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    rows = [
+        {
+            "emp_id": f"BMEMPL2024{i:05d}",
+            "company_code": "BM",
+            "first_name": "Bench",
+            "last_name": "Mark",
+            "email": f"bench.{i}@example.com",
+            "phone": "0000000000",
+            "password_hash": "not-used",
+            "date_of_joining": date(2024, 1, 1)
+        }
+        for i in range(args.employees)
+    ]
+    rows.append({**rows[0], "emp_id": "BMADMI20240000", "email": "admin@example.com", "role": models.employee.RoleEnum.admin})
+    with SessionLocal() as db:
+        db.execute(insert(models.Employee), rows)
+        db.commit()
+
+def main():
+    if args.mode:
+        run_mode()
+        return
+
+    seed()
+    results = {}
+    for mode in ("sync", "async"):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_sync_vs_async", *sys.argv[1:], "--mode", mode],
+            check=True, capture_output=True, text=True
+        ).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{'concurrency':>12} {'sync req/s':>18} {'async req/s':>18}")
+    for concurrency in args.concurrency:
+        cells = [
+            f"{results[mode][str(concurrency)]['requests_per_sec']:.1f} [{results[mode][str(concurrency)]['errors']}]"
+            for mode in ("sync", "async")
+        ]
+        print(f"{concurrency:>12} {cells[0]:>18} {cells[1]:>18}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Year-rollover benchmark.
+
+Seeds employees with last year's time-off balances (random usage) and times
+app.services.timeoff_rollover.rollover_balances, then times a second run to
+show that re-running is a cheap no-op.
+
+Run from the backend directory:
+    python -m benchmarks.bench_timeoff_rollover --employees 100000
+"""
+import argparse
+import os
+import random
+import time
+from datetime import date
+from decimal import Decimal
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite:///./bench_timeoff_rollover.db")
+parser.add_argument("--employees", type=int, default=100000)
+parser.add_argument("--year", type=int, default=2025)
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import func, insert
+from app.database import Base, SessionLocal, engine
+from app.models import Employee, TimeOffBalance
+from app.services.timeoff_rollover import rollover_balances
+
+def seed(db):
+    rng = random.Random(42)
+    emp_ids = [f"BMROLL2020{i:06d}" for i in range(args.employees)]
+    db.execute(insert(Employee), [
+        {
+            "emp_id": emp_id,
+            "company_code": "BM",
+            "first_name": "Roll",
+            "last_name": "Over",
+            "email": f"{emp_id.lower()}@example.com",
+            "phone": "0000000000",
+            "password_hash": "not-used",
+            "date_of_joining": date(2020, 1, 1),
+            # A few leavers, who must not get a new balance
+            "is_active": i % 50 != 0
+        }
+        for i, emp_id in enumerate(emp_ids)
+    ])
+    # Recent joiners have no balance for last year
+    db.execute(insert(TimeOffBalance), [
+        {
+            "emp_id": emp_id,
+            "year": args.year - 1,
+            "paid_time_off_total": Decimal("12.0"),
+            "paid_time_off_used": Decimal(rng.randrange(0, 25)) / 2,
+            "sick_leave_total": Decimal("7.0"),
+            "sick_leave_used": Decimal(rng.randrange(0, 8))
+        }
+        for emp_id in emp_ids[: args.employees * 9 // 10]
+    ])
+    db.commit()
+
+def main():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        start = time.perf_counter()
+        seed(db)
+        print(f"seeded {args.employees} employees in {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        created = rollover_balances(db, args.year)
+        elapsed = time.perf_counter() - start
+        print(f"rollover: {elapsed:.2f}s  {created} balances  {created / elapsed:.0f} rows/s")
+
+        start = time.perf_counter()
+        again = rollover_balances(db, args.year)
+        print(f"re-run: {time.perf_counter() - start:.2f}s  {again} balances")
+
+        total = db.query(func.sum(TimeOffBalance.paid_time_off_total)).filter(TimeOffBalance.year == args.year).scalar()
+        print(f"paid time off granted for {args.year}: {total} days")
+
+if __name__ == "__main__":
+    main()
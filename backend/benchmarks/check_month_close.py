@@ -0,0 +1,144 @@
+"""
+Month-close check: payroll finalizes the month, then archiving moves it.
+
+Seeds one employee with a month of attendance in 2001 (far from any real
+data), rebuilds the month's summaries, runs payroll, and checks that the
+summaries are finalized, that archive_finalized_months moves every one of
+the month's attendance rows into attendance_archive, and that
+attendance_history() still returns them. Exits non-zero on the first
+failed step.
+
+On Postgres, point it at a scratch database migrated with
+`alembic upgrade head`, so attendance is partitioned. The month's partition
+is created first, which also runs the detach/attach archive path. Other
+databases get the tables created if missing and use the copy-and-delete path.
+Other finalized months in the database are archived too.
+
+Run from the backend directory:
+    python -m benchmarks.check_month_close
+    python -m benchmarks.check_month_close --database-url postgresql://localhost/hrms_test
+"""
+import argparse
+import os
+import sys
+from datetime import date, time
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite://")
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import delete, func, inspect, insert, select
+from app.database import Base, SessionLocal, engine
+from app.models import (
+    Attendance,
+    AttendanceArchive,
+    Employee,
+    EmployeeSalaryStructure,
+    MonthlyAttendanceSummary,
+    PayrollResult
+)
+from app.services.attendance_storage import (
+    archive_finalized_months,
+    attendance_history,
+    create_partition,
+    is_partitioned,
+    month_bounds
+)
+from app.services.attendance_summary import rebuild_monthly_summaries
+from app.services.payroll import run_payroll
+
+EMP_ID = "CHMCLS20010001"
+YEAR, MONTH = 2001, 3
+
+def seed(db) -> int:
+    # Left over from an earlier run
+    for model in (AttendanceArchive, Attendance, MonthlyAttendanceSummary, PayrollResult, EmployeeSalaryStructure, Employee):
+        db.execute(delete(model).where(model.emp_id == EMP_ID))
+    db.commit()
+
+    db.execute(insert(Employee).values(
+        emp_id=EMP_ID,
+        company_code="CH",
+        first_name="Month",
+        last_name="Close",
+        email="month.close@example.com",
+        phone="0000000001",
+        password_hash="not-a-hash",
+        role="employee",
+        date_of_joining=date(2000, 1, 1)
+    ))
+    db.execute(insert(EmployeeSalaryStructure).values(emp_id=EMP_ID, monthly_wage=22000, effective_from=date(2000, 1, 1)))
+    days = [date(YEAR, MONTH, day) for day in range(1, 32) if date(YEAR, MONTH, day).weekday() < 5][:20]
+    db.execute(insert(Attendance), [
+        {
+            "emp_id": EMP_ID,
+            "attendance_date": day,
+            "check_in_time": time(9, 0),
+            "check_out_time": time(18, 0),
+            "work_hours": 8,
+            "extra_hours": 0,
+            "status": "present"
+        }
+        for day in days
+    ])
+    db.commit()
+    return len(days)
+
+def check(condition: bool, step: str) -> None:
+    print(f"{'ok' if condition else 'FAIL':>4}  {step}")
+    if not condition:
+        sys.exit(1)
+
+def main():
+    if not inspect(engine).has_table("attendance_archive"):
+        Base.metadata.create_all(bind=engine)
+
+    with SessionLocal() as db:
+        seeded = seed(db)
+        start, end = month_bounds(YEAR, MONTH)
+        if is_partitioned(db):
+            create_partition(db, "attendance", YEAR, MONTH)
+            db.commit()
+
+        rebuild_monthly_summaries(db, YEAR, MONTH)
+        present = db.execute(
+            select(MonthlyAttendanceSummary.days_present)
+            .where(MonthlyAttendanceSummary.emp_id == EMP_ID, MonthlyAttendanceSummary.year == YEAR)
+        ).scalar()
+        check(present == seeded, f"summary counts {seeded} present days")
+
+        run_payroll(db, YEAR, MONTH)
+        pay = db.execute(select(PayrollResult.loss_of_pay_days).where(PayrollResult.emp_id == EMP_ID)).scalar()
+        check(pay is not None, f"payroll written (loss of pay {pay} days)")
+        open_summaries = db.execute(
+            select(func.count())
+            .select_from(MonthlyAttendanceSummary)
+            .where(
+                MonthlyAttendanceSummary.year == YEAR,
+                MonthlyAttendanceSummary.month == MONTH,
+                MonthlyAttendanceSummary.is_finalized.is_not(True)
+            )
+        ).scalar()
+        check(open_summaries == 0, "payroll finalized the month's summaries")
+
+        archived = {(year, month): rows for year, month, rows in archive_finalized_months(db)}
+        check(archived.get((YEAR, MONTH)) == seeded, f"archived {archived.get((YEAR, MONTH))} rows")
+        hot = db.execute(select(func.count()).select_from(Attendance).where(
+            Attendance.emp_id == EMP_ID, Attendance.attendance_date >= start, Attendance.attendance_date < end
+        )).scalar()
+        check(hot == 0, "no rows left in attendance")
+        history = attendance_history()
+        found = db.execute(
+            select(func.count()).select_from(history).where(
+                history.c.emp_id == EMP_ID,
+                history.c.attendance_date >= start,
+                history.c.attendance_date < end
+            )
+        ).scalar()
+        check(found == seeded, "attendance_history() still returns them")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Query-plan regression check for the hot query shapes.
+
+Runs EXPLAIN for each query below and exits non-zero if any of them reads a
+whole table or a whole index instead of searching an index. On SQLite every
+table in EXPLAIN QUERY PLAN has to be a SEARCH (a SCAN, even of a covering
+index, fails); on Postgres sequential scans are disabled first so that a
+missing index still shows up as a "Seq Scan" on small tables, and index scans
+without an index condition fail too, unless the index is a partial one such
+as the pending-requests index, which only holds the rows the query wants.
+
+Run from the backend directory:
+    python -m benchmarks.check_query_plans
+    python -m benchmarks.check_query_plans --database-url postgresql://localhost/hrms_test
+"""
+import argparse
+import os
+import sys
+from datetime import date
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite://")
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, select, text
+from app.database import Base
+from app.models import (
+    Employee,
+    Attendance,
+    MonthlyAttendanceSummary,
+    TimeOffRequest,
+    EmployeePFContribution,
+    EmployeeTaxDeductions,
+    EmployeeSalaryStructure,
+    WorkingSchedule
+)
+from app.api.v1.employees import listing_version_statement
+from app.core.principal_cache import Principal
+
+TODAY = date(2024, 6, 3)
+ADMIN = Principal(emp_id="ADMIN", role="admin", is_active=True)
+
+HOT_QUERIES = {
+    "my team": select(Employee.emp_id).where(Employee.manager_id == "MGR"),
+    "directory page": select(Employee.emp_id)
+        .where(Employee.is_active == True, Employee.emp_id > "CURSOR")
+        .order_by(Employee.emp_id).limit(50),
+    "directory page version": listing_version_statement(ADMIN, "CURSOR", 50),
+    "department filter": select(Employee.emp_id).where(Employee.department == "Engineering"),
+    "my time-off requests": select(TimeOffRequest.request_id)
+        .where(TimeOffRequest.emp_id == "EMP", TimeOffRequest.status == "approved"),
+    "pending approvals": select(TimeOffRequest.request_id)
+        .join(Employee, Employee.emp_id == TimeOffRequest.emp_id)
+        .where(Employee.manager_id == "MGR", TimeOffRequest.status == "pending"),
+    "approved by me": select(TimeOffRequest.request_id).where(TimeOffRequest.approved_by == "MGR"),
+    "who's in today": select(Attendance.emp_id).where(Attendance.attendance_date == TODAY),
+    "attendance range": select(Attendance.emp_id)
+        .where(Attendance.attendance_date.between(date(2024, 6, 1), date(2024, 6, 30))),
+    "month summaries": select(MonthlyAttendanceSummary.emp_id)
+        .where(MonthlyAttendanceSummary.year == 2024, MonthlyAttendanceSummary.month == 6),
+    "month PF rows": select(EmployeePFContribution.emp_id)
+        .where(EmployeePFContribution.year == 2024, EmployeePFContribution.month == 6),
+    "month tax rows": select(EmployeeTaxDeductions.emp_id)
+        .where(EmployeeTaxDeductions.year == 2024, EmployeeTaxDeductions.month == 6),
+    "salary structure": select(EmployeeSalaryStructure.salary_structure_id)
+        .where(EmployeeSalaryStructure.emp_id == "EMP"),
+    "current schedule": select(WorkingSchedule.schedule_id).where(WorkingSchedule.emp_id == "EMP"),
+}
+
+# Query name -> tables it may read in full, for a query whose plan is meant to
+# scan
+ALLOWED_SCANS = {
+    # SQLite reads the page window subquery in full, which is at most limit + 1 rows
+    "directory page version": ("page_window",),
+}
+
+def _pg_scans(node: dict, partial_indexes: set) -> list:
+    scans = []
+    if node["Node Type"] == "Seq Scan" or (
+        node["Node Type"] in ("Index Scan", "Index Only Scan")
+        and "Index Cond" not in node
+        and node["Index Name"] not in partial_indexes
+    ):
+        scans.append((node["Relation Name"], f"{node['Node Type']} on {node['Relation Name']}"))
+    for child in node.get("Plans", ()):
+        scans.extend(_pg_scans(child, partial_indexes))
+    return scans
+
+def full_scans(connection, name, statement) -> list:
+    compiled = statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    if connection.dialect.name == "sqlite":
+        plan = [row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))]
+        scans = [(line.split()[1], line) for line in plan if line.startswith("SCAN")]
+    else:
+        plan = connection.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar()
+        partial_indexes = set(connection.execute(text(
+            "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE i.indpred IS NOT NULL"
+        )).scalars())
+        scans = _pg_scans(plan[0]["Plan"], partial_indexes)
+    allowed = ALLOWED_SCANS.get(name, ())
+    return [line for table, line in scans if table not in allowed]
+
+def main():
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    failures = 0
+    with engine.connect() as connection:
+        if engine.dialect.name == "postgresql":
+            connection.execute(text("SET enable_seqscan = off"))
+        for name, statement in HOT_QUERIES.items():
+            scans = full_scans(connection, name, statement)
+            print(f"{'FAIL' if scans else 'ok':>4}  {name}")
+            for line in scans:
+                print(f"        {line}")
+            failures += bool(scans)
+
+    if failures:
+        print(f"{failures} hot queries read a whole table or index")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Employee search behaviour check.
+
+Seeds a handful of employees into a scratch database (the tables are
+dropped and recreated) and runs fixed queries through search_employees,
+exiting non-zero when a query does not return exactly the expected active
+employees. On SQLite this exercises the in-process index; point
+--database-url at Postgres (pg_trgm available) to check the trigram search,
+which has to agree: every query word must match, in any field, with
+prefixes and typos allowed.
+
+Run from the backend directory:
+    python -m benchmarks.check_search
+    python -m benchmarks.check_search --database-url postgresql://localhost/hrms_test
+"""
+import argparse
+import os
+import sys
+from datetime import date
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite://")
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import insert
+from app.database import Base, SessionLocal, engine
+from app.models.employee import Employee, EmployeePersonalInfo
+from app.services.search import search_employees
+
+# emp_id: (first, last, department, location, skills, certifications, active)
+EMPLOYEES = {
+    "CHSRCH20240001": ("Priya", "Sharma", "Engineering", "Pune", "Python, Kubernetes", None, True),
+    "CHSRCH20240002": ("Priya", "Patel", "Sales", "Mumbai", "Excel, Negotiation", None, True),
+    "CHSRCH20240003": ("John", "Smith", "Engineering", "London", "Python, Go", "AWS Solutions Architect", True),
+    "CHSRCH20240004": ("Rahul", "Kumar", "Finance", "Pune", "Accounting", None, True),
+    "CHSRCH20240005": ("Priya", "Kapoor", "Engineering", "Pune", "Python", None, False),
+}
+
+# Query -> the active employees it has to return, and nothing else
+CASES = {
+    "whole word": ("priya", {"CHSRCH20240001", "CHSRCH20240002"}),
+    "two names": ("priya sharma", {"CHSRCH20240001"}),
+    "name and skill": ("priya python", {"CHSRCH20240001"}),
+    "prefix": ("sharm", {"CHSRCH20240001"}),
+    "typo": ("pyhton", {"CHSRCH20240001", "CHSRCH20240003"}),
+    "department and location": ("engineering pune", {"CHSRCH20240001"}),
+    "three fields": ("python london aws", {"CHSRCH20240003"}),
+    "one word matches nobody": ("priya london", set()),
+}
+
+def seed():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.execute(insert(Employee), [
+            {
+                "emp_id": emp_id,
+                "company_code": "CH",
+                "first_name": first,
+                "last_name": last,
+                "email": f"{first.lower()}.{last.lower()}@example.com",
+                "phone": emp_id[-10:],
+                "password_hash": "not-a-hash",
+                "role": "employee",
+                "department": department,
+                "location": location,
+                "date_of_joining": date(2024, 1, 1),
+                "is_active": active
+            }
+            for emp_id, (first, last, department, location, _, _, active) in EMPLOYEES.items()
+        ])
+        db.execute(insert(EmployeePersonalInfo), [
+            {"emp_id": emp_id, "skills": skills, "certifications": certifications}
+            for emp_id, (_, _, _, _, skills, certifications, _) in EMPLOYEES.items()
+        ])
+        db.commit()
+
+def main():
+    seed()
+    failures = 0
+    with SessionLocal() as db:
+        for name, (query, expected) in CASES.items():
+            found = {emp_id for emp_id, _ in search_employees(db, query, limit=20)}
+            ok = found == expected
+            print(f"{'ok' if ok else 'FAIL':>4}  {name}: {query!r}")
+            if not ok:
+                print(f"        expected {sorted(expected)}, got {sorted(found)}")
+            failures += not ok
+
+    if failures:
+        print(f"{failures} search checks failed on {engine.dialect.name}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Seeded synthetic HRMS dataset for the benchmarks.
+
+Bulk-inserts N employees (one admin, a manager per ten employees, everyone
+else reporting to a manager) with working schedules, status trackers,
+time-off balances, salary structures, weekday attendance history before
+today and one pending time-off request per employee. The same seed gives
+the same data, so results can be compared across commits.
+
+Run from the backend directory to seed a database for external tools:
+    python -m benchmarks.dataset --database-url postgresql://... --employees 10000
+"""
+import argparse
+import random
+from dataclasses import dataclass
+from datetime import date, time, timedelta
+from decimal import Decimal
+from typing import List
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+PASSWORD = "benchmark-password"
+DEPARTMENTS = ("Engineering", "Sales", "Finance", "People", "Support", "Operations")
+LOCATIONS = ("Pune", "Bengaluru", "Remote")
+INSERT_BATCH = 5000
+
+@dataclass
+class Dataset:
+    emp_ids: List[str]
+    admin_id: str
+    manager_ids: List[str]
+
+    def email(self, emp_id: str) -> str:
+        return f"{emp_id.lower()}@example.com"
+
+def _manager_of(emp_ids: List[str], i: int):
+    """Employees 2-10 report to 1, 12-20 to 11, ...; managers report to the admin. Managers come first."""
+    if i == 0:
+        return None
+    if i % 10 == 1:
+        return emp_ids[0]
+    return emp_ids[(i - 1) // 10 * 10 + 1]
+
+def _insert(db: Session, model, rows: list) -> None:
+    for start in range(0, len(rows), INSERT_BATCH):
+        db.execute(insert(model), rows[start:start + INSERT_BATCH])
+
+def seed_dataset(db: Session, employees: int, history_days: int = 30, seed: int = 42) -> Dataset:
+    """Seed an empty schema with `employees` employees and `history_days` weekdays of attendance"""
+    from app.core.security import get_password_hash
+    from app.models import (
+        Attendance,
+        Employee,
+        EmployeeSalaryStructure,
+        EmployeeStatusTracker,
+        TimeOffBalance,
+        TimeOffRequest,
+        WorkingSchedule
+    )
+    from app.services.hierarchy import rebuild_hierarchy
+    from app.services.onboarding import default_schedule, default_status, default_timeoff_balance
+
+    rng = random.Random(seed)
+    today = date.today()
+    joined = date(today.year - 2, 1, 1)
+    emp_ids = [f"BMLOAD2024{i:05d}" for i in range(employees)]
+    dataset = Dataset(emp_ids, emp_ids[0], [emp_id for i, emp_id in enumerate(emp_ids) if i % 10 == 1])
+    password_hash = get_password_hash(PASSWORD)
+
+    _insert(db, Employee, [
+        {
+            "emp_id": emp_id,
+            "company_code": "BM",
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "email": dataset.email(emp_id),
+            "phone": f"{9000000000 + i}",
+            "password_hash": password_hash,
+            "role": "admin" if i == 0 else "employee",
+            "department": rng.choice(DEPARTMENTS),
+            "location": rng.choice(LOCATIONS),
+            "manager_id": _manager_of(emp_ids, i),
+            "date_of_joining": joined
+        }
+        for i, emp_id in enumerate(emp_ids)
+    ])
+    _insert(db, WorkingSchedule, [default_schedule(emp_id, joined) for emp_id in emp_ids])
+    _insert(db, EmployeeStatusTracker, [default_status(emp_id) for emp_id in emp_ids])
+    _insert(db, TimeOffBalance, [
+        default_timeoff_balance(emp_id, year) for emp_id in emp_ids for year in (today.year, today.year + 1)
+    ])
+    _insert(db, EmployeeSalaryStructure, [
+        {"emp_id": emp_id, "monthly_wage": Decimal(rng.randrange(3000000, 25000000)) / 100, "effective_from": joined}
+        for emp_id in emp_ids
+    ])
+
+    days, current = [], today - timedelta(days=1)
+    while len(days) < history_days:
+        if current.weekday() < 5:
+            days.append(current)
+        current -= timedelta(days=1)
+    for day in days:
+        attendance = []
+        for emp_id in emp_ids:
+            hours = Decimal(rng.randrange(700, 1000)) / 100
+            attendance.append({
+                "emp_id": emp_id,
+                "attendance_date": day,
+                "check_in_time": time(9, rng.randrange(0, 45)),
+                "check_out_time": time(18, rng.randrange(0, 59)),
+                "work_hours": hours,
+                "extra_hours": max(hours - 8, Decimal("0")),
+                "status": "present"
+            })
+        _insert(db, Attendance, attendance)
+
+    # One pending request per employee, starting within the next four weeks
+    requests = []
+    for emp_id in emp_ids[1:]:
+        start = today + timedelta(days=rng.randrange(1, 28))
+        length = rng.randrange(0, 3)
+        requests.append({
+            "emp_id": emp_id,
+            "time_off_type": rng.choice(("paid_time_off", "sick_leave", "unpaid_leave")),
+            "start_date": start,
+            "end_date": start + timedelta(days=length),
+            "total_days": length + 1,
+            "status": "pending"
+        })
+    _insert(db, TimeOffRequest, requests)
+    db.commit()
+    rebuild_hierarchy(db)
+    return dataset
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed a synthetic HRMS dataset into an empty database")
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--employees", type=int, default=2000)
+    parser.add_argument("--history-days", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    import os
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    from app.database import Base, SessionLocal, engine
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        dataset = seed_dataset(db, args.employees, args.history_days, args.seed)
+    print(f"Seeded {len(dataset.emp_ids)} employees ({len(dataset.manager_ids)} managers); password: {PASSWORD}")
+
+if __name__ == "__main__":
+    main()
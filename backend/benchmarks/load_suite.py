@@ -0,0 +1,219 @@
+"""
+HRMS load-test suite.
+
+Seeds the synthetic dataset from benchmarks.dataset into --database-url,
+then runs each scenario against the app in-process and records operations,
+throughput, p50/p99 latency and SQL statements executed:
+
+    login       concurrent POST /auth/login for a sample of employees
+    checkin     9 AM burst: every employee POSTs /attendance/check-in
+    directory   admin pages through GET /employees/ while employees open their profiles
+    approvals   every manager loads their pending queue and decides it in one batch
+    payroll     month-end app.services.payroll.run_payroll
+
+Results are written as JSON (--output) so runs can be compared across
+commits with --compare. SQLite serializes writers; point --database-url at
+a local Postgres for realistic write scenarios.
+
+Run from the backend directory:
+    python -m benchmarks.load_suite --employees 2000 --output before.json
+    python -m benchmarks.load_suite --employees 2000 --output after.json --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+SCENARIOS = ("login", "checkin", "directory", "approvals", "payroll")
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--database-url", default="sqlite:///./bench_load_suite.db")
+parser.add_argument("--employees", type=int, default=2000)
+parser.add_argument("--history-days", type=int, default=30)
+parser.add_argument("--seed", type=int, default=42)
+parser.add_argument("--concurrency", type=int, default=32)
+parser.add_argument("--logins", type=int, default=200)
+parser.add_argument("--scenarios", nargs="*", choices=SCENARIOS, default=list(SCENARIOS))
+parser.add_argument("--output", help="write results to this JSON file")
+parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.database_url
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from app.database import Base, SessionLocal, engine
+from app.core.security import create_access_token, shutdown_password_pool
+from app.services import payroll
+from app.main import app
+from benchmarks.dataset import PASSWORD, seed_dataset
+
+class StatementCounter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def __call__(self, *_):
+        with self._lock:
+            self.count += 1
+
+statements = StatementCounter()
+event.listen(engine, "after_cursor_execute", statements)
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def timed(fn):
+    def wrapper(*fn_args):
+        start = time.perf_counter()
+        fn(*fn_args)
+        return time.perf_counter() - start
+    return wrapper
+
+def measure(operation, items, concurrency: int) -> dict:
+    """Run `operation` over `items` on `concurrency` threads and summarize it"""
+    operation = timed(operation)
+    items = list(items)
+    before = statements.count
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(operation, items))
+    elapsed = time.perf_counter() - start
+    executed = statements.count - before
+    return {
+        "operations": len(latencies),
+        "elapsed_s": round(elapsed, 4),
+        "throughput_per_s": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "sql_statements": executed,
+        "sql_per_operation": round(executed / len(latencies), 2)
+    }
+
+def expect(response, status_code: int = 200):
+    assert response.status_code == status_code, response.text
+    return response
+
+def run_scenarios(dataset) -> dict:
+    client = TestClient(app)
+    tokens = {emp_id: create_access_token({"sub": emp_id}) for emp_id in dataset.emp_ids}
+
+    def auth(emp_id: str) -> dict:
+        return {"Authorization": f"Bearer {tokens[emp_id]}"}
+
+    def login(i: int):
+        emp_id = dataset.emp_ids[i % len(dataset.emp_ids)]
+        expect(client.post("/api/v1/auth/login", data={"username": dataset.email(emp_id), "password": PASSWORD}))
+
+    def check_in(emp_id: str):
+        expect(client.post("/api/v1/attendance/check-in", json={"emp_id": emp_id}, headers=auth(emp_id)))
+
+    def browse(i: int):
+        # Every tenth operation is an admin directory walk, the rest profile views
+        if i % 10:
+            emp_id = dataset.emp_ids[i % len(dataset.emp_ids)]
+            expect(client.get(f"/api/v1/employees/{emp_id}", headers=auth(emp_id)))
+            return
+        cursor = None
+        while True:
+            params = {"limit": 200, **({"cursor": cursor} if cursor else {})}
+            page = expect(client.get("/api/v1/employees/", params=params, headers=auth(dataset.admin_id))).json()
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return
+
+    def approve(manager_id: str):
+        pending = expect(client.get("/api/v1/timeoff/requests/pending", params={"limit": 200}, headers=auth(manager_id))).json()
+        decisions = [{"request_id": item["request_id"], "status": "approved"} for item in pending["items"]]
+        if decisions:
+            expect(client.post("/api/v1/timeoff/requests/decisions", json=decisions, headers=auth(manager_id)))
+
+    def run_payroll(_):
+        last_month = date.today().replace(day=1) - timedelta(days=1)
+        with SessionLocal() as db:
+            payroll.run_payroll(db, last_month.year, last_month.month)
+
+    scenarios = {
+        "login": lambda: measure(login, range(args.logins), args.concurrency),
+        "checkin": lambda: measure(check_in, dataset.emp_ids, args.concurrency),
+        "directory": lambda: measure(browse, range(len(dataset.emp_ids)), args.concurrency),
+        "approvals": lambda: measure(approve, dataset.manager_ids, args.concurrency),
+        "payroll": lambda: measure(run_payroll, range(1), 1),
+    }
+    results = {}
+    for name in args.scenarios:
+        results[name] = scenarios[name]()
+        print_result(name, results[name])
+    return results
+
+def print_result(name: str, result: dict) -> None:
+    print(
+        f"{name:<10} {result['operations']:>8} {result['throughput_per_s']:>10.1f} "
+        f"{result['p50_ms']:>10.1f} {result['p99_ms']:>10.1f} {result['sql_per_operation']:>8.1f}"
+    )
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results: dict, baseline_path: str) -> None:
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\nvs {baseline_path} ({baseline['meta'].get('commit')})")
+    print(f"{'scenario':<10} {'ops/s':>10} {'p50':>10} {'p99':>10} {'sql/op':>10}")
+    for name, result in results.items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+        changes = [
+            f"{(result[key] - before[key]) / before[key] * 100:>+9.1f}%" if before[key] else f"{'n/a':>10}"
+            for key in ("throughput_per_s", "p50_ms", "p99_ms", "sql_per_operation")
+        ]
+        print(f"{name:<10} {' '.join(changes)}")
+
+def main():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    start = time.perf_counter()
+    with SessionLocal() as db:
+        dataset = seed_dataset(db, args.employees, args.history_days, args.seed)
+    print(f"seeded {args.employees} employees in {time.perf_counter() - start:.1f}s "
+          f"({engine.dialect.name}, concurrency {args.concurrency})")
+
+    print(f"{'scenario':<10} {'ops':>8} {'ops/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'sql/op':>8}")
+    try:
+        results = run_scenarios(dataset)
+    finally:
+        shutdown_password_pool()
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "database": engine.dialect.name,
+            "python": platform.python_version(),
+            "employees": args.employees,
+            "history_days": args.history_days,
+            "seed": args.seed,
+            "concurrency": args.concurrency
+        },
+        "scenarios": results
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
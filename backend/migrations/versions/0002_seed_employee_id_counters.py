@@ -0,0 +1,50 @@
+"""seed employee id counters
+
+Backfills employee_id_counters from IDs issued before the counter table
+existed. Databases created by the old create_all() at startup should be
+stamped at 0000 and then upgraded, which runs this once.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 03:05:40.118215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SERIAL_DIGITS = 4
+
+employees = sa.table('employees', sa.column('emp_id', sa.String))
+employee_id_counters = sa.table(
+    'employee_id_counters',
+    sa.column('prefix', sa.String),
+    sa.column('last_serial', sa.Integer),
+)
+
+
+def upgrade() -> None:
+    emp_id = employees.c.emp_id
+    prefix = sa.func.substr(emp_id, 1, sa.func.length(emp_id) - SERIAL_DIGITS)
+    serial = sa.func.substr(emp_id, sa.func.length(emp_id) - SERIAL_DIGITS + 1)
+    op.execute(
+        employee_id_counters.insert().from_select(
+            ['prefix', 'last_serial'],
+            sa.select(prefix, sa.func.max(sa.cast(serial, sa.Integer)))
+            .where(prefix.not_in(sa.select(employee_id_counters.c.prefix)))
+            .group_by(prefix)
+        )
+    )
+
+
+def downgrade() -> None:
+    # Counters are the allocator's state; keep them
+    pass
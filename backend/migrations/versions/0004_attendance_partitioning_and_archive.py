@@ -0,0 +1,134 @@
+"""attendance partitioning and archive
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 03:16:48.195427
+
+"""
+from datetime import date
+from typing import Iterator, Sequence, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Monthly partitions created beyond today; app.services.attendance_storage keeps this up
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    "attendance_id, emp_id, attendance_date, check_in_time, check_out_time, work_hours, "
+    "extra_hours, status, is_paid, remarks, created_at, updated_at"
+)
+
+
+def _months(first: date, last: date) -> Iterator[Tuple[int, int]]:
+    year, month = first.year, first.month
+    while (year, month) <= (last.year, last.month):
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def _add_months(day: date, months: int) -> date:
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _restore_attendance_keys(table: str, primary_key: str) -> None:
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT attendance_pkey PRIMARY KEY ({primary_key})")
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT unique_emp_date UNIQUE (emp_id, attendance_date)")
+    op.execute(f"CREATE INDEX ix_attendance_date ON {table} (attendance_date)")
+    op.execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT attendance_emp_id_fkey "
+        "FOREIGN KEY (emp_id) REFERENCES employees (emp_id) ON DELETE CASCADE"
+    )
+
+
+def _partition_attendance() -> None:
+    """Rebuild attendance (PostgreSQL) as a table partitioned by month, keeping its rows and id sequence"""
+    bind = op.get_bind()
+    op.execute("ALTER TABLE attendance RENAME TO attendance_unpartitioned")
+    op.execute("ALTER TABLE attendance_unpartitioned RENAME CONSTRAINT attendance_pkey TO attendance_unpartitioned_pkey")
+    op.execute("ALTER TABLE attendance_unpartitioned RENAME CONSTRAINT unique_emp_date TO attendance_unpartitioned_emp_date")
+    op.execute("ALTER INDEX ix_attendance_date RENAME TO ix_attendance_unpartitioned_date")
+    op.execute(
+        "CREATE TABLE attendance (LIKE attendance_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        "PARTITION BY RANGE (attendance_date)"
+    )
+    # Unique keys of a partitioned table must include the partition key
+    _restore_attendance_keys("attendance", "attendance_id, attendance_date")
+    op.execute("CREATE TABLE attendance_default PARTITION OF attendance DEFAULT")
+
+    today = date.today()
+    first, last = bind.execute(sa.text("SELECT min(attendance_date), max(attendance_date) FROM attendance_unpartitioned")).one()
+    for year, month in _months(min(first or today, today), max(last or today, _add_months(today, MONTHS_AHEAD))):
+        start, end = date(year, month, 1), _add_months(date(year, month, 1), 1)
+        op.execute(
+            f"CREATE TABLE attendance_y{year}m{month:02d} PARTITION OF attendance "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+    op.execute(f"INSERT INTO attendance ({COLUMNS}) SELECT {COLUMNS} FROM attendance_unpartitioned")
+    sequence = bind.execute(sa.text("SELECT pg_get_serial_sequence('attendance_unpartitioned', 'attendance_id')")).scalar()
+    op.execute(f"ALTER SEQUENCE {sequence} OWNED BY attendance.attendance_id")
+    op.execute("DROP TABLE attendance_unpartitioned")
+
+
+def _unpartition_attendance() -> None:
+    """Inverse of _partition_attendance, folding archived rows back in"""
+    bind = op.get_bind()
+    op.execute("CREATE TABLE attendance_flat (LIKE attendance INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+    op.execute(f"INSERT INTO attendance_flat ({COLUMNS}) SELECT {COLUMNS} FROM attendance")
+    op.execute(f"INSERT INTO attendance_flat ({COLUMNS}) SELECT {COLUMNS} FROM attendance_archive")
+    sequence = bind.execute(sa.text("SELECT pg_get_serial_sequence('attendance', 'attendance_id')")).scalar()
+    op.execute(f"ALTER SEQUENCE {sequence} OWNED BY attendance_flat.attendance_id")
+    op.execute("DROP TABLE attendance")
+    op.execute("ALTER TABLE attendance_flat RENAME TO attendance")
+    _restore_attendance_keys("attendance", "attendance_id")
+
+
+def upgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table('attendance_archive',
+    sa.Column('attendance_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('emp_id', sa.String(length=20), nullable=False),
+    sa.Column('attendance_date', sa.Date(), nullable=False),
+    sa.Column('check_in_time', sa.Time(), nullable=True),
+    sa.Column('check_out_time', sa.Time(), nullable=True),
+    sa.Column('work_hours', sa.Numeric(precision=4, scale=2), nullable=True),
+    sa.Column('extra_hours', sa.Numeric(precision=4, scale=2), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('is_paid', sa.Boolean(), nullable=True),
+    sa.Column('remarks', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['emp_id'], ['employees.emp_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('attendance_id', 'attendance_date'),
+    postgresql_partition_by='RANGE (attendance_date)'
+    )
+    with op.batch_alter_table('attendance_archive', schema=None) as batch_op:
+        batch_op.create_index('ix_attendance_archive_emp_date', ['emp_id', 'attendance_date'], unique=False)
+
+    # ### end Alembic commands ###
+
+    if op.get_bind().dialect.name == "postgresql":
+        _partition_attendance()
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        _unpartition_attendance()
+    else:
+        op.execute(f"INSERT INTO attendance ({COLUMNS}) SELECT {COLUMNS} FROM attendance_archive")
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('attendance_archive', schema=None) as batch_op:
+        batch_op.drop_index('ix_attendance_archive_emp_date')
+
+    op.drop_table('attendance_archive')
+    # ### end Alembic commands ###
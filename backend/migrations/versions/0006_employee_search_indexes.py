@@ -0,0 +1,45 @@
+"""employee search indexes
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 03:25:32.136454
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Trigram indexes for GET /employees/search. Only PostgreSQL has them; other
+# databases are searched through the in-process index (app/core/search_index.py).
+EMPLOYEE_SEARCH_TEXT = (
+    "lower(coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || coalesce(email, '') || ' ' || "
+    "coalesce(department, '') || ' ' || coalesce(location, ''))"
+)
+PERSONAL_INFO_SEARCH_TEXT = "lower(coalesce(skills, '') || ' ' || coalesce(certifications, ''))"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(f"CREATE INDEX ix_employees_search ON employees USING gin ({EMPLOYEE_SEARCH_TEXT} gin_trgm_ops)")
+    op.execute(
+        f"CREATE INDEX ix_employee_personal_info_search ON employee_personal_info "
+        f"USING gin ({PERSONAL_INFO_SEARCH_TEXT} gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX ix_employee_personal_info_search")
+    op.execute("DROP INDEX ix_employees_search")